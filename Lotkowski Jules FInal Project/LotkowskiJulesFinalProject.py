@@ -4,31 +4,156 @@ Date written: 2/16/2024
 Assignment: Final Project
 This program is a GUI zodiac calculator. The user enters their date of birth, and then the program will return their western zodiac sign as well as their Chinese
 zodiac sign.
+The zodiac and date logic lives in zodiacengine.py, which can be used on its own without tkinter.
+Sign and animal names, image files, and descriptions are in zodiac.json (see zodiacregistry.py).
+Images are loaded from images.atlas when it is present. Run imageatlas.py to rebuild it after changing an image.
+The Import button adds signs to a whole CSV or JSONL file of birth dates in the background (see zodiacbatch.py).
 REQUIRES BREEZYPYTHONGUI! Make sure breezypythongui.py is installed in the same directory as your Python executable before use.
 """
 import tkinter as tk
 from tkinter import Grid
 from tkinter import PhotoImage
 from breezypythongui import EasyFrame
-from breezypythongui import MessageBox
 import os
+import imageatlas
+import zodiacengine
+import zodiacmessages
+from zodiactiming import PipelineTimer, NULL_TIMER
+from zodiacengine import InvalidDateException
+from zodiacengine import ZODIAC_SIGNS, ANIMALS
+from zodiacregistry import SIGN_RECORDS, ANIMAL_RECORDS
 
-class InvalidDateException(Exception):
-    # Raised when invalid date is given by user
-    pass
+BANNER_IMAGE = 'constellation.gif' # Image at the top of the main window
+RESULT_IMAGES = tuple(record.image for record in ANIMAL_RECORDS + SIGN_RECORDS) # Images shown with results
+
+TIMING_VARIABLE = 'ZODIAC_TIMING' # Set this environment variable to time each stage of a Calculate click
+TIMING_DUMP_KEY = '<Control-t>' # With timing on, prints the stage timings to stderr
+KIOSK_VARIABLE = 'ZODIAC_KIOSK' # Set this environment variable to run in kiosk mode
+
+IMAGE_FOLDER = os.path.dirname(__file__) # Folder holding the images and the atlas
+
+IMPORT_FILE_TYPES = (("CSV files", "*.csv"), ("JSON Lines files", "*.jsonl *.ndjson"), ("All files", "*"))
+IMPORT_SHARD_SIZE = 1024 * 1024 # Bytes of input per shard on import; small so progress updates often
+IMPORT_START_METHOD = "spawn" # Import workers start fresh instead of forking this process, which has threads and a Tcl interpreter
+IMPORT_WORKERS = max(1, (os.cpu_count() or 2) - 1) # Worker processes for an import, leaving a core for the window
+
+class ImageCache(object):
+    """Process-wide cache of decoded images, keyed by file name. Each image is decoded at most once, and every window that
+    shows it gets the same PhotoImage. Images come out of the in-memory atlas when there is one, otherwise from their own
+    files. Keeps hit and miss counts."""
+
+    def __init__(self, folder, atlas = None):
+        self.folder = folder # Folder the image files are in
+        self.atlas = atlas # ImageAtlas to slice images from, or None
+        self.images = {}
+        self.hits = 0
+        self.misses = 0
+
+    """Returns the PhotoImage for an image file name, decoding it on first use"""
+
+    def get(self, name):
+        image = self.images.get(name)
+        if image is None:
+            self.misses += 1
+            if (self.atlas is not None) and (name in self.atlas):
+                image = PhotoImage(data = self.atlas.data(name))
+            else:
+                image = PhotoImage(file = os.path.join(self.folder, name))
+            self.images[name] = image
+        else:
+            self.hits += 1
+        return image
+
+    """Returns a blank PhotoImage the same size as an image, or None if the size is not known without decoding it. Holds the
+    image's place in the layout until the real one is loaded."""
+
+    def placeholder(self, name):
+        if (self.atlas is None) or (name not in self.atlas):
+            return None
+        size = self.atlas.size(name)
+        if size is None:
+            return None
+        return PhotoImage(width = size[0], height = size[1])
+
+    """Decodes every result image (or the given names) ahead of time so no click has to wait on the disk"""
+
+    def warm(self, names = RESULT_IMAGES):
+        for name in names:
+            if name not in self.images:
+                self.get(name)
+
+    """Returns a dict of hit, miss, and cached image counts"""
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "cached": len(self.images)}
+
+    """Drops every cached image. Tk frees an image once no widget or variable holds it."""
+
+    def clear(self):
+        self.images.clear()
+
+    """Deletes every cached image from Tk right away, even if a widget still shows it, then drops them. For shutting down."""
+
+    def release(self):
+        for image in self.images.values():
+            try:
+                image.tk.call('image', 'delete', image.name)
+            except tk.TclError: # Its interpreter is already gone
+                pass
+        self.images.clear()
+
+imageCache = ImageCache(IMAGE_FOLDER, imageatlas.openAtlas(IMAGE_FOLDER)) # Shared by every window in the process
+
+"""Runs on a job runner thread: adds signs to every row of the source file and writes them to the destination, reporting
+progress as (bytes done, file size) after each shard. Removes the partial output if the import is cancelled or fails."""
+
+def importDates(job, source, destination, format):
+    import zodiacbatch # Imported here, not at the top, so numpy and multiprocessing do not slow down start-up
+    try:
+        with open(destination, "wb") as out:
+            zodiacbatch.processFile(source, out, format, workers = IMPORT_WORKERS, shardSize = IMPORT_SHARD_SIZE,
+                                    progress = job.progress, startMethod = IMPORT_START_METHOD)
+    except BaseException:
+        if os.path.exists(destination):
+            os.remove(destination)
+        raise
+    return destination
 
 """Main code for the calculator"""
 
 class ZodiacCalculator(EasyFrame):
-    """Initial formatting of the GUI"""
-    def __init__(self):
+    """Initial formatting of the GUI. If warmImages is True, the result images are decoded on idle once the banner is up. If
+    fastStart is True, the window is shown before the banner image is decoded, with a blank image holding its place, and the
+    banner is loaded after the window's first paint. If a PipelineTimer is given as timer, every Calculate click records the
+    time and outcome of each stage (parse, validate, chinese, western, results), and TIMING_DUMP_KEY prints them.
+
+    kiosk mode is for machines that run the calculator for weeks. Every window, widget, image, and Tcl variable it will ever
+    use is made at start-up and then only reused, so memory stays flat however many calculations are done: the results
+    window and an error window are built up front, every image is decoded, errors are shown in the reused error window instead
+    of a new dialog each time, and Back clears the entry fields for the next person.
+
+    Outside kiosk mode, the Import button runs a whole file of birth dates through zodiacbatch on a worker thread, which fans
+    the work out to a pool of processes. The window stays responsive; the button becomes Cancel and the label beside it shows
+    the progress until the import ends."""
+    def __init__(self, warmImages = False, fastStart = True, timer = None, kiosk = False):
         EasyFrame.__init__(self, title = 'Zodiac Calculator', background = "#d7c4de")
+        self.kiosk = kiosk
+        self.closed = False # Set by shutdown
+        self.master.protocol("WM_DELETE_WINDOW", self.close) # Closing the main window shuts down the same way as Exit
+        if kiosk:
+            warmImages = True
+        self.timer = timer or NULL_TIMER # Stage timing for checkInput
+        if timer is not None:
+            self.master.bind(TIMING_DUMP_KEY, lambda event: self.timer.dump())
         """Image handling"""
-        base_folder = os.path.dirname(__file__) # Variable for image access
-        image_path = os.path.join(base_folder, 'constellation.gif') # Variable for image access
-        self.starImage = PhotoImage(file=image_path) # Holds image for the main window
-        imageLabel = self.addLabel(text = '', row = 0, column = 0, sticky = 'NSEW', columnspan = 2, background = "#d7c4de") # Label for image
-        imageLabel["image"] = self.starImage
+        self.warmImages = warmImages # Decode the result images after the banner
+        self.starImage = imageCache.placeholder(BANNER_IMAGE) if fastStart else None # Holds image for the main window
+        self.imageLabel = self.addLabel(text = '', row = 0, column = 0, sticky = 'NSEW', columnspan = 2, background = "#d7c4de") # Label for image
+        if self.starImage is None:
+            self.loadBanner()
+        else:
+            self.imageLabel["image"] = self.starImage
+            self.bind("<Expose>", self.firstPaint)
         """Adding labels, integer fields, and buttons"""
         self.addLabel(text = "An image of a starry purple sky.", row = 1, column = 0, sticky = 'NSEW', columnspan = 2, background = "#d7c4de")
         self.addLabel(text = "Enter your birth date information to discover your zodiac signs:", row = 2, column = 0, sticky = "NSEW", columnspan = 2, background = "#d7c4de")
@@ -42,207 +167,222 @@ class ZodiacCalculator(EasyFrame):
         self.calculateButton["background"] = '#f2efb9'
         self.mainExitButton = self.addButton(text = "Exit", row = 6, column = 1, command = self.close) # Exit button
         self.mainExitButton["background"] = '#f2efb9'
+        self.importJob = None # Running import, if any
+        if not kiosk: # Kiosk machines have no files to import
+            self.importButton = self.addButton(text = 'Import...', row = 7, column = 0, command = self.importFile) # Import/Cancel button
+            self.importButton["background"] = '#f2efb9'
+            self.importStatus = self.addLabel(text = "", row = 7, column = 1, sticky = "W", background = "#d7c4de") # Import progress
+        self.top = None # Results window, built on the first calculation
+        self.errorWindow = None # Reused error window, kiosk mode only
+        if kiosk:
+            self.buildResultsWindow()
+            self.buildErrorWindow()
     
+    """Swaps the decoded banner image into its label, then warms the image cache on idle if asked to"""
+
+    def loadBanner(self):
+        self.starImage = imageCache.get(BANNER_IMAGE)
+        self.imageLabel["image"] = self.starImage
+        if self.warmImages:
+            self.after_idle(imageCache.warm)
+
+    """Runs when the window is first drawn. Loads the banner once the widgets have been painted."""
+
+    def firstPaint(self, event):
+        self.unbind("<Expose>")
+        self.after_idle(self.loadBanner)
+
     """Checks input for non-numerical and invalid data before calling the main logic functions"""
 
     def checkInput(self):
+        timer = self.timer
         """Ensures user input contains only integers"""
         try:
-            self.userMonthCalc = self.userMonth.getNumber() # Holds user month
-            self.userDayCalc = self.userDay.getNumber() # Holds user day
-            self.userYearCalc = self.userYear.getNumber() # Holds user year
+            with timer.stage("parse", ValueError):
+                self.userMonthCalc = self.userMonth.getNumber() # Holds user month
+                self.userDayCalc = self.userDay.getNumber() # Holds user day
+                self.userYearCalc = self.userYear.getNumber() # Holds user year
         except ValueError: # If any box is empty or does not contain a number, display error message
-            MessageBox(self, title = "Error!", message = "Make sure you have filled out all boxes and entered only numbers. Please try again.", width = 50, height = 10)
+            self.showError(zodiacengine.NOT_A_NUMBER_ERROR)
             return
         """Calls the date validation function to ensure a valid date was supplied"""
         try:
-            self.validateDate(self.userDayCalc, self.userMonthCalc, self.userYearCalc)
+            with timer.stage("validate", InvalidDateException):
+                self.validateDate(self.userDayCalc, self.userMonthCalc, self.userYearCalc)
         except InvalidDateException:
             return
         """Main zodiac calculation functions are called"""
         try:
-            self.calculateChineseZodiac(self.userYearCalc)
-            self.calculateWesternZodiac(self.userDayCalc, self.userMonthCalc)
+            with timer.stage("chinese"):
+                self.calculateChineseZodiac(self.userYearCalc, self.userMonthCalc, self.userDayCalc)
+            with timer.stage("western"):
+                self.calculateWesternZodiac(self.userDayCalc, self.userMonthCalc)
         except:
             return
         """Disable the calculate button until the back button is clicked on the result window"""
         self.calculateButton["state"] = "disabled"
         try: # Open results window
-            self.resultsWindow(self.zodiacAnimal, self.userSign)
+            with timer.stage("results"):
+                self.resultsWindow(self.zodiacAnimal, self.userSign)
         except:
             return
         return
     
-    """Validates the date. Takes user-supplied day, month, and year as parameters."""
+    """Validates the date. Takes user-supplied day, month, and year as parameters. Shows an error message if the date is invalid."""
 
     def validateDate(self, day, month, year):
-        self.thirtyOneDays = (1, 3, 5, 7, 8, 10, 12) # Months with 31 days
-        self.thirtyDays = (4, 6, 9, 11) # Months with 30 days
-
-        if year <= 0: # Ensures year is not negative
-            MessageBox(self, title = "Error!", message = "Year value cannot be negative or 0! Please try again.", width = 50, height = 10)
-            raise InvalidDateException
-        if (month < 1) or (month > 12): # Ensures month value is between 1 and 12
-            MessageBox(self, title = "Error!", message = "Month value must be between 1 and 12! Please try again.", width = 50, height = 10)
-            raise InvalidDateException
-        if day < 1: # Ensures day value is not less than 1
-            MessageBox(self, title = "Error!", message = "Day value cannot be less than 1! Please try again.", width = 50, height = 10)
-            raise InvalidDateException        
-        if (month in self.thirtyOneDays) and (day > 31): # If the month given is one with 31 days, allow values up to 31
-            MessageBox(self, title = "Error!", message = "Day value cannot exceed 31 for specified month! Please try again.", width = 50, height = 10)
-            raise InvalidDateException
-        if (month in self.thirtyDays) and (day > 30): # If the month given has 30 days, allow values up to 30
-            MessageBox(self, title = "Error!", message = "Day value cannot exceed 30 for specified month! Please try again.", width = 50, height = 10)
-            raise InvalidDateException
-        # Special checks for February. If year is not a leap year, allow a day value only up to 28. 29 if it is a leap year.
-        if (month == 2) and (year % 4 != 0) and (day > 28):
-            MessageBox(self, title = "Error!", message = "Day value cannot exceed 28 for specified month! Please try again.", width = 50, height = 10)
-            raise InvalidDateException
-        elif (month == 2) and (year % 4 == 0) and (day > 29):
-            MessageBox(self, title = "Error!", message = "Day value cannot exceed 29 for specified month! Please try again.", width = 50, height = 10)
-            raise InvalidDateException
-
-    """Function to determine the user's Chinese zodiac sign. Takes year as a parameter. Returns user's animal."""
-
-    def calculateChineseZodiac(self, year):
-        self.animals = ("Monkey", "Rooster", "Dog", "Pig", "Rat", "Ox", "Tiger", "Rabbit", "Dragon", "Snake", "Horse", "Goat") # Holds Chinese zodiac signs
-        self.zodiacAnimal = self.animals[year % 12] # Determines and stores the user's Chinese zodiac sign
+        error = zodiacengine.checkDate(day, month, year)
+        if error:
+            self.showError(error)
+            raise InvalidDateException(error)
+
+    """Shows a validation error to the user in a message box. Takes a ValidationError from zodiacengine."""
+
+    def showError(self, error):
+        title, message = zodiacmessages.guiMessage(error)
+        if self.errorWindow is not None:
+            self.errorWindow.title(title)
+            self.errorMessage.configure(text = message)
+            self.calculateButton["state"] = "disabled" # Until the error is closed
+            self.errorWindow.deiconify()
+            self.errorWindow.lift()
+            self.errorOkButton.focus_set()
+        else:
+            self.messageBox(title = title, message = message, width = 50, height = 10)
+
+    """Builds the kiosk error window, hidden. showError fills it in and shows it; closeError hides it again."""
+
+    def buildErrorWindow(self):
+        self.errorWindow = tk.Toplevel()
+        self.errorWindow.withdraw()
+        self.errorWindow.configure(background = "#d7c4de")
+        self.errorWindow.resizable(False, False)
+        self.errorWindow.protocol("WM_DELETE_WINDOW", self.closeError) # Closing the window hides it, same as OK
+        self.errorMessage = tk.Label(self.errorWindow, text = "", background = "#d7c4de", wraplength = 350, justify = "left")
+        self.errorOkButton = tk.Button(self.errorWindow, text = "OK", width = 10, command = self.closeError, background = '#f2efb9')
+        self.errorOkButton.bind("<Return>", lambda event: self.closeError())
+        self.errorMessage.grid(row = 0, column = 0, padx = 10, pady = 10)
+        self.errorOkButton.grid(row = 1, column = 0, padx = 5, pady = 5)
+
+    """Function for the OK button on the kiosk error window. Hides the window and enables the calculate button"""
+
+    def closeError(self):
+        self.errorWindow.withdraw()
+        self.calculateButton["state"] = "normal"
+        self.userMonth.focus_set()
+
+    """Function to determine the user's Chinese zodiac sign. Takes year, and optionally month and day, as parameters. Returns user's animal."""
+
+    def calculateChineseZodiac(self, year, month = None, day = None):
+        self.animalCode = zodiacengine.chineseAnimalCode(year, month, day) # Index of the user's animal in ANIMALS and ANIMAL_RECORDS
+        self.zodiacAnimal = ANIMALS[self.animalCode] # Determines and stores the user's Chinese zodiac sign
         return self.zodiacAnimal
     
     """Function to determine user's western zodiac sign. Takes day and month as parameters. Returns the user's zodiac sign."""
 
     def calculateWesternZodiac(self, day, month):
-        self.zodiacSigns = ("Capricorn", "Aquarius", "Pisces", "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra", "Scorpio", "Sagittarius") # Holds western zodiac signs
-        """Logic to determine user's western zodiac sign and store the result as a variable"""
-        if (month == 12) and (day >= 22):
-            self.userSign = self.zodiacSigns[0]
-            return self.userSign
-        elif (month == 12) and (day < 22):
-            self.userSign = self.zodiacSigns[11]
-            return self.userSign
-        if (month == 11) and (day >= 22):
-            self.userSign = self.zodiacSigns[11]
-            return self.userSign
-        elif (month == 11) and (day < 22):
-            self.userSign = self.zodiacSigns[10]
-            return self.userSign
-        if (month == 10) and (day >= 23):
-            self.userSign = self.zodiacSigns[10]
-            return self.userSign
-        elif (month == 10) and (day < 23):
-            self.userSign = self.zodiacSigns[9]
-            return self.userSign
-        if (month == 9) and (day >= 23):
-            self.userSign = self.zodiacSigns[9]
-            return self.userSign
-        elif (month == 9) and (day < 23):
-            self.userSign = self.zodiacSigns[8]
-            return self.userSign
-        if (month == 8) and (day >= 23):
-            self.userSign = self.zodiacSigns[8]
-            return self.userSign
-        elif (month == 8) and (day < 23):
-            self.userSign = self.zodiacSigns[7]
-            return self.userSign
-        if (month == 7) and (day >= 23):
-            self.userSign = self.zodiacSigns[7]
-            return self.userSign
-        elif (month == 7) and (day < 23):
-            self.userSign = self.zodiacSigns[6]
-            return self.userSign
-        if (month == 6) and (day >= 21):
-            self.userSign = self.zodiacSigns[6]
-            return self.userSign
-        elif (month == 6) and (day < 21):
-            self.userSign = self.zodiacSigns[5]
-            return self.userSign
-        if (month == 5) and (day >= 21):
-            self.userSign = self.zodiacSigns[5]
-            return self.userSign
-        elif (month == 5) and (day < 21):
-            self.userSign = self.zodiacSigns[4]
-            return self.userSign
-        if (month == 4) and (day >= 20):
-            self.userSign = self.zodiacSigns[4]
-            return self.userSign
-        elif (month == 4) and (day < 20):
-            self.userSign = self.zodiacSigns[3]
-            return self.userSign
-        if (month == 3) and (day >= 21):
-            self.userSign = self.zodiacSigns[3]
-            return self.userSign
-        elif (month == 3) and (day < 21):
-            self.userSign = self.zodiacSigns[2]
-            return self.userSign
-        if (month == 2) and (day >= 19):
-            self.userSign = self.zodiacSigns[2]
-            return self.userSign
-        elif (month == 2) and (day < 19):
-            self.userSign = self.zodiacSigns[1]
-            return self.userSign
-        if (month == 1) and (day >= 20):
-            self.userSign = self.zodiacSigns[1]
-            return self.userSign
-        elif (month == 1) and (day < 20):
-            self.userSign = self.zodiacSigns[0]
-            return self.userSign
-        
-
-    """Function for the exit button. Closes the program."""
+        self.signCode = zodiacengine.westernSignCode(day, month) # Index of the user's sign in ZODIAC_SIGNS and SIGN_RECORDS
+        self.userSign = ZODIAC_SIGNS[self.signCode] # Determines and stores the user's western zodiac sign
+        return self.userSign
+
+    """Function for the Import button. Asks for a CSV or JSONL file of birth dates and where to save the result, then runs the
+    import in the background. While an import runs, the button cancels it instead."""
+
+    def importFile(self):
+        if self.importJob is not None:
+            self.importJob.cancel()
+            self.importStatus["text"] = "Cancelling..."
+            return
+        from tkinter import filedialog # Imported on first use, like breezypythongui's dialogs, to keep start-up fast
+        import zodiacbatch
+        source = filedialog.askopenfilename(parent = self, title = "Import birth dates", filetypes = IMPORT_FILE_TYPES)
+        if not source:
+            return
+        format = zodiacbatch.guessFormat(source)
+        if format == "binary":
+            self.importStatus["text"] = "Import reads CSV or JSONL files."
+            return
+        name, extension = os.path.splitext(source)
+        destination = filedialog.asksaveasfilename(parent = self, title = "Save results as", defaultextension = extension,
+                                                   initialfile = os.path.basename(name) + "_zodiac" + extension)
+        if not destination:
+            return
+        self.importJob = self.runJob(importDates, (source, destination, format), self.importProgress, self.importDone)
+        self.importButton["text"] = "Cancel"
+        self.importStatus["text"] = "Importing..."
+
+    """Shows how far the running import has got. Takes bytes done and the file size."""
+
+    def importProgress(self, done, total):
+        if not self.importJob.isCancelled():
+            self.importStatus["text"] = "Importing... %d%%" % (done * 100 // max(total, 1))
+
+    """Runs when an import ends, however it ended. Puts the button back and shows the outcome."""
+
+    def importDone(self, job):
+        self.importJob = None
+        self.importButton["text"] = "Import..."
+        if job.state == "done":
+            self.importStatus["text"] = "Saved " + os.path.basename(job.result)
+        elif job.state == "cancelled":
+            self.importStatus["text"] = "Import cancelled."
+        else:
+            self.importStatus["text"] = "Import failed: " + str(job.error)
+
+    """Function for the exit buttons. Closes the program."""
 
     def close(self):
-        ZodiacCalculator().destroy()
-        quit()
+        self.shutdown()
+
+    """Shuts the calculator down in one pass: cancels any import and waits (a few seconds at most) for it to stop and remove its
+    partial output, cancels pending after() callbacks such as image warming, releases the cached images, and destroys the main
+    window, which ends mainloop. Safe to call more than once."""
+
+    def shutdown(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.stopJobs()
+        for callback in self.tk.splitlist(self.tk.call('after', 'info')):
+            self.after_cancel(callback)
+        imageCache.release()
+        self.master.destroy()
     
-    """Function for back button on results window. Closes results window and enables the calculate button"""
+    """Function for back button on results window. Hides results window and enables the calculate button"""
     def back(self):
         self.calculateButton["state"] = "normal"
-        self.top.destroy()
-
-    """Displays the results window, taking animal and sign as parameters"""
-    def resultsWindow(self, animal, sign):
-        """Variables for zodiac images, image descriptions, and short descriptions for zodiac meanings"""
-        self.animalImage = ''
-        self.zodiacImage = ''
-        self.animalImageDescriptionText = ''
-        self.zodiacImageDescriptionText = ''
-        self.animalDescriptionText = ''
-        self.zodiacDescriptionText = ''
+        self.top.withdraw()
+        if self.kiosk: # Ready for the next person
+            for field in (self.userMonth, self.userDay, self.userYear):
+                field.setValue("")
+            self.userMonth.focus_set()
 
+    """Builds the results window, hidden. It is only built once; every calculation after that reuses it."""
+    def buildResultsWindow(self):
         """Labels for results, create back and exit button"""
         self.top = tk.Toplevel()
+        self.top.withdraw()
         self.top.title("Results")
         self.top.configure(background = "#d7c4de")
+        self.top.protocol("WM_DELETE_WINDOW", self.back) # Closing the window hides it, same as the back button
         self.animalLabel = tk.Label(self.top, text = "You are year of the:", background = "#d7c4de", font = ('Arial', 9, 'bold')) # Labels Chinese zodiac result
-        self.animalResult = tk.Label(self.top, text = animal, background = "#d7c4de") # Displays Chinese zodiac result
+        self.animalResult = tk.Label(self.top, text = "", background = "#d7c4de") # Displays Chinese zodiac result
         self.zodiacLabel = tk.Label(self.top, text = "Your zodiac sign is:", background = "#d7c4de", font = ('Arial', 9, 'bold')) # Labels western zodiac result
-        self.zodiacResult = tk.Label(self.top, text = sign, background = "#d7c4de") # Displays western zodiac result
+        self.zodiacResult = tk.Label(self.top, text = "", background = "#d7c4de") # Displays western zodiac result
         self.backButton = tk.Button(self.top, text = "Back", command = self.back, background= '#f2efb9') # Back button
         self.exitButton = tk.Button(self.top, text = "Exit", command = self.close, background= '#f2efb9') # Close button
 
-        self.resultLogic() # Calls function for displaying result images and descriptions
-
-        """Labels for image and result descriptions. Text is determined by the resultLogic function"""
-        self.animalImageDescription = tk.Label(self.top, text = self.animalImageDescriptionText, background = "#d7c4de")
-        self.zodiacImageDescription = tk.Label(self.top, text = self.zodiacImageDescriptionText, background = "#d7c4de")
-        self.animalDescription = tk.Label(self.top, text = self.animalDescriptionText, background = "#d7c4de")
-        self.zodiacDescription = tk.Label(self.top, text = self.zodiacDescriptionText, background = "#d7c4de")
-
-        """Image handling"""
-        animalBaseFolder = os.path.dirname(__file__) # Variable for image access
-        animalImagePath = os.path.join(animalBaseFolder, self.animalImage) # Variable for image access
-        self.animalImageDisplay = PhotoImage(file=animalImagePath) # Holds image for the main window
-        animalImageLabel = tk.Label(self.top, text = "", background = "#d7c4de")
-        animalImageLabel["image"] = self.animalImageDisplay
-        zodiacBaseFolder = os.path.dirname(__file__) # Variable for image access
-        zodiacImagePath = os.path.join(zodiacBaseFolder, self.zodiacImage) # Variable for image access
-        self.zodiacImageDisplay = PhotoImage(file=zodiacImagePath) # Holds image for the main window
-        zodiacImageLabel = tk.Label(self.top, text = "", background = "#d7c4de")
-        zodiacImageLabel["image"] = self.zodiacImageDisplay
+        """Labels for images and result descriptions. Filled in by resultsWindow"""
+        self.animalImageDescription = tk.Label(self.top, text = "", background = "#d7c4de")
+        self.zodiacImageDescription = tk.Label(self.top, text = "", background = "#d7c4de")
+        self.animalDescription = tk.Label(self.top, text = "", background = "#d7c4de")
+        self.zodiacDescription = tk.Label(self.top, text = "", background = "#d7c4de")
+        self.animalImageLabel = tk.Label(self.top, text = "", background = "#d7c4de")
+        self.zodiacImageLabel = tk.Label(self.top, text = "", background = "#d7c4de")
 
         """Formatting"""
-        zodiacImageLabel.grid(row = 0, column = 1, padx = 5, pady = 5)
-        animalImageLabel.grid(row = 0, column = 0, padx = 5, pady = 5)
+        self.zodiacImageLabel.grid(row = 0, column = 1, padx = 5, pady = 5)
+        self.animalImageLabel.grid(row = 0, column = 0, padx = 5, pady = 5)
         self.animalImageDescription.grid(row = 1, column = 0, padx = 5)
         self.zodiacImageDescription.grid(row = 1, column = 1, padx = 5)
         self.animalLabel.grid(row = 2, column = 0, padx = 5, pady = 5, sticky = "E")
@@ -254,113 +394,45 @@ class ZodiacCalculator(EasyFrame):
         self.backButton.grid(row = 6, column = 0, padx = 5, pady = 5)
         self.exitButton.grid(row = 6, column = 1, padx = 5, pady = 5)
 
-    """Sets images, image descriptions, and result descriptions depending on animal and sign"""
+    """Displays the results window, taking animal and sign as parameters. Builds the window the first time; after that only
+    the text and images change."""
+    def resultsWindow(self, animal, sign):
+        if self.top is None:
+            self.buildResultsWindow()
+
+        self.resultLogic() # Picks the records holding the result images and descriptions
+        animalRecord = self.animalRecord
+        signRecord = self.signRecord
+
+        """Image handling"""
+        self.animalImageDisplay = imageCache.get(animalRecord.image) # Holds image for the results window
+        self.zodiacImageDisplay = imageCache.get(signRecord.image) # Holds image for the results window
+
+        """One configure call per label that changes"""
+        self.animalResult.configure(text = animal)
+        self.zodiacResult.configure(text = sign)
+        self.animalImageLabel.configure(image = self.animalImageDisplay)
+        self.zodiacImageLabel.configure(image = self.zodiacImageDisplay)
+        self.animalImageDescription.configure(text = animalRecord.altText)
+        self.zodiacImageDescription.configure(text = signRecord.altText)
+        self.animalDescription.configure(text = animalRecord.description)
+        self.zodiacDescription.configure(text = signRecord.description)
+        self.top.deiconify()
+        self.top.lift() # Keeps the reused window in front of the main window
+        self.top.focus_set()
+
+    """Looks up the registry records for the user's animal and sign. They hold the images, image descriptions, and result
+    descriptions."""
     def resultLogic(self):
-        """Determines Chinese zodiac image and descriptions"""
-        if self.zodiacAnimal == "Monkey":
-            self.animalImage = 'monkey.png'
-            self.animalImageDescriptionText = "An image of a monkey."
-            self.animalDescriptionText = "You are creative, quick-witted, and clever!"
-        if self.zodiacAnimal == "Rooster":
-            self.animalImage = 'rooster.png'
-            self.animalImageDescriptionText = "An image of a rooster."
-            self.animalDescriptionText = "You are confident and assertive!"
-        if self.zodiacAnimal == "Dog":
-            self.animalImage = 'dog.png'
-            self.animalImageDescriptionText = "An image of a dog."
-            self.animalDescriptionText = "You are a reliable and loyal friend!"
-        if self.zodiacAnimal == "Pig":
-            self.animalImage = 'pig.png'
-            self.animalImageDescriptionText = "An image of a pig."
-            self.animalDescriptionText = "You are laid-back and honest!"
-        if self.zodiacAnimal == "Rat":
-            self.animalImage = 'rat.png'
-            self.animalImageDescriptionText = "An image of a rat."
-            self.animalDescriptionText = "You are highly social and witty!"
-        if self.zodiacAnimal == "Ox":
-            self.animalImage = 'ox.png'
-            self.animalImageDescriptionText = "An image of an ox."
-            self.animalDescriptionText = "You are hard-working and value practicality!"
-        if self.zodiacAnimal == "Tiger":
-            self.animalImage = 'tiger.png'
-            self.animalImageDescriptionText = "An image of a tiger."
-            self.animalDescriptionText = "You are a confident and courageous leader!"
-        if self.zodiacAnimal == "Rabbit":
-            self.animalImage = 'rabbit.png'
-            self.animalImageDescriptionText = "An image of a rabbit."
-            self.animalDescriptionText = "You are peaceful and have an eye for detail!"
-        if self.zodiacAnimal == "Dragon":
-            self.animalImage = 'dragon.png'
-            self.animalImageDescriptionText = "An image of a dragon."
-            self.animalDescriptionText = "You radiate intelligence and power!"
-        if self.zodiacAnimal == "Snake":
-            self.animalImage = 'snake.png'
-            self.animalImageDescriptionText = "An image of a snake."
-            self.animalDescriptionText = "You are humorous and persuasive!"
-        if self.zodiacAnimal == "Horse":
-            self.animalImage = 'horse.png'
-            self.animalImageDescriptionText = "An image of a horse."
-            self.animalDescriptionText = "You are energetic and positive!"
-        if self.zodiacAnimal == "Goat":
-            self.animalImage = 'goat.png'
-            self.animalImageDescriptionText = "An image of a goat."
-            self.animalDescriptionText = "You are gentle and compassionate!"
-
-        """Determines western zodiac image and descriptions"""
-        if self.userSign == "Capricorn":
-            self.zodiacImage = 'capricorn.png'
-            self.zodiacImageDescriptionText = "The Capricorn symbol."
-            self.zodiacDescriptionText = "You are determined and hard-working!"
-        if self.userSign == "Aquarius":
-            self.zodiacImage = 'aquarius.png'
-            self.zodiacImageDescriptionText = "The Aquarius symbol."
-            self.zodiacDescriptionText = "You are analytical and love problem-solving!"
-        if self.userSign == "Pisces":
-            self.zodiacImage = 'pisces.png'
-            self.zodiacImageDescriptionText = "The Pisces symbol."
-            self.zodiacDescriptionText = "You have a strong sense of empathy and romance!"
-        if self.userSign == "Aries":
-            self.zodiacImage = 'aries.png'
-            self.zodiacImageDescriptionText = "The Aries symbol."
-            self.zodiacDescriptionText = "You are strongly motivated and competitve!"
-        if self.userSign == "Taurus":
-            self.zodiacImage = 'taurus.png'
-            self.zodiacImageDescriptionText = "The Taurus symbol."
-            self.zodiacDescriptionText = "You are a stubborn yet diligent hard-worker!"
-        if self.userSign == "Gemini":
-            self.zodiacImage = 'gemini.png'
-            self.zodiacImageDescriptionText = "The Gemini symbol."
-            self.zodiacDescriptionText = "You are unpredictable and clever!"
-        if self.userSign == "Cancer":
-            self.zodiacImage = 'cancer.png'
-            self.zodiacImageDescriptionText = "The Cancer symbol."
-            self.zodiacDescriptionText = "You are nurturing and empathetic!"
-        if self.userSign == "Leo":
-            self.zodiacImage = 'leo.png'
-            self.zodiacImageDescriptionText = "The Leo symbol."
-            self.zodiacDescriptionText = "You are a born leader and love being the center of attention!"
-        if self.userSign == "Virgo":
-            self.zodiacImage = 'virgo.png'
-            self.zodiacImageDescriptionText = "The Virgo symbol."
-            self.zodiacDescriptionText = "You are logical and a perfectionist!"
-        if self.userSign == "Libra":
-            self.zodiacImage = 'libra.png'
-            self.zodiacImageDescriptionText = "The Libra symbol."
-            self.zodiacDescriptionText = "You are sociable and seek harmony in your life!"
-        if self.userSign == "Scorpio":
-            self.zodiacImage = 'scorpio.png'
-            self.zodiacImageDescriptionText = "The Scorpio symbol."
-            self.zodiacDescriptionText = "You are independent and intense!"
-        if self.userSign == "Sagittarius":
-            self.zodiacImage = 'sagittarius.png'
-            self.zodiacImageDescriptionText = "The Sagittarius symbol."
-            self.zodiacDescriptionText = "You are charming and bold!"
+        self.animalRecord = ANIMAL_RECORDS[self.animalCode]
+        self.signRecord = SIGN_RECORDS[self.signCode]
 
 
 
 
 
 def main():
-    ZodiacCalculator().mainloop()
+    timer = PipelineTimer() if os.environ.get(TIMING_VARIABLE) else None
+    ZodiacCalculator(timer = timer, kiosk = bool(os.environ.get(KIOSK_VARIABLE))).mainloop()
 if __name__ == "__main__":
     main()
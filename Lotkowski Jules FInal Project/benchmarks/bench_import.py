@@ -0,0 +1,105 @@
+"""
+File: bench_import.py
+Measures how responsive the window stays while a large file is imported. Writes a CSV file of random birth dates (1M rows by
+default) and imports it twice with the main window withdrawn: first the blocking way, calling zodiacbatch.processFile on the
+Tk thread, then through the calculator's job runner as the Import button does. A 10 ms after() tick runs throughout, and the
+report gives how late the ticks were (the time the event loop was stuck) along with the import time. Needs a display (on a
+headless machine, run it under xvfb-run).
+Run from the project folder or the benchmarks folder: python benchmarks/bench_import.py [rows]
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the benchmark import the calculator
+import zodiacbatch
+from LotkowskiJulesFinalProject import ZodiacCalculator, importDates, IMPORT_SHARD_SIZE, IMPORT_WORKERS, IMPORT_START_METHOD
+from bench_workers import writeSampleFile
+
+ROWS = 1000000
+TICK_MS = 10
+
+class TickMonitor(object):
+    """Runs an after() tick every TICK_MS and records how late each one fires, in seconds"""
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.lateness = []
+        self.running = False
+
+    def start(self):
+        self.running = True
+        self.expected = time.perf_counter() + TICK_MS / 1000
+        self.widget.after(TICK_MS, self.tick)
+
+    def tick(self):
+        now = time.perf_counter()
+        self.lateness.append(max(0.0, now - self.expected))
+        if self.running:
+            self.expected = now + TICK_MS / 1000
+            self.widget.after(TICK_MS, self.tick)
+
+"""Returns (seconds, median lateness, worst lateness) for an import run on the Tk thread"""
+
+def blockingImport(calculator, source, destination):
+    monitor = TickMonitor(calculator)
+    result = {}
+
+    def run():
+        start = time.perf_counter()
+        with open(destination, "wb") as out:
+            zodiacbatch.processFile(source, out, workers = IMPORT_WORKERS, shardSize = IMPORT_SHARD_SIZE,
+                                    startMethod = IMPORT_START_METHOD)
+        result["seconds"] = time.perf_counter() - start
+        calculator.after(TICK_MS * 5, calculator.quit) # Lets the tick that was held up fire
+
+    monitor.start()
+    calculator.after(TICK_MS * 5, run)
+    calculator.mainloop()
+    monitor.running = False
+    return result["seconds"], statistics.median(monitor.lateness), max(monitor.lateness)
+
+"""Returns (seconds, median lateness, worst lateness) for an import run through the job runner"""
+
+def backgroundImport(calculator, source, destination):
+    monitor = TickMonitor(calculator)
+    result = {}
+
+    def done(job):
+        result["seconds"] = time.perf_counter() - result["start"]
+        if job.state != "done":
+            result["error"] = job.error
+        calculator.quit()
+
+    def run():
+        result["start"] = time.perf_counter()
+        calculator.runJob(importDates, (source, destination, "csv"), onDone = done)
+
+    monitor.start()
+    calculator.after(TICK_MS * 5, run)
+    calculator.mainloop()
+    monitor.running = False
+    if "error" in result:
+        raise RuntimeError("Import failed: %r" % result["error"])
+    return result["seconds"], statistics.median(monitor.lateness), max(monitor.lateness)
+
+def main(rows = ROWS):
+    calculator = ZodiacCalculator()
+    calculator.master.withdraw()
+    source = writeSampleFile(rows)
+    destination = source + ".out"
+    try:
+        print("Importing %d rows with %d worker processes, %d ms tick" % (rows, IMPORT_WORKERS, TICK_MS))
+        for label, run in (("On the Tk thread", blockingImport), ("Job runner", backgroundImport)):
+            seconds, median, worst = run(calculator, source, destination)
+            print("  %-17s %6.2f s   tick late by median %7.1f ms, worst %7.1f ms" % (label, seconds, median * 1000,
+                                                                                  worst * 1000))
+    finally:
+        calculator.shutdown()
+        for path in (source, destination):
+            if os.path.exists(path):
+                os.remove(path)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else ROWS)
@@ -0,0 +1,95 @@
+"""
+File: bench_results_window.py
+Benchmark for showing and hiding the results window. Compares the original approach, which builds a new Toplevel with all
+its labels and buttons on every calculation and destroys it on Back, against the current one, which builds the window once and
+then only changes label text and images and shows or hides it. Runs the same cycle of dates through both, with the main
+window withdrawn. Needs a display (on a headless machine, run it under xvfb-run).
+Run from the project folder or the benchmarks folder: python benchmarks/bench_results_window.py [cycles]
+"""
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the benchmark import the calculator
+from LotkowskiJulesFinalProject import ZodiacCalculator, imageCache
+from zodiacengine import ZODIAC_SIGNS, ANIMALS
+
+CYCLES = 10000
+
+class LegacyCalculator(ZodiacCalculator):
+    """The original results window, kept here as the baseline. Builds everything on each call and destroys it on Back."""
+
+    def back(self):
+        self.calculateButton["state"] = "normal"
+        self.top.destroy()
+
+    def resultsWindow(self, animal, sign):
+        self.top = tk.Toplevel()
+        self.top.title("Results")
+        self.top.configure(background = "#d7c4de")
+        animalLabel = tk.Label(self.top, text = "You are year of the:", background = "#d7c4de", font = ('Arial', 9, 'bold'))
+        animalResult = tk.Label(self.top, text = animal, background = "#d7c4de")
+        zodiacLabel = tk.Label(self.top, text = "Your zodiac sign is:", background = "#d7c4de", font = ('Arial', 9, 'bold'))
+        zodiacResult = tk.Label(self.top, text = sign, background = "#d7c4de")
+        backButton = tk.Button(self.top, text = "Back", command = self.back, background= '#f2efb9')
+        exitButton = tk.Button(self.top, text = "Exit", command = self.close, background= '#f2efb9')
+        self.resultLogic()
+        animalImageDescription = tk.Label(self.top, text = self.animalRecord.altText, background = "#d7c4de")
+        zodiacImageDescription = tk.Label(self.top, text = self.signRecord.altText, background = "#d7c4de")
+        animalDescription = tk.Label(self.top, text = self.animalRecord.description, background = "#d7c4de")
+        zodiacDescription = tk.Label(self.top, text = self.signRecord.description, background = "#d7c4de")
+        self.animalImageDisplay = imageCache.get(self.animalRecord.image)
+        animalImageLabel = tk.Label(self.top, text = "", background = "#d7c4de", image = self.animalImageDisplay)
+        self.zodiacImageDisplay = imageCache.get(self.signRecord.image)
+        zodiacImageLabel = tk.Label(self.top, text = "", background = "#d7c4de", image = self.zodiacImageDisplay)
+        zodiacImageLabel.grid(row = 0, column = 1, padx = 5, pady = 5)
+        animalImageLabel.grid(row = 0, column = 0, padx = 5, pady = 5)
+        animalImageDescription.grid(row = 1, column = 0, padx = 5)
+        zodiacImageDescription.grid(row = 1, column = 1, padx = 5)
+        animalLabel.grid(row = 2, column = 0, padx = 5, pady = 5, sticky = "E")
+        animalResult.grid(row = 2, column = 1, padx = 5, pady = 5, sticky = "W")
+        animalDescription.grid(row = 3, columnspan = 2)
+        zodiacLabel.grid(row = 4, column = 0, padx = 5, pady = 5, sticky = "E")
+        zodiacResult.grid(row = 4, column = 1, padx = 5, pady = 5, sticky = "W")
+        zodiacDescription.grid(row = 5, columnspan = 2)
+        backButton.grid(row = 6, column = 0, padx = 5, pady = 5)
+        exitButton.grid(row = 6, column = 1, padx = 5, pady = 5)
+
+"""Shows and hides the results window cycles times, with a different result each time. Returns seconds per cycle."""
+
+def runCycles(calculator, cycles):
+    start = time.perf_counter()
+    for i in range(cycles):
+        calculator.animalCode = i % len(ANIMALS)
+        calculator.signCode = (i // len(ANIMALS)) % len(ZODIAC_SIGNS)
+        calculator.zodiacAnimal = ANIMALS[calculator.animalCode]
+        calculator.userSign = ZODIAC_SIGNS[calculator.signCode]
+        calculator.resultsWindow(calculator.zodiacAnimal, calculator.userSign)
+        calculator.update_idletasks() # Lays the window out, as the event loop would before drawing it
+        calculator.back()
+        calculator.update_idletasks()
+    return (time.perf_counter() - start) / cycles
+
+"""Times one calculator class in its own Tk root"""
+
+def timeCalculator(calculatorClass, cycles):
+    calculator = calculatorClass()
+    calculator.master.withdraw()
+    imageCache.warm() # Image decoding is the same for both, so keep it out of the timing
+    runCycles(calculator, 10) # Warm-up
+    perCycle = runCycles(calculator, cycles)
+    calculator.master.destroy()
+    imageCache.clear() # The images belong to the root that was just destroyed
+    return perCycle
+
+def main(cycles = CYCLES):
+    legacy = timeCalculator(LegacyCalculator, cycles)
+    reused = timeCalculator(ZodiacCalculator, cycles)
+    print("Cycles:              %d" % cycles)
+    print("Destroy/recreate:    %.1f us/cycle" % (legacy * 1e6))
+    print("Reuse one window:    %.1f us/cycle" % (reused * 1e6))
+    print("Speedup:             %.2fx" % (legacy / reused))
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else CYCLES)
@@ -0,0 +1,67 @@
+"""
+File: bench_service.py
+Load benchmark for zodiacservice. Starts the service in its own process, opens keep-alive connections to it, and sends
+GET /sign requests for a few seconds, one outstanding request per connection. Reports requests per second, and requests per second of
+service CPU time, which is what one dedicated core could serve when the client is not competing with it.
+Run from the project folder or the benchmarks folder: python benchmarks/bench_service.py [connections] [seconds]
+"""
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import time
+
+PROJECT_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PORT = 8765
+
+"""Keeps one connection busy until the deadline. Returns the number of responses received."""
+
+async def client(deadline, index):
+    reader, writer = await asyncio.open_connection("127.0.0.1", PORT)
+    count = 0
+    while time.perf_counter() < deadline:
+        month, day, year = count % 12 + 1, index % 28 + 1, 1950 + count % 70
+        writer.write(b"GET /sign?month=%d&day=%d&year=%d HTTP/1.1\r\nHost: localhost\r\n\r\n" % (month, day, year))
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+        await reader.readexactly(length)
+        count += 1
+    writer.close()
+    return count
+
+async def run(connections, seconds):
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    counts = await asyncio.gather(*(client(deadline, i) for i in range(connections)))
+    return sum(counts), time.perf_counter() - start
+
+"""Waits until the service accepts connections"""
+
+def waitForService(timeout = 10):
+    end = time.time() + timeout
+    while time.time() < end:
+        try:
+            asyncio.run(asyncio.wait_for(asyncio.open_connection("127.0.0.1", PORT), 1))
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("Service did not start")
+
+def main(connections = 32, seconds = 5):
+    service = subprocess.Popen([sys.executable, os.path.join(PROJECT_FOLDER, "zodiacservice.py"), "--port", str(PORT)],
+                               stdout = subprocess.DEVNULL)
+    try:
+        waitForService()
+        before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        requests, elapsed = asyncio.run(run(connections, seconds))
+    finally:
+        service.terminate()
+        service.wait()
+    after = resource.getrusage(resource.RUSAGE_CHILDREN) # Includes the service's start-up, so slightly pessimistic
+    serviceCpu = (after.ru_utime + after.ru_stime) - (before.ru_utime + before.ru_stime)
+    print("%d keep-alive connections for %ds: %.0f requests/s" % (connections, seconds, requests / elapsed))
+    print("Service CPU time: %.2fs, %.0f requests per CPU second" % (serviceCpu, requests / serviceCpu))
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
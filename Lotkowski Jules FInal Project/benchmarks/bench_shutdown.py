@@ -0,0 +1,89 @@
+"""
+File: bench_shutdown.py
+Measures exit latency: the time from pressing Exit to the process being gone, which is what a supervisor restarting the
+calculator sees. Each run starts the calculator in a fresh process, does one calculation, waits until the window is up, then
+presses Exit. Compares shutdown() against the original close(), which built a second calculator only to destroy it and then
+called quit(). Checks that every run exits with status 0, that the median shutdown() exit is faster than the original close(),
+and that it is within EXIT_BUDGET; exits with status 1 if not. Needs a display (on a headless machine, run it under xvfb-run).
+Run from the project folder or the benchmarks folder: python benchmarks/bench_shutdown.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 10
+EXIT_BUDGET = 0.5 # Seconds the median shutdown() exit may take, from pressing Exit to the process being gone
+
+"""Child process: starts the calculator, shows one result, prints the time, and presses Exit"""
+
+def exitChild(legacy):
+    sys.path.insert(0, PROJECT_FOLDER)
+    from LotkowskiJulesFinalProject import ZodiacCalculator
+
+    class LegacyCalculator(ZodiacCalculator):
+        """The original close(), kept here as the baseline"""
+
+        def close(self):
+            ZodiacCalculator(fastStart = False).destroy()
+            quit()
+
+    calculator = (LegacyCalculator if legacy else ZodiacCalculator)(warmImages = True)
+
+    def pressExit():
+        calculator.back()
+        calculator.update()
+        print(time.time(), flush = True) # Wall clock, so the parent can compare it with its own
+        calculator.exitButton.invoke()
+
+    def showResult():
+        calculator.userMonth.setValue("5")
+        calculator.userDay.setValue("5")
+        calculator.userYear.setValue("1990")
+        calculator.checkInput()
+        calculator.after(200, pressExit) # Lets the window and image warming settle, as in real use
+
+    calculator.after(200, showResult)
+    calculator.mainloop()
+
+"""Runs one child. Returns seconds from Exit being pressed to the process having exited."""
+
+def timeExit(legacy):
+    child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--exit", "legacy" if legacy else "shutdown"],
+                             stdout = subprocess.PIPE, stderr = subprocess.PIPE, universal_newlines = True)
+    pressed = child.stdout.readline()
+    child.wait()
+    exited = time.time()
+    if child.returncode != 0 or not pressed:
+        raise RuntimeError("Calculator did not exit cleanly (status %s):\n%s" % (child.returncode, child.stderr.read()))
+    return exited - float(pressed)
+
+def main(runs = RUNS):
+    try:
+        results = {legacy: [timeExit(legacy) for run in range(runs)] for legacy in (True, False)}
+    except RuntimeError as e:
+        print(e)
+        return 1
+    print("Exit latency, median of %d runs:" % runs)
+    for legacy, label in ((True, "Original close()"), (False, "shutdown()")):
+        times = results[legacy]
+        print("  %-18s %7.1f ms  (max %.1f ms)" % (label, statistics.median(times) * 1000, max(times) * 1000))
+    legacy, current = statistics.median(results[True]), statistics.median(results[False])
+    problems = []
+    if current >= legacy:
+        problems.append("shutdown() is not faster than the original close()")
+    if current > EXIT_BUDGET:
+        problems.append("shutdown() took %.1f ms, over the %.0f ms budget" % (current * 1000, EXIT_BUDGET * 1000))
+    if problems:
+        print("FAIL: " + "; ".join(problems))
+        return 1
+    print("PASS: shutdown() exits faster than the original close() and within budget")
+    return 0
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--exit":
+        exitChild(sys.argv[2] == "legacy")
+    else:
+        sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else RUNS))
@@ -0,0 +1,105 @@
+"""
+File: bench_startup.py
+Cold-start benchmark for the calculator. Runs each measurement in a fresh Python process, the way a kiosk starts the app.
+
+Import time: runs python -X importtime on the calculator module and reports the cumulative import time of the modules that
+matter, and whether tkinter.simpledialog, tkinter.ttk, zodiacbatch, and numpy were loaded (they should not be until a dialog or
+combo box is used or a file is imported).
+
+Time to first paint: starts the calculator in a child process and times, from launching the process, the first Expose event
+on the main window and the moment the banner image is showing. Compares fastStart on and off. Needs a display (on a headless
+machine, run it under xvfb-run); the import part runs anywhere.
+Run from the project folder or the benchmarks folder: python benchmarks/bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+REPORTED_MODULES = ("LotkowskiJulesFinalProject", "breezypythongui", "tkinter", "imageatlas", "zodiacengine",
+                    "tkinter.simpledialog", "tkinter.ttk", "zodiacbatch", "numpy")
+
+"""Runs one import of the calculator under -X importtime. Returns a dict of module name to cumulative microseconds."""
+
+def importTimes():
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import LotkowskiJulesFinalProject"],
+                            cwd = PROJECT_FOLDER, stderr = subprocess.PIPE, universal_newlines = True, check = True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+"""Child process: starts the calculator and prints a line when the window is first painted and when the banner shows"""
+
+def paintChild(fastStart):
+    sys.path.insert(0, PROJECT_FOLDER)
+    from LotkowskiJulesFinalProject import ZodiacCalculator
+    calculator = ZodiacCalculator(fastStart = fastStart)
+    root = calculator.master
+
+    def bannerLoaded():
+        print("banner", flush = True)
+        root.after_idle(root.destroy)
+
+    def painted(event):
+        root.unbind("<Expose>")
+        print("painted", flush = True)
+        if not fastStart: # The banner was decoded before the window was shown
+            bannerLoaded()
+
+    if fastStart:
+        loadBanner = calculator.loadBanner
+        def timedLoadBanner():
+            loadBanner()
+            calculator.update_idletasks() # Draws the banner before the time is taken
+            bannerLoaded()
+        calculator.loadBanner = timedLoadBanner
+    root.bind("<Expose>", painted) # The main window is in every widget's bind tags, so this sees the first Expose of any of them
+    root.mainloop()
+
+"""Launches one child process. Returns (seconds to first paint, seconds to banner) measured from the launch."""
+
+def timePaint(fastStart):
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--paint", "fast" if fastStart else "full"],
+                             stdout = subprocess.PIPE, stderr = subprocess.PIPE, universal_newlines = True)
+    times = {}
+    for line in child.stdout:
+        times[line.strip()] = time.perf_counter() - start
+    child.wait()
+    if child.returncode or len(times) != 2:
+        raise RuntimeError("Calculator did not start:\n" + child.stderr.read())
+    return times["painted"], times["banner"]
+
+def main(runs = RUNS):
+    samples = [importTimes() for run in range(runs)]
+    print("Import time, cumulative (median of %d runs):" % runs)
+    for name in REPORTED_MODULES:
+        values = [times[name] for times in samples if name in times]
+        if values:
+            print("  %-28s %8.1f ms" % (name, statistics.median(values) / 1000))
+        else:
+            print("  %-28s not imported" % name)
+    try:
+        results = {fastStart: [timePaint(fastStart) for run in range(runs)] for fastStart in (False, True)}
+    except RuntimeError as e:
+        print("Skipping time to first paint. " + str(e))
+        return
+    print("Time from launch (median of %d runs):" % runs)
+    for fastStart, label in ((False, "Banner first"), (True, "Fast start")):
+        paint = statistics.median(times[0] for times in results[fastStart])
+        banner = statistics.median(times[1] for times in results[fastStart])
+        print("  %-14s first paint %7.1f ms, banner %7.1f ms" % (label, paint * 1000, banner * 1000))
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--paint":
+        paintChild(sys.argv[2] == "fast")
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else RUNS)
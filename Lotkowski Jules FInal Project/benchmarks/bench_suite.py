@@ -0,0 +1,222 @@
+"""
+File: bench_suite.py
+Benchmark suite for the calculator's hot paths. Writes every result to a JSON file so runs can be compared, and can print the
+change against an earlier file.
+
+Groups:
+  engine      Per-call latency of each zodiacengine function, timed with timeit (best of several repeats).
+  gui         Per-call latency of the ZodiacCalculator methods that only do logic (checks, lookups, resultLogic).
+  exhaustive  Validation plus sign and animal lookup for every real date from 1900 through 2099, through the engine and through
+              the GUI methods.
+  tk          Widget construction and updates for the results window, with the main window withdrawn. Needs a display (on a
+              headless machine, run under xvfb-run); skipped otherwise.
+
+Run from the project folder or the benchmarks folder:
+  python benchmarks/bench_suite.py [--output FILE] [--compare OLD_FILE] [--groups engine,gui,...] [--quick]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from datetime import date, datetime, timedelta
+
+PROJECT_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_FOLDER) # Lets the benchmark import the calculator
+import zodiacengine
+from zodiacengine import ZODIAC_SIGNS, ANIMALS
+
+GROUPS = ("engine", "gui", "exhaustive", "tk")
+DEFAULT_OUTPUT = "bench_results.json"
+FIRST_YEAR = 1900
+LAST_YEAR = 2099 # 200 years, both ends included
+REPEAT = 5
+
+"""Returns the best time per call in nanoseconds for a no-argument function"""
+
+def nsPerCall(function, number, repeat = REPEAT):
+    return min(timeit.repeat(function, repeat = repeat, number = number)) / number * 1e9
+
+"""Returns a tuple of (day, month, year) for every real date from FIRST_YEAR through LAST_YEAR"""
+
+def allDates():
+    day = date(FIRST_YEAR, 1, 1)
+    last = date(LAST_YEAR, 12, 31)
+    dates = []
+    while day <= last:
+        dates.append((day.day, day.month, day.year))
+        day += timedelta(days = 1)
+    return tuple(dates)
+
+"""Returns a ZodiacCalculator that was never initialized. Its logic methods only touch attributes, so they run without a
+display; the tk group covers the methods that make widgets."""
+
+def logicOnlyCalculator():
+    from LotkowskiJulesFinalProject import ZodiacCalculator
+    calculator = ZodiacCalculator.__new__(ZodiacCalculator)
+    calculator.calculateChineseZodiac(1990, 5, 5)
+    calculator.calculateWesternZodiac(5, 5)
+    return calculator
+
+"""Per-call latency of each engine function. Returns a dict of result name to ns/call."""
+
+def engineGroup(scale):
+    number = 200000 // scale
+    e = zodiacengine
+    cases = (
+        ("isLeapYear", lambda: e.isLeapYear(2000)),
+        ("checkDate valid", lambda: e.checkDate(15, 6, 1990)),
+        ("checkDate invalid", lambda: e.checkDate(29, 2, 1991)),
+        ("parseDate strings", lambda: e.parseDate("6", "15", "1990")),
+        ("validateDate valid", lambda: e.validateDate(15, 6, 1990)),
+        ("westernSignCode", lambda: e.westernSignCode(15, 6)),
+        ("calculateWesternZodiac", lambda: e.calculateWesternZodiac(15, 6)),
+        ("lunarYear", lambda: e.lunarYear(1990, 1, 20)),
+        ("chineseAnimalCode year only", lambda: e.chineseAnimalCode(1990)),
+        ("chineseAnimalCode full date", lambda: e.chineseAnimalCode(1990, 1, 20)),
+        ("calculateChineseZodiac", lambda: e.calculateChineseZodiac(1990, 1, 20)),
+    )
+    return dict(("engine." + name, nsPerCall(function, number)) for name, function in cases)
+
+"""Per-call latency of the GUI logic methods. Returns a dict of result name to ns/call."""
+
+def guiGroup(scale):
+    number = 100000 // scale
+    calculator = logicOnlyCalculator()
+    cases = (
+        ("validateDate valid", lambda: calculator.validateDate(15, 6, 1990)),
+        ("calculateWesternZodiac", lambda: calculator.calculateWesternZodiac(15, 6)),
+        ("calculateChineseZodiac", lambda: calculator.calculateChineseZodiac(1990, 1, 20)),
+        ("resultLogic", calculator.resultLogic),
+    )
+    return dict(("gui." + name, nsPerCall(function, number)) for name, function in cases)
+
+"""Every date in the span, through the engine and through the GUI methods. Returns a dict of result name to ns/date."""
+
+def exhaustiveGroup(scale):
+    dates = allDates()[::scale]
+    e = zodiacengine
+    calculator = logicOnlyCalculator()
+
+    def engineRun():
+        for day, month, year in dates:
+            e.checkDate(day, month, year)
+            e.westernSignCode(day, month)
+            e.chineseAnimalCode(year, month, day)
+
+    def guiRun():
+        for day, month, year in dates:
+            calculator.validateDate(day, month, year)
+            calculator.calculateChineseZodiac(year, month, day)
+            calculator.calculateWesternZodiac(day, month)
+            calculator.resultLogic()
+
+    return {"exhaustive.dates": len(dates),
+            "exhaustive.engine": nsPerCall(engineRun, 1, 3) / len(dates),
+            "exhaustive.gui": nsPerCall(guiRun, 1, 3) / len(dates)}
+
+"""Results window construction and updates with a withdrawn root. Returns a dict of result name to us/call."""
+
+def tkGroup(scale):
+    from LotkowskiJulesFinalProject import ZodiacCalculator, imageCache
+    cycles = 2000 // scale
+    calculator = ZodiacCalculator()
+    calculator.master.withdraw()
+    try:
+        start = time.perf_counter()
+        imageCache.warm()
+        results = {"tk.warm images (once)": (time.perf_counter() - start) * 1e6}
+
+        def build():
+            calculator.buildResultsWindow()
+            calculator.update_idletasks()
+            calculator.top.destroy()
+
+        def showAndHide():
+            for i in range(cycles):
+                calculator.animalCode = i % len(ANIMALS)
+                calculator.signCode = (i // len(ANIMALS)) % len(ZODIAC_SIGNS)
+                calculator.resultsWindow(ANIMALS[calculator.animalCode], ZODIAC_SIGNS[calculator.signCode])
+                calculator.update_idletasks()
+                calculator.back()
+                calculator.update_idletasks()
+
+        results["tk.buildResultsWindow"] = nsPerCall(build, 50 // scale or 1, 3) / 1000
+        calculator.top = None
+        calculator.calculateChineseZodiac(1990, 5, 5)
+        calculator.calculateWesternZodiac(5, 5)
+        showAndHide() # Builds the window once, so the timing below is steady state
+        results["tk.resultsWindow show/hide"] = nsPerCall(showAndHide, 1, 3) / cycles / 1000
+        return results
+    finally:
+        calculator.master.destroy()
+        imageCache.clear() # The images belonged to the root that was just destroyed
+
+RUNNERS = {"engine": engineGroup, "gui": guiGroup, "exhaustive": exhaustiveGroup, "tk": tkGroup}
+UNITS = {"engine": "ns/call", "gui": "ns/call", "exhaustive": "ns/date", "tk": "us/call"}
+
+"""Returns the current git commit, or None outside a git checkout"""
+
+def gitCommit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd = PROJECT_FOLDER,
+                                       stderr = subprocess.DEVNULL, universal_newlines = True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+"""Runs the groups and returns the report dict that is written to JSON"""
+
+def runSuite(groups, quick = False):
+    scale = 10 if quick else 1
+    report = {"meta": {"time": datetime.now().isoformat(timespec = "seconds"), "commit": gitCommit(), "python": platform.python_version(),
+                       "implementation": platform.python_implementation(), "platform": platform.platform(), "quick": quick},
+              "results": {}, "units": {}, "skipped": {}}
+    for group in groups:
+        try:
+            results = RUNNERS[group](scale)
+        except Exception as e: # Only the tk group is expected to fail, when there is no display
+            report["skipped"][group] = "%s: %s" % (type(e).__name__, e)
+            continue
+        for name, value in results.items():
+            report["results"][name] = round(value, 1) if isinstance(value, float) else value
+            report["units"][name] = "dates" if name == "exhaustive.dates" else UNITS[group]
+    return report
+
+"""Prints a report, with the ratio to an earlier report's numbers when one is given"""
+
+def printReport(report, old = None):
+    oldResults = old["results"] if old else {}
+    for name, value in report["results"].items():
+        line = "%-42s %12s %s" % (name, value, report["units"][name])
+        if oldResults.get(name) and report["units"][name] != "dates":
+            line += "   %.2fx of %s" % (value / oldResults[name], old["meta"].get("commit") or "old run")
+        print(line)
+    for group, reason in report["skipped"].items():
+        print("Skipped %s group (%s)" % (group, reason))
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Times the zodiac calculator's hot paths and writes the results as JSON.")
+    parser.add_argument("--output", default = DEFAULT_OUTPUT, help = "JSON file to write (default %s)" % DEFAULT_OUTPUT)
+    parser.add_argument("--compare", help = "earlier JSON file to compare against")
+    parser.add_argument("--groups", default = ",".join(GROUPS), help = "comma-separated groups to run (default all)")
+    parser.add_argument("--quick", action = "store_true", help = "a tenth of the iterations, for a fast check")
+    args = parser.parse_args(argv)
+    groups = [group for group in args.groups.split(",") if group]
+    unknown = [group for group in groups if group not in RUNNERS]
+    if unknown:
+        parser.error("unknown group: " + ", ".join(unknown))
+    old = None
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+    report = runSuite(groups, args.quick)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent = 1)
+    printReport(report, old)
+    print("Wrote " + args.output)
+
+if __name__ == "__main__":
+    main()
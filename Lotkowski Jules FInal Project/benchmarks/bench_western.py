@@ -0,0 +1,118 @@
+"""
+File: bench_western.py
+Microbenchmark for the western zodiac lookup. Compares the table lookup in zodiacengine against the original if-chain from
+ZodiacCalculator.calculateWesternZodiac, over every date of a leap year (366 dates). Checks that both give the same sign
+for every date before timing them.
+Run from the project folder or the benchmarks folder: python benchmarks/bench_western.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the benchmark import the engine
+import zodiacengine
+from zodiacengine import ZODIAC_SIGNS
+
+DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31) # Leap year, so February 29 is included
+ALL_DATES = tuple((day, month) for month in range(1, 13) for day in range(1, DAYS_IN_MONTH[month - 1] + 1))
+
+class LegacyCalculator(object):
+    """The original if-chain, kept here as the baseline. Writes self.userSign on every call like the GUI method did."""
+
+    def calculateWesternZodiac(self, day, month):
+        self.zodiacSigns = ZODIAC_SIGNS
+        if (month == 12) and (day >= 22):
+            self.userSign = self.zodiacSigns[0]
+            return self.userSign
+        elif (month == 12) and (day < 22):
+            self.userSign = self.zodiacSigns[11]
+            return self.userSign
+        if (month == 11) and (day >= 22):
+            self.userSign = self.zodiacSigns[11]
+            return self.userSign
+        elif (month == 11) and (day < 22):
+            self.userSign = self.zodiacSigns[10]
+            return self.userSign
+        if (month == 10) and (day >= 23):
+            self.userSign = self.zodiacSigns[10]
+            return self.userSign
+        elif (month == 10) and (day < 23):
+            self.userSign = self.zodiacSigns[9]
+            return self.userSign
+        if (month == 9) and (day >= 23):
+            self.userSign = self.zodiacSigns[9]
+            return self.userSign
+        elif (month == 9) and (day < 23):
+            self.userSign = self.zodiacSigns[8]
+            return self.userSign
+        if (month == 8) and (day >= 23):
+            self.userSign = self.zodiacSigns[8]
+            return self.userSign
+        elif (month == 8) and (day < 23):
+            self.userSign = self.zodiacSigns[7]
+            return self.userSign
+        if (month == 7) and (day >= 23):
+            self.userSign = self.zodiacSigns[7]
+            return self.userSign
+        elif (month == 7) and (day < 23):
+            self.userSign = self.zodiacSigns[6]
+            return self.userSign
+        if (month == 6) and (day >= 21):
+            self.userSign = self.zodiacSigns[6]
+            return self.userSign
+        elif (month == 6) and (day < 21):
+            self.userSign = self.zodiacSigns[5]
+            return self.userSign
+        if (month == 5) and (day >= 21):
+            self.userSign = self.zodiacSigns[5]
+            return self.userSign
+        elif (month == 5) and (day < 21):
+            self.userSign = self.zodiacSigns[4]
+            return self.userSign
+        if (month == 4) and (day >= 20):
+            self.userSign = self.zodiacSigns[4]
+            return self.userSign
+        elif (month == 4) and (day < 20):
+            self.userSign = self.zodiacSigns[3]
+            return self.userSign
+        if (month == 3) and (day >= 21):
+            self.userSign = self.zodiacSigns[3]
+            return self.userSign
+        elif (month == 3) and (day < 21):
+            self.userSign = self.zodiacSigns[2]
+            return self.userSign
+        if (month == 2) and (day >= 19):
+            self.userSign = self.zodiacSigns[2]
+            return self.userSign
+        elif (month == 2) and (day < 19):
+            self.userSign = self.zodiacSigns[1]
+            return self.userSign
+        if (month == 1) and (day >= 20):
+            self.userSign = self.zodiacSigns[1]
+            return self.userSign
+        elif (month == 1) and (day < 20):
+            self.userSign = self.zodiacSigns[0]
+            return self.userSign
+
+"""Calls the lookup once for every date in ALL_DATES"""
+
+def runAllDates(lookup):
+    for day, month in ALL_DATES:
+        lookup(day, month)
+
+def main(repeat = 5, number = 200):
+    legacy = LegacyCalculator().calculateWesternZodiac
+    table = zodiacengine.calculateWesternZodiac
+    for day, month in ALL_DATES: # The table has to agree with the chain before the timing means anything
+        if legacy(day, month) != table(day, month):
+            raise AssertionError("Lookup mismatch on %d/%d" % (month, day))
+    calls = number * len(ALL_DATES)
+    legacyBest = min(timeit.repeat(lambda: runAllDates(legacy), repeat = repeat, number = number))
+    tableBest = min(timeit.repeat(lambda: runAllDates(table), repeat = repeat, number = number))
+    print("Dates per run:   %d" % len(ALL_DATES))
+    print("If-chain:        %.1f ns/call" % (legacyBest / calls * 1e9))
+    print("Table lookup:    %.1f ns/call" % (tableBest / calls * 1e9))
+    print("Speedup:         %.2fx" % (legacyBest / tableBest))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+File: bench_workers.py
+Throughput benchmark for the sharded batch mode in zodiacbatch. Writes a CSV file of random birth dates, runs it through
+processFile with 1, 2, 4, ... worker processes up to the number of CPU cores, and reports rows per second for each worker count.
+Uses processFile's default shard size, which gives every worker several shards, and prints the shard count for each run.
+Run from the project folder or the benchmarks folder: python benchmarks/bench_workers.py [rows]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the benchmark import the batch module
+import zodiacbatch
+
+"""Writes rows of random birth dates to a new CSV file and returns its path"""
+
+def writeSampleFile(rows, seed = 1):
+    generator = random.Random(seed)
+    handle, path = tempfile.mkstemp(suffix = ".csv")
+    with os.fdopen(handle, "w") as f:
+        f.write("id,month,day,year\n")
+        for i in range(rows):
+            f.write("%d,%d,%d,%d\n" % (i, generator.randint(1, 12), generator.randint(1, 28), generator.randint(1900, 2020)))
+    return path
+
+"""Returns the worker counts to try: powers of two up to the core count, plus the core count itself"""
+
+def workerCounts():
+    cores = os.cpu_count() or 1
+    counts = []
+    workers = 1
+    while workers < cores:
+        counts.append(workers)
+        workers *= 2
+    counts.append(cores)
+    return counts
+
+def main(rows = 2000000):
+    path = writeSampleFile(rows)
+    try:
+        with open(os.devnull, "wb") as out:
+            baseline = None
+            print("Rows: %d, file size: %.1f MB" % (rows, os.path.getsize(path) / 1e6))
+            for workers in workerCounts():
+                shards = len(zodiacbatch.shardRanges(path, zodiacbatch.shardSizeFor(os.path.getsize(path), workers)))
+                start = time.perf_counter()
+                zodiacbatch.processFile(path, out, "csv", True, workers) # Default shard size, as the command line uses
+                rate = rows / (time.perf_counter() - start)
+                baseline = baseline or rate
+                print("%3d workers, %4d shards: %10.0f rows/s  (%.2fx)" % (workers, shards, rate, rate / baseline))
+    finally:
+        os.remove(path)
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,116 @@
+"""
+File: soak_kiosk.py
+Soak test for kiosk mode. Drives the calculator through Calculate/Back cycles the way a user would: it fills in the entry
+fields, runs Calculate, lets Tk process events, then presses Back (or OK on the error window). One cycle in ten uses a date
+that is not real, to cover the error path. The resident set size, Tcl command, image, and global variable counts, widget
+count, and Python object count are sampled at checkpoints.
+
+After a warm-up, the Tcl and widget counts must not change at all, and RSS and the Python object count must stay within a small
+tolerance, at every checkpoint. Exits with status 1 and lists each checkpoint where a number grew, even if it settled later. Needs a display (on a headless machine, run it under
+xvfb-run).
+Run from the project folder or the benchmarks folder: python benchmarks/soak_kiosk.py [cycles]
+"""
+import gc
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Lets the harness import the calculator
+from LotkowskiJulesFinalProject import ZodiacCalculator
+
+CYCLES = 100000
+CHECKPOINTS = 20
+WARMUP_CYCLES = 1000 # Cycles run before the baseline is taken
+RSS_TOLERANCE = 2 * 1024 * 1024 # Bytes RSS may grow past the baseline (allocator noise)
+OBJECT_TOLERANCE = 500 # Python objects the count may grow past the baseline
+EXACT = ("tcl commands", "tcl images", "tcl globals", "widgets") # Counts that must not change at all
+BAD_DATE = ("2", "30", "1990")
+
+"""Returns the current resident set size in bytes. Falls back to the peak size where /proc is not available."""
+
+def residentBytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024 # Bytes on macOS, kilobytes elsewhere
+
+"""Returns the number of widgets under a widget, counting it"""
+
+def widgetCount(widget):
+    return 1 + sum(widgetCount(child) for child in widget.winfo_children())
+
+"""Returns a dict of every number the soak test watches"""
+
+def sample(calculator):
+    tk = calculator.tk
+    gc.collect()
+    return {"rss": residentBytes(),
+            "tcl commands": len(tk.splitlist(tk.call("info", "commands"))),
+            "tcl images": len(tk.splitlist(tk.call("image", "names"))),
+            "tcl globals": len(tk.splitlist(tk.call("info", "globals"))),
+            "widgets": widgetCount(calculator.master),
+            "python objects": len(gc.get_objects())}
+
+"""Returns the (month, day, year) strings typed in on a cycle"""
+
+def cycleDate(i):
+    if i % 10 == 9:
+        return BAD_DATE
+    return str(i % 12 + 1), str(i % 28 + 1), str(1900 + i % 200)
+
+"""Runs one Calculate and one Back (or OK) like a user would"""
+
+def runCycle(calculator, i):
+    for field, value in zip((calculator.userMonth, calculator.userDay, calculator.userYear), cycleDate(i)):
+        field.setValue(value)
+    calculator.checkInput()
+    calculator.update()
+    if calculator.errorWindow.state() == "normal": # The date was rejected
+        calculator.closeError()
+    else:
+        calculator.back()
+    calculator.update()
+
+"""Returns a list of the reasons the sample grew too much past the baseline (empty if it did not)"""
+
+def growth(baseline, current):
+    problems = ["%s went from %d to %d" % (name, baseline[name], current[name]) for name in EXACT if current[name] != baseline[name]]
+    if current["rss"] - baseline["rss"] > RSS_TOLERANCE:
+        problems.append("rss grew by %.1f MB" % ((current["rss"] - baseline["rss"]) / 1048576))
+    if current["python objects"] - baseline["python objects"] > OBJECT_TOLERANCE:
+        problems.append("python objects grew by %d" % (current["python objects"] - baseline["python objects"]))
+    return problems
+
+def main(cycles = CYCLES):
+    calculator = ZodiacCalculator(kiosk = True)
+    calculator.update()
+    for i in range(WARMUP_CYCLES):
+        runCycle(calculator, i)
+    baseline = sample(calculator)
+    print("%9s %9s %9s %7s %8s %8s %9s" % ("cycle", "rss MB", "commands", "images", "globals", "widgets", "objects"))
+    problems = []
+    start = time.perf_counter()
+    step = max(1, cycles // CHECKPOINTS)
+    for i in range(cycles):
+        runCycle(calculator, WARMUP_CYCLES + i)
+        if (i + 1) % step == 0 or i + 1 == cycles:
+            current = sample(calculator)
+            print("%9d %9.1f %9d %7d %8d %8d %9d" % (i + 1, current["rss"] / 1048576, current["tcl commands"], current["tcl images"],
+                                                     current["tcl globals"], current["widgets"], current["python objects"]))
+            problems.extend("cycle %d: %s" % (i + 1, problem) for problem in growth(baseline, current))
+    elapsed = time.perf_counter() - start
+    calculator.master.destroy()
+    print("%d cycles in %.1fs (%.0f us/cycle)" % (cycles, elapsed, elapsed / cycles * 1e6))
+    if problems:
+        print("FAIL:")
+        for problem in problems:
+            print("  " + problem)
+        return 1
+    print("PASS: memory and Tcl object counts stayed flat")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else CYCLES))
@@ -16,6 +16,38 @@ run on any platform where Tkinter is available.
 INSTALLATION: Put this file where Python can see it.
 
 RELEASE NOTES:
+EasyFrame can run long jobs on worker threads with runJob, which
+returns an EasyJob that can be cancelled.  Progress and results come
+back to the Tk thread through a queue that is checked with after(),
+so the window stays responsive (updated 10-18-2026).
+
+TextArea can buffer appendText and write the text out every few
+milliseconds with one insert, and can keep only its last lines, so
+streaming logs into it stays fast and bounded.  addTextArea takes
+the interval and maxLines options (updated 10-18-2026).
+
+EasyCanvas now draws each shape with a single Tcl call, every draw
+method takes tags, and the new methods drawLines, drawRectangles,
+drawOvals, and drawPolyline draw a whole batch of shapes in one Tcl
+call.  moveTag, configureTag, deleteTag, and deleteAll work on every
+item with a tag at once (updated 10-18-2026).
+
+The new class EasyTable shows rows of data in columns, with headings.
+It keeps the rows in Python and only puts the rows that are on screen
+into Tk, so it can scroll through millions of rows (updated 10-18-2026).
+
+EasyListbox now has setItems and getItems, and clear empties the list
+box in a single Tcl call.  Pass indexed = True to addListbox to have
+getIndex answer from a Python dict instead of searching the list box
+(updated 10-18-2026).
+
+The dialog classes (MessageBox, PrompterBox, EasyDialog) and EasyCombobox
+are now defined the first time they are used, so importing this module
+does not import tkinter.simpledialog or ttk.  A program that never pops
+up a dialog or makes a combo box starts faster.  On Python 3.7 and later
+this works through the module's __getattr__; older versions define
+them at import as before (updated 10-18-2026).
+
 Version 1.2 also now includes the class EasyCombobox for
 managing combo boxes (updated 08-15-2019).
 
@@ -31,17 +63,21 @@ Python 2.x.x (updated 2-4-2013).
 """
 
 import sys
+import threading
+import time
+from array import array
+from bisect import insort
+from itertools import islice
 versionNumber = sys.version_info.major
 if versionNumber == 3:
     import tkinter
-    import tkinter.simpledialog
     Tkinter = tkinter
-    tkSimpleDialog = tkinter.simpledialog
-    from tkinter import ttk
+    import queue
 else:
     import Tkinter
-    import tkSimpleDialog
-    from Tkinter import ttk
+    import Queue as queue
+# tkSimpleDialog and ttk are imported on first use, by _defineDialogs
+# and _defineCombobox.
 
 N = Tkinter.N
 S = Tkinter.S
@@ -171,10 +207,13 @@ class EasyFrame(Tkinter.Frame):
         return field
 
     def addTextArea(self, text, row, column, rowspan = 1, columnspan = 1,
-                    width = 80, height = 5, wrap = NONE):
+                    width = 80, height = 5, wrap = NONE,
+                    interval = None, maxLines = None):
         """Creates and inserts a multiline text area at the row and column,
         and returns the text area.  Vertical and horizontal scrollbars are
-        provided."""
+        provided.  If interval is given, appended text is buffered and
+        written every interval milliseconds.  If maxLines is given, only
+        the last maxLines lines are kept."""
         frame = Tkinter.Frame(self)
         frame.grid(row = row, column = column,
                    columnspan = columnspan, rowspan = rowspan,
@@ -186,7 +225,8 @@ class EasyFrame(Tkinter.Frame):
         yScroll = Tkinter.Scrollbar(frame, orient = VERTICAL)
         yScroll.grid(row = 0, column = 1, sticky = N+S)
         area = TextArea(frame, text, width, height,
-                        xScroll.set, yScroll.set, wrap)
+                        xScroll.set, yScroll.set, wrap,
+                        interval, maxLines)
         area.grid(row = 0, column = 0,
                   padx = 5, pady = 5, sticky = N+S+E+W)
         frame.columnconfigure(0, weight = 1)
@@ -201,7 +241,7 @@ class EasyFrame(Tkinter.Frame):
                     sticky = N+E, command = lambda: None):
         """Creates and inserts a combo box at the row and column,
         and returns the combo box."""
-        box = EasyCombobox(self, text, values, command)
+        box = _lazyGlobal("EasyCombobox")(self, text, values, command)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
         box.grid(row = row, column = column,
@@ -210,10 +250,12 @@ class EasyFrame(Tkinter.Frame):
         return box
 
     def addListbox(self, row, column, rowspan = 1, columnspan = 1,
-                   width = 10, height = 5, listItemSelected = lambda index: index):
+                   width = 10, height = 5, listItemSelected = lambda index: index,
+                   indexed = False):
         """Creates and inserts a scrolling list box at the row and column, with a
         width and height in lines and columns of text, and a default item selection
-        method, and returns the list box."""
+        method, and returns the list box.  If indexed is True, the list box keeps
+        a dict of its items for fast getIndex calls."""
         frame = Tkinter.Frame(self)
         frame.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
                    sticky = N+S+E+W)
@@ -221,13 +263,27 @@ class EasyFrame(Tkinter.Frame):
         self.rowconfigure(row, weight = 1)
         yScroll = Tkinter.Scrollbar(frame, orient = VERTICAL)
         yScroll.grid(row = 0, column = 1, sticky = N+S)
-        listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected)
+        listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected,
+                              indexed)
         listBox.grid(row = 0, column = 0, sticky = N+S+E+W)
         frame.columnconfigure(0, weight = 1)
         frame.rowconfigure(0, weight = 1)
         yScroll["command"] = listBox.yview
         return listBox
 
+    def addTable(self, headings, row, column, rowspan = 1, columnspan = 1,
+                 width = 12, height = 10, rowSelected = lambda index: index):
+        """Creates and inserts a scrolling table with the column headings at
+        the row and column, with a column width (one number for every column,
+        or one per column) and a starting height in rows, and a default row
+        selection method, and returns the table."""
+        table = EasyTable(self, headings, width, height, rowSelected)
+        table.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
+                   sticky = N+S+E+W)
+        self.columnconfigure(column, weight = 1)
+        self.rowconfigure(row, weight = 1)
+        return table
+
     def addCanvas(self, canvas = None, row = 0, column = 0,
                   rowspan = 1, columnspan = 1, width = 200, height = 100,
                   background = "white"):
@@ -301,7 +357,7 @@ class EasyFrame(Tkinter.Frame):
     def messageBox(self, title = "", message = "", width = 25, height = 5):
         """Creates and pops up a message box, with the given title,
         message, and width and height in rows and columns of text."""
-        dlg = MessageBox(self, title, message, width, height)
+        dlg = _lazyGlobal("MessageBox")(self, title, message, width, height)
         return dlg.modified()
 
     # Method to pop up a prompter box from this window.
@@ -310,9 +366,33 @@ class EasyFrame(Tkinter.Frame):
         """Creates and pops up a prompter box, with the given title, prompt,
         input text, and field width in columns of text.
         Returns the text entered at the prompt."""
-        dlg = PrompterBox(self, title, promptString, inputText, fieldWidth)
+        dlg = _lazyGlobal("PrompterBox")(self, title, promptString, inputText, fieldWidth)
         return dlg.getText()
 
+    # Methods to run long jobs without blocking the window.
+
+    def runJob(self, function, args = (), onProgress = None, onDone = None):
+        """Runs function(job, *args) on a worker thread and returns the
+        job (an EasyJob).  onProgress is called with the values the
+        function passes to job.progress, and onDone with the job when
+        it is over.  Both are called on the Tk thread."""
+        return self.getJobRunner().submit(function, args, onProgress, onDone)
+
+    def getJobRunner(self):
+        """Returns the window's JobRunner, making it on first use."""
+        runner = getattr(self, "_jobRunner", None)
+        if runner is None:
+            runner = self._jobRunner = JobRunner(self)
+        return runner
+
+    def stopJobs(self, timeout = 5.0):
+        """Cancels every job and waits up to timeout seconds for the
+        worker threads to stop.  For closing the window."""
+        runner = getattr(self, "_jobRunner", None)
+        if runner is not None:
+            runner.shutdown(timeout)
+            self._jobRunner = None
+
 # Classes for easy widgets
 
 class AbstractField(Tkinter.Entry):
@@ -388,60 +468,303 @@ class TextField(AbstractField):
         self.setValue(text)
 
 class TextArea(Tkinter.Text):
-    """Represents a box for I/O of multiline text."""
+    """Represents a box for I/O of multiline text.  When buffered,
+    appendText collects text and writes it all out with one insert
+    every interval milliseconds, following the end of the text if
+    it was in view.  When capped, only the last maxLines lines are
+    kept, and older ones are trimmed with one delete."""
 
     def __init__(self, parent, text, width, height,
-                 xscrollcommand, yscrollcommand, wrap):
+                 xscrollcommand, yscrollcommand, wrap,
+                 interval = None, maxLines = None):
         Tkinter.Text.__init__(self, parent,
                               width = width,
                               height = height,
                               wrap = wrap,
                               xscrollcommand = xscrollcommand,
                               yscrollcommand = yscrollcommand)
+        self._buffer = []
+        self._flushId = None
+        self.interval = interval
+        self.maxLines = maxLines
         self.setText(text)
 
     def getText(self):
         """Returns the string contained in the text area."""
+        self.flush()
         return self.get("1.0", END)
 
     def setText(self, text):
         """Replaces the string contained in the text area."""
+        self._cancelFlush()
+        del self._buffer[:]
         self.delete("1.0", END)
         self.insert("1.0", text)
+        self._trim()
         
     def appendText(self, text):
         """Inserts the text after the string contained in
-        the text area."""
+        the text area.  When buffered, the text appears at
+        the next flush."""
+        if self.interval is None:
+            self.insert(END, text)
+            self._trim()
+        else:
+            self._buffer.append(text)
+            if self._flushId is None:
+                self._flushId = self.after(self.interval, self.flush)
+
+    def setBuffering(self, interval):
+        """Buffers appended text and writes it out every interval
+        milliseconds, or writes it at once if interval is None."""
+        self.flush()
+        self.interval = interval
+
+    def setMaxLines(self, maxLines):
+        """Keeps only the last maxLines lines, or all of them if
+        maxLines is None."""
+        self.maxLines = maxLines
+        self._trim()
+
+    def flush(self):
+        """Writes out any buffered text at once."""
+        self._cancelFlush()
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        del self._buffer[:]
+        if self.maxLines is not None and text.count("\n") > self.maxLines:
+            # Lines that would be trimmed at once are never inserted
+            text = "\n".join(text.split("\n")[-self.maxLines - 1:])
+        following = self.yview()[1] == 1.0
         self.insert(END, text)
+        self._trim()
+        if following:
+            self.see(END)
+
+    def destroy(self):
+        self._cancelFlush()
+        Tkinter.Text.destroy(self)
+
+    def _cancelFlush(self):
+        if self._flushId is not None:
+            self.after_cancel(self._flushId)
+            self._flushId = None
+
+    def _trim(self):
+        """Deletes all but the last maxLines lines in one delete."""
+        if self.maxLines is not None:
+            self.delete("1.0", "end-1c -%d lines linestart" % self.maxLines)
+
+# Added 10-18-2026
+class JobCancelled(Exception):
+    """Raised by EasyJob.progress once the job has been cancelled,
+    to stop the job's function."""
+
+class EasyJob(object):
+    """A function run on a worker thread by a JobRunner.  The function
+    is called as function(job, *args) and reports progress by calling
+    job.progress with any values.  When the job is over, state is
+    "done", "failed", or "cancelled", and result or error holds what
+    the function returned or raised."""
+
+    def __init__(self, function, args, onProgress, onDone, post):
+        self.function = function
+        self.args = tuple(args)
+        self.onProgress = onProgress
+        self.onDone = onDone
+        self.state = "waiting"
+        self.result = None
+        self.error = None
+        self._post = post
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Asks the job to stop.  A waiting job never starts, and a
+        running one stops at its next call to progress."""
+        self._cancelled.set()
+
+    def isCancelled(self):
+        """Returns True if the job has been asked to stop."""
+        return self._cancelled.is_set()
+
+    def isFinished(self):
+        """Returns True once the job is over and onDone has run."""
+        return self.state in ("done", "failed", "cancelled")
+
+    def progress(self, *values):
+        """Called by the job's function to report progress.  Raises
+        JobCancelled if the job has been cancelled."""
+        if self._cancelled.is_set():
+            raise JobCancelled()
+        self._post(self, "progress", values)
+
+    def _run(self):
+        """Runs the function on the worker thread and posts how it
+        ended."""
+        if self._cancelled.is_set():
+            self._post(self, "cancelled", None)
+            return
+        self.state = "running"
+        try:
+            result = self.function(self, *self.args)
+        except JobCancelled:
+            self._post(self, "cancelled", None)
+        except Exception as e:
+            self._post(self, "failed", e)
+        else:
+            self._post(self, "done", result)
+
+class JobRunner(object):
+    """Runs EasyJobs on a pool of worker threads and hands their
+    progress and results back to the Tk thread.  Workers put messages
+    on a thread-safe queue, and the widget's after() loop drains it
+    every interval milliseconds while any job is unfinished, so the
+    callbacks never run on a worker thread.  Only the latest progress
+    of each job is delivered per drain.  A job that needs more than
+    one CPU can use a process pool from inside its function."""
+
+    def __init__(self, widget, workers = 1, interval = 50):
+        self.widget = widget
+        self.workers = workers
+        self.interval = interval
+        self._jobs = queue.Queue()
+        self._messages = queue.Queue()
+        self._threads = []
+        self._active = []
+        self._pollId = None
+
+    def submit(self, function, args = (), onProgress = None, onDone = None):
+        """Queues function(job, *args) to run and returns the job."""
+        job = EasyJob(function, args, onProgress, onDone, self._post)
+        self._active.append(job)
+        if len(self._threads) < self.workers:
+            thread = threading.Thread(target = self._work)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+        self._jobs.put(job)
+        if self._pollId is None:
+            self._pollId = self.widget.after(self.interval, self._poll)
+        return job
+
+    def activeJobs(self):
+        """Returns a list of the jobs that are not finished."""
+        return list(self._active)
+
+    def cancelAll(self):
+        """Asks every unfinished job to stop."""
+        for job in self._active:
+            job.cancel()
+
+    def shutdown(self, timeout = 5.0):
+        """Cancels every job, stops checking the queue, and waits up
+        to timeout seconds in all for the worker threads to finish
+        their current jobs, so a job can clean up before the program
+        exits.  Returns True if every thread stopped in time."""
+        self.cancelAll()
+        for thread in self._threads:
+            self._jobs.put(None)
+        if self._pollId is not None:
+            self.widget.after_cancel(self._pollId)
+            self._pollId = None
+        deadline = time.time() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.time()))
+        stopped = not any(thread.is_alive() for thread in self._threads)
+        self._threads = []
+        self._active = []
+        return stopped
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            job._run()
+
+    def _post(self, job, kind, value):
+        self._messages.put((job, kind, value))
+
+    def _poll(self):
+        """Delivers the messages that have arrived since the last
+        check, on the Tk thread."""
+        self._pollId = None
+        progress = {}
+        finished = []
+        while True:
+            try:
+                job, kind, value = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                progress[job] = value
+            else:
+                finished.append(job)
+                job.state = kind
+                if kind == "done":
+                    job.result = value
+                elif kind == "failed":
+                    job.error = value
+                if job in self._active:
+                    self._active.remove(job)
+        if self._active:
+            self._pollId = self.widget.after(self.interval, self._poll)
+        for job, values in progress.items():
+            if job.onProgress is not None and not job.isFinished():
+                job.onProgress(*values)
+        for job in finished:
+            if job.onDone is not None:
+                job.onDone(job)
 
 # Added 08-15-2019
-class EasyCombobox(ttk.Combobox):
-    """Represents a combo box."""
-
-    def __init__(self, parent, text, values, command):
-        self.var = Tkinter.StringVar()
-        self.setText(text)
-        ttk.Combobox.__init__(self, parent,
-                              textvariable = self.var)
-        self["values"] = values
-        self["postcommand"] = command
-        self.current(0)
-
-    def setText(self, text):
-        self.var.set(text)
-
-    def getText(self):
-        return self.var.get()
+def _defineCombobox():
+    """Imports ttk and defines EasyCombobox.  Runs the first time
+    the class is used."""
+    global ttk, EasyCombobox
+    if versionNumber == 3:
+        from tkinter import ttk
+    else:
+        from Tkinter import ttk
+
+    class EasyCombobox(ttk.Combobox):
+        """Represents a combo box."""
+
+        def __init__(self, parent, text, values, command):
+            self.var = Tkinter.StringVar()
+            self.setText(text)
+            ttk.Combobox.__init__(self, parent,
+                                  textvariable = self.var)
+            self["values"] = values
+            self["postcommand"] = command
+            self.current(0)
+
+        def setText(self, text):
+            self.var.set(text)
+
+        def getText(self):
+            return self.var.get()
 
 class EasyListbox(Tkinter.Listbox):
     """Represents a list box."""
 
-    def __init__(self, parent, width, height, yscrollcommand, listItemSelected):
+    def __init__(self, parent, width, height, yscrollcommand, listItemSelected,
+                 indexed = False):
+        """If indexed is True, getIndex looks items up in a dict instead of
+        searching the list.  Items are matched by their text, str(item).
+        Adding items at the end and deleting items keep the dict up to
+        date; only edits in the middle shift the indexes after them."""
         self._listItemSelected = listItemSelected
+        self._indexed = indexed
+        self._indexes = {} if indexed else None  # str(item) -> sorted list of its indexes, or None if stale
+        # The list box shows the contents of this variable, so setting it
+        # replaces every item in one Tcl call
+        self._items = Tkinter.Variable(parent)
         Tkinter.Listbox.__init__(self, parent,
                                  width = width, height = height,
                                  yscrollcommand = yscrollcommand,
-                                 selectmode = SINGLE, exportselection = 0)
+                                 selectmode = SINGLE, exportselection = 0,
+                                 listvariable = self._items)
         self.bind("<<ListboxSelect>>", self.triggerListItemSelected)
 
     def triggerListItemSelected(self, event):
@@ -478,18 +801,346 @@ class EasyListbox(Tkinter.Listbox):
 
     def clear(self):
         """Deletes all items from the list box."""
-        while self.size() > 0:
-            self.delete(0)
+        self._items.set(())
+        self._indexes = {} if self._indexed else None
+
+    def setItems(self, items):
+        """Replaces all the items in the list box with the items
+        in a sequence, in one Tcl call."""
+        items = tuple(items)
+        self._items.set(items)
+        self._indexes = None
+        if self._indexed:
+            self._buildIndexes(items)
+
+    def getItems(self):
+        """Returns a tuple of all the items in the list box."""
+        return self.get(0, END)
+
+    def insert(self, index, *elements):
+        """Inserts elements before the index, as Listbox.insert does."""
+        if self._indexes is None:
+            Tkinter.Listbox.insert(self, index, *elements)
+            return
+        size = self.size()
+        position = min(self.index(index), size)
+        Tkinter.Listbox.insert(self, index, *elements)
+        if position < size:         # In the middle: later items move down
+            self._shiftIndexes(position, len(elements))
+        for offset, element in enumerate(elements):
+            insort(self._indexes.setdefault(str(element), []), position + offset)
+
+    def delete(self, first, last = None):
+        """Deletes the items from first to last, as Listbox.delete does."""
+        if self._indexes is None:
+            Tkinter.Listbox.delete(self, first, last)
+            return
+        size = self.size()
+        start = self.index(first)
+        end = start if last is None else min(self.index(last), size - 1)
+        removed = self.get(start, end) if start <= end else ()
+        Tkinter.Listbox.delete(self, first, last)
+        for offset, item in enumerate(removed):
+            key = str(item)
+            indexes = self._indexes[key]
+            indexes.remove(start + offset)
+            if not indexes:
+                del self._indexes[key]
+        if removed and end < size - 1:  # In the middle: later items move up
+            self._shiftIndexes(end + 1, -len(removed))
+
+    def _shiftIndexes(self, first, amount):
+        """Adds amount to every index from first on."""
+        for indexes in self._indexes.values():
+            for position, index in enumerate(indexes):
+                if index >= first:
+                    indexes[position] = index + amount
+
+    def _buildIndexes(self, items):
+        self._indexes = {}
+        for index, item in enumerate(items):
+            self._indexes.setdefault(str(item), []).append(index)
 
     def getIndex(self, item):
         """Returns the index of item if it's in the list box,
-        or -1 otherwise."""
-        tup = self.get(0, self.size() - 1)
+        or -1 otherwise.  When indexed, items are matched by
+        their text, so 5 finds "5"."""
+        if self._indexed:
+            if self._indexes is None:
+                self._buildIndexes(self.getItems())
+            indexes = self._indexes.get(str(item))
+            return indexes[0] if indexes else -1
+        tup = self.getItems()
         if item in tup:
             return tup.index(item)
         else:
             return -1
         
+# Python types a table column can keep in an array, and their type codes.
+_COLUMN_TYPECODES = {int: "q", float: "d"}
+
+class _TableColumn(object):
+    """One column of an EasyTable, stored compactly.  A column of whole
+    numbers is kept in an array of 64-bit ints and a column of floats in
+    an array of doubles.  Anything else is kept as UTF-8 text in one
+    buffer, with an array of where each value ends, and is read back as
+    a string.  The first value added picks the storage; a value that
+    does not fit it turns the whole column into text for good."""
+
+    def __init__(self):
+        self._type = None           # int, float, or str once there is a value
+        self._values = None         # array of numbers, or bytearray of text
+        self._ends = None           # array of text end offsets, for str
+
+    def __len__(self):
+        if self._type is None:
+            return 0
+        if self._type is str:
+            return len(self._ends)
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self._type is not str:
+            if self._type is None:
+                raise IndexError("table column index out of range")
+            return self._values[index]
+        if index < 0:
+            index += len(self._ends)
+        end = self._ends[index]
+        start = self._ends[index - 1] if index > 0 else 0
+        return self._values[start:end].decode("utf-8")
+
+    def extend(self, values):
+        """Adds a list of values to the end of the column."""
+        if not values:
+            return
+        if self._type is None:
+            kind = type(values[0])
+            if kind in _COLUMN_TYPECODES:
+                self._type = kind
+                self._values = array(_COLUMN_TYPECODES[kind])
+            else:
+                self._toText()
+        if self._type is not str:
+            kind = self._type
+            if all(type(value) is kind for value in values):
+                count = len(self._values)
+                try:
+                    self._values.extend(values)
+                    return
+                except OverflowError:   # An int too big for 64 bits
+                    del self._values[count:]
+            self._toText()
+        self._extendText(values)
+
+    def _toText(self):
+        """Switches the column to text storage, keeping its values."""
+        old = list(self._values) if self._type not in (None, str) else []
+        self._type = str
+        self._values = bytearray()
+        self._ends = array("Q")
+        self._extendText(old)
+
+    def _extendText(self, values):
+        end = len(self._values)
+        ends = self._ends
+        for value in values:
+            data = str(value).encode("utf-8")
+            self._values += data
+            end += len(data)
+            ends.append(end)
+
+class EasyTable(Tkinter.Frame):
+    """Represents a scrolling table of rows with column headings.  The rows
+    are kept in Python, one compact array per column, and only the rows
+    that fit on screen are handed to Tk, so the table's cost in Tk is the
+    same for ten rows as for ten million.  Each column is shown in a list
+    box that holds exactly the visible rows; when the table is resized,
+    the number of visible rows follows.
+
+    Columns of ints or floats are kept in arrays of 8-byte numbers, and
+    any other column as UTF-8 text, about 8 bytes per row plus the text,
+    so a million rows of four short columns take tens of megabytes rather
+    than hundreds.  Values in a text column come back as strings."""
+
+    def __init__(self, parent, headings, width, height, rowSelected):
+        Tkinter.Frame.__init__(self, parent)
+        self._rowSelected = rowSelected
+        self._height = height
+        self._columns = [_TableColumn() for heading in headings]
+        self._first = 0             # Index of the top visible row
+        self._selected = -1         # Index of the selected row, or -1
+        if isinstance(width, int):
+            width = [width] * len(headings)
+        self._views = []            # Tcl variable showing each column's visible rows
+        self._listBoxes = []
+        for column, heading in enumerate(headings):
+            Tkinter.Label(self, text = heading, anchor = W,
+                          font = "TkHeadingFont").grid(row = 0, column = column,
+                                                       sticky = W+E)
+            view = Tkinter.Variable(self)
+            listBox = Tkinter.Listbox(self, listvariable = view,
+                                      width = width[column], height = height,
+                                      selectmode = SINGLE, exportselection = 0,
+                                      activestyle = NONE)
+            listBox.grid(row = 1, column = column, sticky = N+S+E+W)
+            listBox.bind("<<ListboxSelect>>", self._listBoxSelected)
+            listBox.bind("<MouseWheel>", self._wheel)
+            listBox.bind("<Button-4>", lambda event: self._step(-3))
+            listBox.bind("<Button-5>", lambda event: self._step(3))
+            listBox.bind("<Up>", lambda event: self._moveSelection(-1))
+            listBox.bind("<Down>", lambda event: self._moveSelection(1))
+            listBox.bind("<Prior>", lambda event: self._step(-self._height))
+            listBox.bind("<Next>", lambda event: self._step(self._height))
+            self.columnconfigure(column, weight = 1)
+            self._views.append(view)
+            self._listBoxes.append(listBox)
+        self.rowconfigure(1, weight = 1)
+        self._yScroll = Tkinter.Scrollbar(self, orient = VERTICAL,
+                                          command = self._scrollbarMoved)
+        self._yScroll.grid(row = 1, column = len(headings), sticky = N+S)
+        if self._listBoxes:
+            self._listBoxes[0].bind("<Configure>", self._resized)
+        self._render()
+
+    def rowCount(self):
+        """Returns the number of rows in the table."""
+        return len(self._columns[0]) if self._columns else 0
+
+    def setRows(self, rows):
+        """Replaces the rows with the rows from an iterable of sequences,
+        one value per column.  Short rows are padded with empty strings."""
+        self._columns = [_TableColumn() for column in self._columns]
+        self._first = 0
+        self._selected = -1
+        self.appendRows(rows)
+
+    def appendRows(self, rows):
+        """Adds the rows from an iterable of sequences to the end."""
+        width = len(self._columns)
+        padding = ("",) * width
+        rows = iter(rows)
+        while True:
+            # A batch at a time, so the rows are never all in Python lists
+            batch = [tuple(row) + padding[len(row):] if len(row) < width else row
+                     for row in islice(rows, 10000)]
+            if not batch:
+                break
+            for index, column in enumerate(self._columns):
+                column.extend([row[index] for row in batch])
+        self._render()
+
+    def clear(self):
+        """Deletes all the rows."""
+        self.setRows(())
+
+    def getRow(self, index):
+        """Returns the row at the index as a tuple."""
+        return tuple(column[index] for column in self._columns)
+
+    def getColumn(self, column):
+        """Returns the values in a column as a read-only sequence."""
+        return self._columns[column]
+
+    def getSelectedIndex(self):
+        """Returns the index of the selected row or -1 if no row
+        is selected."""
+        return self._selected
+
+    def getSelectedRow(self):
+        """Returns the selected row or None if no row is selected."""
+        if self._selected == -1:
+            return None
+        return self.getRow(self._selected)
+
+    def setSelectedIndex(self, index):
+        """Selects the row at the index if it's in the range, scrolling
+        it into view."""
+        if index < 0 or index >= self.rowCount(): return
+        self._selected = index
+        if index < self._first:
+            self._first = index
+        elif index >= self._first + self._height:
+            self._first = index - self._height + 1
+        self._render()
+
+    def getFirstVisible(self):
+        """Returns the index of the top row on screen."""
+        return self._first
+
+    def scrollTo(self, index):
+        """Scrolls so that the row at the index is at the top, or as near
+        the top as the number of rows allows."""
+        self._first = max(0, min(index, self.rowCount() - self._height))
+        self._render()
+
+    def _render(self):
+        """Shows the visible rows: one Tcl call per column, plus the
+        scroll bar and selection."""
+        first = self._first
+        last = first + self._height
+        for view, column in zip(self._views, self._columns):
+            view.set(tuple(column[first:last]))
+        total = self.rowCount()
+        if total > self._height:
+            self._yScroll.set(first / float(total), min(last, total) / float(total))
+        else:
+            self._yScroll.set(0, 1)
+        visible = first <= self._selected < last
+        for listBox in self._listBoxes:
+            listBox.selection_clear(0, END)
+            if visible:
+                listBox.selection_set(self._selected - first)
+
+    def _resized(self, event):
+        """Shows as many rows as now fit in the list boxes."""
+        listBox = event.widget
+        inset = int(listBox["borderwidth"]) + int(listBox["highlightthickness"])
+        lineHeight = int(listBox.tk.call("font", "metrics", listBox["font"],
+                                         "-linespace")) + 1
+        height = max(1, (event.height - 2 * inset) // lineHeight)
+        if height != self._height:
+            self._height = height
+            self.scrollTo(self._first)
+
+    def _scrollbarMoved(self, *args):
+        if args[0] == "moveto":
+            self.scrollTo(int(float(args[1]) * self.rowCount()))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self._height
+            self._step(amount)
+
+    def _step(self, amount):
+        self.scrollTo(self._first + amount)
+        return "break"
+
+    def _wheel(self, event):
+        # Windows reports multiples of 120, macOS reports small steps
+        amount = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._step(-3 * amount)
+
+    def _moveSelection(self, amount):
+        if self._selected == -1:
+            self.setSelectedIndex(self._first)
+        else:
+            self.setSelectedIndex(self._selected + amount)
+        if self._selected != -1:
+            self._rowSelected(self._selected)
+        return "break"
+
+    def _listBoxSelected(self, event):
+        selection = event.widget.curselection()
+        if len(selection) == 0: return
+        index = self._first + int(selection[0])
+        if index >= self.rowCount(): return
+        self._selected = index
+        self._render()
+        self._rowSelected(index)
+
 class EasyRadiobuttonGroup(Tkinter.Frame):
     """Represents a group of radio buttons, only one of which
     is selected at any given time."""
@@ -594,16 +1245,52 @@ class EasyMenuItem(object):
         self._menu.menu.entryconfigure(self._index, state = state)
         
 
+# Tcl procedure behind EasyCanvas's batch methods.  Creates one item of
+# the type for every size coordinates in the list, all with the same
+# options, and returns the item numbers.
+_DRAW_MANY = """
+proc ::breezyDrawMany {canvas type size coords args} {
+    set items {}
+    set last [expr {[llength $coords] - $size}]
+    for {set i 0} {$i <= $last} {incr i $size} {
+        lappend items [$canvas create $type \\
+            {*}[lrange $coords $i [expr {$i + $size - 1}]] {*}$args]
+    }
+    return $items
+}
+"""
+
+def _flatCoordinates(coordinates):
+    """Returns the coordinates as one flat tuple.  Takes a flat sequence
+    of numbers or a sequence of points or shapes (tuples, lists, or
+    arrays of numbers)."""
+    coordinates = tuple(coordinates)
+    if coordinates and hasattr(coordinates[0], "__len__"):
+        coordinates = tuple(value for shape in coordinates for value in shape)
+    return coordinates
+
+def _itemOptions(**options):
+    """Returns the options that are not None as a flat tuple of
+    -name value pairs, as Tcl expects them."""
+    flat = ()
+    for name, value in options.items():
+        if value is not None:
+            flat += ("-" + name, value)
+    return flat
+
 class EasyCanvas(Tkinter.Canvas):
     """Represents a rectangular area for interactive drawing of shapes.
     Supports simple commands for drawing lines, rectangles, and ovals,
-    as well as methods for responding to mouse events in the canvas."""
+    as well as methods for responding to mouse events in the canvas.
+    The batch methods draw many shapes with one Tcl call, and tags
+    let many items be moved, changed, or deleted at once."""
 
     def __init__(self, parent, width = None, height = None,
                  background = "white"):
         Tkinter.Canvas.__init__(self, parent,
                                 width = width, height = height,
                                 background = background)
+        self.tk.eval(_DRAW_MANY)
         self.bind("<Double-Button-1>", self.mouseDoubleClicked)
         self.bind("<ButtonPress-1>", self.mousePressed)
         self.bind("<ButtonRelease-1>", self.mouseReleased)
@@ -644,359 +1331,440 @@ class EasyCanvas(Tkinter.Canvas):
         return self["height"]
 
     def drawLine(self, x0, y0, x1, y1,
-                 fill = "black", width = 1):
-        item = self.create_line(x0, y0, x1, y1)
-        self.itemconfig(item, fill = fill, width = width)
-        return item
+                 fill = "black", width = 1, tags = None):
+        """Draws a line between the given points, with the given
+        color and width."""
+        return self.create_line(x0, y0, x1, y1, fill = fill, width = width,
+                                tags = tags)
 
     def drawRectangle(self, x0, y0, x1, y1,
-                      outline = "black", fill = None):
+                      outline = "black", fill = None, tags = None):
         """Draws a rectangle with the given corner points,
         outline color, and fill color."""
-        item = self.create_rectangle(x0, y0, x1, y1)
-        self.itemconfig(item, outline = outline, fill = fill)
-        return item
+        return self.create_rectangle(x0, y0, x1, y1, outline = outline,
+                                     fill = fill, tags = tags)
 
     def drawOval(self, x0, y0, x1, y1,
-                 outline = "black", fill = None):
+                 outline = "black", fill = None, tags = None):
         """Draws an ovel within the given corner points,
         with the given outline color and fill color."""
-        item = self.create_oval(x0, y0, x1, y1)
-        self.itemconfig(item, outline = outline, fill = fill)
-        return item
+        return self.create_oval(x0, y0, x1, y1, outline = outline,
+                                fill = fill, tags = tags)
 
-    def drawText(self, text, x, y, fill = "black"):
+    def drawText(self, text, x, y, fill = "black", tags = None):
         """Draws the given text (a string) at the given coordinates
         with the given fill color.  The string is centered vertically
         and horizontally at the given coordinates."""
-        item = self.create_text(x, y)
-        self.itemconfig(item, text = text, fill = fill)
-        return item
+        return self.create_text(x, y, text = text, fill = fill, tags = tags)
 
-    def drawImage(self, image, x, y, anchor = CENTER):
+    def drawImage(self, image, x, y, anchor = CENTER, tags = None):
         """Draws the given image (a PhotoImage) at the given coordinates.
         The image is centered at the given coordinates by default."""
-        item = self.create_image(x, y, image = image,
-                                 anchor = anchor)
-        self.itemconfig(item, image = image, anchor = anchor)
-        return item
+        return self.create_image(x, y, image = image, anchor = anchor,
+                                 tags = tags)
+
+    # Batch drawing methods.  Each takes the coordinates of many shapes,
+    # either as one flat sequence (x0, y0, x1, y1, x0, y0, ...) or as a
+    # sequence of (x0, y0, x1, y1) shapes, draws them all with the same
+    # options in one Tcl call, and returns a tuple of their item numbers.
+    # Give the batch a tag to move, change, or delete it later as a unit.
+
+    def _drawMany(self, type, coordinates, **options):
+        items = self.tk.call("::breezyDrawMany", self._w, type, 4,
+                             _flatCoordinates(coordinates),
+                             *_itemOptions(**options))
+        return self.tk.splitlist(items)
+
+    def drawLines(self, coordinates, fill = "black", width = 1, tags = None):
+        """Draws a separate line for every x0, y0, x1, y1 in the
+        coordinates."""
+        return self._drawMany("line", coordinates, fill = fill,
+                              width = width, tags = tags)
+
+    def drawRectangles(self, coordinates, outline = "black", fill = None,
+                       tags = None):
+        """Draws a rectangle for every x0, y0, x1, y1 in the
+        coordinates."""
+        return self._drawMany("rectangle", coordinates, outline = outline,
+                              fill = fill, tags = tags)
+
+    def drawOvals(self, coordinates, outline = "black", fill = None,
+                  tags = None):
+        """Draws an oval for every x0, y0, x1, y1 in the coordinates."""
+        return self._drawMany("oval", coordinates, outline = outline,
+                              fill = fill, tags = tags)
+
+    def drawPolyline(self, coordinates, fill = "black", width = 1,
+                     tags = None):
+        """Draws one line through all the points in the coordinates,
+        given flat (x0, y0, x1, y1, ...) or as (x, y) points, and
+        returns its item number."""
+        return self.create_line(_flatCoordinates(coordinates), fill = fill,
+                                width = width, tags = tags)
 
     def deleteItem(self, item):
         """Removes and erases the shape with the given item
         number from the canvas."""
         self.delete(item)
 
-# Support classes for dialogs.
-
-class MessageBox(tkSimpleDialog.Dialog):
-    """Represents a message dialog with a scrollable text area."""
-
-    @classmethod
-    def message(cls, title = "", message = "", width = 25, height = 5):
-        MessageBox(Tkinter.Frame(), title, message, width, height)
-
-    def __init__(self, parent, title, message, width, height):
-        """Set up the window and widgets."""
-        self._message = message
-        self._width = width
-        self._height = height
-        self._modified = False
-        tkSimpleDialog.Dialog.__init__(self, parent, title)
-
-    def body(self, master):
-        self.resizable(0, 0)
-        yScroll = Tkinter.Scrollbar(master, orient = VERTICAL)
-        yScroll.grid(row = 0, column = 1, sticky = N+S)
-        output = Tkinter.Text(master, width = self._width, height = self._height,
-                      padx = 5, pady = 5, wrap = WORD,
-                      yscrollcommand = yScroll.set)
-        output.grid(row = 0, column = 0, sticky = N+W+S+E)
-        output.insert("1.0", self._message)
-        output["state"] = DISABLED
-        yScroll["command"] = output.yview
-        return output
-
-    def buttonbox(self):
-        '''add standard button box.
-        override if you do not want the standard buttons'''
-        box = Tkinter.Frame(self)
-        w = Tkinter.Button(box, text="OK", width = 10,
-                           command = self.ok, default = ACTIVE)
-        w.pack()
-        self.bind("<Return>", self.ok)
-        box.pack()
-
-    def apply(self):
-        """Quits the dialog."""
-        self._modified = True
-
-    def modified(self):
-        return self._modified
-
-class PrompterBox(tkSimpleDialog.Dialog):
-    """Represents an input dialog with a text field."""
-
-    @classmethod
-    def prompt(cls, title = "", promptString = "", inputText = "", fieldWidth = 20):
-        """Creates and pops up an input dialog."""
-        dlg = PrompterBox(Tkinter.Frame(), title, promptString, inputText, fieldWidth)
-        return dlg.getText()
+    # Tag methods.  A tag (a string) names every item drawn with it,
+    # so each of these is one Tcl call however many items there are.
 
-    def __init__(self, parent, title, promptString, inputText, fieldWidth):
-        """Set up the window and widgets."""
-        self._prompt = promptString
-        self._text = inputText
-        self._width = fieldWidth
-        self._modified = False
-        tkSimpleDialog.Dialog.__init__(self, parent, title)
-
-    def body(self, master):
-        self.resizable(0, 0)
-        label = Tkinter.Label(master, text = self._prompt)
-        label.grid(row = 0, column = 0, padx = 5, sticky = N+W+S+E)
-        self._field = TextField(master, self._text, self._width, NORMAL)
-        self._field.grid(row = 1, column = 0, padx = 5, sticky = N+W+S+E)
-        return self._field
-
-    def buttonbox(self):
-        '''add standard button box.
-        override if you do not want the standard buttons'''
-        box = Tkinter.Frame(self)
-        w = Tkinter.Button(box, text="OK", width = 10,
-                           command = self.ok, default = ACTIVE)
-        w.pack()
-        self.bind("<Return>", self.ok)
-        box.pack()
-
-    def apply(self):
-        """Quits the dialog."""
-        self._modified = True
-
-    def modified(self):
-        return self._modified
+    def moveTag(self, tag, dx, dy):
+        """Moves every item with the tag by dx and dy."""
+        self.move(tag, dx, dy)
 
-    def getText(self):
-        """Returns the text currently in the text field."""
-        return self._field.getText()
+    def configureTag(self, tag, **options):
+        """Changes options, such as fill or outline, of every item
+        with the tag."""
+        self.itemconfig(tag, **options)
 
-class EasyDialog(tkSimpleDialog.Dialog):
-    """Represents a general-purpose dialog.  Subclasses should include
-    body and apply methods."""
+    def deleteTag(self, tag):
+        """Removes and erases every item with the tag."""
+        self.delete(tag)
 
-    def __init__(self, parent, title = ""):
-        """Set up the window and widgets."""
-        self._modified = False
-        tkSimpleDialog.Dialog.__init__(self, parent, title)
+    def deleteAll(self):
+        """Removes and erases every item on the canvas."""
+        self.delete("all")
 
-    def modified(self):
-        """Returns the modified status of the dialog."""
-        return self._modified
-
-    def setModified(self):
-        self._modified = True
-
-    def addLabel(self, master, text, row, column,
-                 columnspan = 1, rowspan = 1,
-                 sticky = N+W, font = None):
-        """Creates and inserts a label at the row and column,
-        and returns the label."""
-        label = Tkinter.Label(master, text = text, font = font)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        label.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return label
-
-    def addButton(self, master, text, row, column,
-                  columnspan = 1, rowspan = 1,
-                  command = lambda: None,
-                  state = NORMAL):
-        """Creates and inserts a button at the row and column,
-        and returns the button."""
-        button = Tkinter.Button(master, text = text,
-                                command = command, state = state)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        button.grid(row = row, column = column,
-                    columnspan = columnspan, rowspan = rowspan,
-                    padx = 5, pady = 5)
-        return button
+# Support classes for dialogs.
 
-    def addFloatField(self, master, value, row, column,
+def _defineDialogs():
+    """Imports tkSimpleDialog and defines MessageBox, PrompterBox,
+    and EasyDialog.  Runs the first time one of them is used."""
+    global tkSimpleDialog, MessageBox, PrompterBox, EasyDialog
+    if versionNumber == 3:
+        import tkinter.simpledialog as tkSimpleDialog
+    else:
+        import tkSimpleDialog
+
+    class MessageBox(tkSimpleDialog.Dialog):
+        """Represents a message dialog with a scrollable text area."""
+
+        @classmethod
+        def message(cls, title = "", message = "", width = 25, height = 5):
+            MessageBox(Tkinter.Frame(), title, message, width, height)
+
+        def __init__(self, parent, title, message, width, height):
+            """Set up the window and widgets."""
+            self._message = message
+            self._width = width
+            self._height = height
+            self._modified = False
+            tkSimpleDialog.Dialog.__init__(self, parent, title)
+
+        def body(self, master):
+            self.resizable(0, 0)
+            yScroll = Tkinter.Scrollbar(master, orient = VERTICAL)
+            yScroll.grid(row = 0, column = 1, sticky = N+S)
+            output = Tkinter.Text(master, width = self._width, height = self._height,
+                          padx = 5, pady = 5, wrap = WORD,
+                          yscrollcommand = yScroll.set)
+            output.grid(row = 0, column = 0, sticky = N+W+S+E)
+            output.insert("1.0", self._message)
+            output["state"] = DISABLED
+            yScroll["command"] = output.yview
+            return output
+
+        def buttonbox(self):
+            '''add standard button box.
+            override if you do not want the standard buttons'''
+            box = Tkinter.Frame(self)
+            w = Tkinter.Button(box, text="OK", width = 10,
+                               command = self.ok, default = ACTIVE)
+            w.pack()
+            self.bind("<Return>", self.ok)
+            box.pack()
+
+        def apply(self):
+            """Quits the dialog."""
+            self._modified = True
+
+        def modified(self):
+            return self._modified
+
+    class PrompterBox(tkSimpleDialog.Dialog):
+        """Represents an input dialog with a text field."""
+
+        @classmethod
+        def prompt(cls, title = "", promptString = "", inputText = "", fieldWidth = 20):
+            """Creates and pops up an input dialog."""
+            dlg = PrompterBox(Tkinter.Frame(), title, promptString, inputText, fieldWidth)
+            return dlg.getText()
+
+        def __init__(self, parent, title, promptString, inputText, fieldWidth):
+            """Set up the window and widgets."""
+            self._prompt = promptString
+            self._text = inputText
+            self._width = fieldWidth
+            self._modified = False
+            tkSimpleDialog.Dialog.__init__(self, parent, title)
+
+        def body(self, master):
+            self.resizable(0, 0)
+            label = Tkinter.Label(master, text = self._prompt)
+            label.grid(row = 0, column = 0, padx = 5, sticky = N+W+S+E)
+            self._field = TextField(master, self._text, self._width, NORMAL)
+            self._field.grid(row = 1, column = 0, padx = 5, sticky = N+W+S+E)
+            return self._field
+
+        def buttonbox(self):
+            '''add standard button box.
+            override if you do not want the standard buttons'''
+            box = Tkinter.Frame(self)
+            w = Tkinter.Button(box, text="OK", width = 10,
+                               command = self.ok, default = ACTIVE)
+            w.pack()
+            self.bind("<Return>", self.ok)
+            box.pack()
+
+        def apply(self):
+            """Quits the dialog."""
+            self._modified = True
+
+        def modified(self):
+            return self._modified
+
+        def getText(self):
+            """Returns the text currently in the text field."""
+            return self._field.getText()
+
+    class EasyDialog(tkSimpleDialog.Dialog):
+        """Represents a general-purpose dialog.  Subclasses should include
+        body and apply methods."""
+
+        def __init__(self, parent, title = ""):
+            """Set up the window and widgets."""
+            self._modified = False
+            tkSimpleDialog.Dialog.__init__(self, parent, title)
+
+        def modified(self):
+            """Returns the modified status of the dialog."""
+            return self._modified
+
+        def setModified(self):
+            self._modified = True
+
+        def addLabel(self, master, text, row, column,
+                     columnspan = 1, rowspan = 1,
+                     sticky = N+W, font = None):
+            """Creates and inserts a label at the row and column,
+            and returns the label."""
+            label = Tkinter.Label(master, text = text, font = font)
+            master.rowconfigure(row, weight = 1)
+            master.columnconfigure(column, weight = 1)
+            label.grid(row = row, column = column,
+                       columnspan = columnspan, rowspan = rowspan,
+                       padx = 5, pady = 5, sticky = sticky)
+            return label
+
+        def addButton(self, master, text, row, column,
                       columnspan = 1, rowspan = 1,
-                      width = 20, precision = None,
-                      sticky = N+E, state = NORMAL):
-        """Creates and inserts a float field at the row and column,
-        and returns the float field."""
-        field = FloatField(master, value, width, precision, state)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return field
-
-    def addIntegerField(self, master, value, row, column,
+                      command = lambda: None,
+                      state = NORMAL):
+            """Creates and inserts a button at the row and column,
+            and returns the button."""
+            button = Tkinter.Button(master, text = text,
+                                    command = command, state = state)
+            master.rowconfigure(row, weight = 1)
+            master.columnconfigure(column, weight = 1)
+            button.grid(row = row, column = column,
+                        columnspan = columnspan, rowspan = rowspan,
+                        padx = 5, pady = 5)
+            return button
+
+        def addFloatField(self, master, value, row, column,
+                          columnspan = 1, rowspan = 1,
+                          width = 20, precision = None,
+                          sticky = N+E, state = NORMAL):
+            """Creates and inserts a float field at the row and column,
+            and returns the float field."""
+            field = FloatField(master, value, width, precision, state)
+            master.rowconfigure(row, weight = 1)
+            master.columnconfigure(column, weight = 1)
+            field.grid(row = row, column = column,
+                       columnspan = columnspan, rowspan = rowspan,
+                       padx = 5, pady = 5, sticky = sticky)
+            return field
+
+        def addIntegerField(self, master, value, row, column,
+                            columnspan = 1, rowspan = 1,
+                            width = 10, sticky = N+E, state = NORMAL):
+            """Creates and inserts an integer field at the row and column,
+            and returns the integer field."""
+            field = IntegerField(master, value, width, state)
+            master.rowconfigure(row, weight = 1)
+            master.columnconfigure(column, weight = 1)
+            field.grid(row = row, column = column,
+                       columnspan = columnspan, rowspan = rowspan,
+                       padx = 5, pady = 5, sticky = sticky)
+            return field
+
+        def addTextField(self, master, text, row, column,
+                         columnspan = 1, rowspan = 1,
+                         width = 20, sticky = N+E, state = NORMAL):
+            """Creates and inserts a text field at the row and column,
+            and returns the text field."""
+            field = TextField(master, text, width, state)
+            master.rowconfigure(row, weight = 1)
+            master.columnconfigure(column, weight = 1)
+            field.grid(row = row, column = column,
+                       columnspan = columnspan, rowspan = rowspan,
+                       padx = 5, pady = 5, sticky = sticky)
+            return field
+
+        def addCheckbutton(self, master, text, row, column,
+                           rowspan = 1, columnspan = 1,
+                           sticky = N+S+E+W, command = lambda : 0):
+            """Creates and inserts check button at the row and column,
+            and returns the check button."""
+            cb = EasyCheckbutton(master, text, command)
+            master.rowconfigure(row, weight = 1)
+            master.columnconfigure(column, weight = 1)
+            cb.grid(row = row, column = column,
+                    columnspan = columnspan, rowspan = rowspan,
+                       padx = 5, pady = 5, sticky = sticky)
+            return cb
+
+        def addRadiobuttonGroup(self, master, row, column,
+                                rowspan = 1, columnspan = 1, orient = VERTICAL):
+            """Creates and returns a radio button group."""
+            return EasyRadiobuttonGroup(master, row, column, rowspan, columnspan, orient)
+
+        def addScale(self, master, row, column, rowspan = 1, columnspan = 1,
+                     command = lambda value: value, from_ = 0, to = 0,
+                     label = "", length = 100, orient = HORIZONTAL,
+                     resolution = 1, tickinterval = 0):
+            """Creates and inserts a scale at the row and column,
+            and returns the scale."""
+            scale = Tkinter.Scale(master, command = command, from_ = from_, to = to,
+                                  label = label, length = length,
+                                  orient = orient, resolution = resolution,
+                                  tickinterval = tickinterval, relief = "sunken",
+                                  borderwidth = 4)
+            master.rowconfigure(row, weight = 1)
+            master.columnconfigure(column, weight = 1)
+            scale.grid(row = row, column = column, columnspan = columnspan,
+                       rowspan = rowspan, sticky = N+S+E+W)
+            return scale
+
+        def addTextArea(self, master, text, row, column, rowspan = 1, columnspan = 1,
+                        width = 80, height = 5, wrap = NONE,
+                        interval = None, maxLines = None):
+            """Creates and inserts a multiline text area at the row and column,
+            and returns the text area.  Vertical and horizontal scrollbars are
+            provided.  If interval is given, appended text is buffered and
+            written every interval milliseconds.  If maxLines is given, only
+            the last maxLines lines are kept."""
+            frame = Tkinter.Frame(master)
+            frame.grid(row = row, column = column,
+                       columnspan = columnspan, rowspan = rowspan,
+                       sticky = N+S+E+W)
+            master.columnconfigure(column, weight = 1)
+            master.rowconfigure(row, weight = 1)
+            xScroll = Tkinter.Scrollbar(frame, orient = HORIZONTAL)
+            xScroll.grid(row = 1, column = 0, sticky = E+W)
+            yScroll = Tkinter.Scrollbar(frame, orient = VERTICAL)
+            yScroll.grid(row = 0, column = 1, sticky = N+S)
+            area = TextArea(frame, text, width, height,
+                            xScroll.set, yScroll.set, wrap,
+                            interval, maxLines)
+            area.grid(row = 0, column = 0,
+                      padx = 5, pady = 5, sticky = N+S+E+W)
+            frame.columnconfigure(0, weight = 1)
+            frame.rowconfigure(0, weight = 1)
+            xScroll["command"] = area.xview
+            yScroll["command"] = area.yview
+            return area
+
+        # Added 08-15-2019
+        def addCombobox(self, text, values, row, column, 
                         columnspan = 1, rowspan = 1,
-                        width = 10, sticky = N+E, state = NORMAL):
-        """Creates and inserts an integer field at the row and column,
-        and returns the integer field."""
-        field = IntegerField(master, value, width, state)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return field
-
-    def addTextField(self, master, text, row, column,
-                     columnspan = 1, rowspan = 1,
-                     width = 20, sticky = N+E, state = NORMAL):
-        """Creates and inserts a text field at the row and column,
-        and returns the text field."""
-        field = TextField(master, text, width, state)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return field
-
-    def addCheckbutton(self, master, text, row, column,
-                       rowspan = 1, columnspan = 1,
-                       sticky = N+S+E+W, command = lambda : 0):
-        """Creates and inserts check button at the row and column,
-        and returns the check button."""
-        cb = EasyCheckbutton(master, text, command)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        cb.grid(row = row, column = column,
-                columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return cb
-
-    def addRadiobuttonGroup(self, master, row, column,
-                            rowspan = 1, columnspan = 1, orient = VERTICAL):
-        """Creates and returns a radio button group."""
-        return EasyRadiobuttonGroup(master, row, column, rowspan, columnspan, orient)
+                        sticky = N+E, command = lambda: None):
+            """Creates and inserts a combo box at the row and column,
+            and returns the combo box."""
+            box = _lazyGlobal("EasyCombobox")(self, text, values, command)
+            self.rowconfigure(row, weight = 1)
+            self.columnconfigure(column, weight = 1)
+            box.grid(row = row, column = column,
+                       columnspan = columnspan, rowspan = rowspan,
+                       padx = 5, pady = 5, sticky = sticky)
+            return box
+
+        def addListbox(self, master, row, column, rowspan = 1, columnspan = 1,
+                       width = 10, height = 5, listItemSelected = lambda index: index,
+                       indexed = False):
+            """Creates and inserts a scrolling list box at the row and column, with a
+            width and height in lines and columns of text, and a default item selection
+            method, and returns the list box.  If indexed is True, the list box keeps
+            a dict of its items for fast getIndex calls."""
+            frame = Tkinter.Frame(master)
+            frame.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
+                       sticky = N+S+E+W)
+            master.columnconfigure(column, weight = 1)
+            master.rowconfigure(row, weight = 1)
+            yScroll = Tkinter.Scrollbar(frame, orient = VERTICAL)
+            yScroll.grid(row = 0, column = 1, sticky = N+S)
+            listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected,
+                                  indexed)
+            listBox.grid(row = 0, column = 0, sticky = N+S+E+W)
+            frame.columnconfigure(0, weight = 1)
+            frame.rowconfigure(0, weight = 1)
+            yScroll["command"] = listBox.yview
+            return listBox
+
+        def addTable(self, master, headings, row, column, rowspan = 1, columnspan = 1,
+                     width = 12, height = 10, rowSelected = lambda index: index):
+            """Creates and inserts a scrolling table with the column headings at
+            the row and column, with a column width (one number for every column,
+            or one per column) and a starting height in rows, and a default row
+            selection method, and returns the table."""
+            table = EasyTable(master, headings, width, height, rowSelected)
+            table.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
+                       sticky = N+S+E+W)
+            master.columnconfigure(column, weight = 1)
+            master.rowconfigure(row, weight = 1)
+            return table
+
+        def addCanvas(self, master, canvas = None, row = 0, column = 0,
+                      rowspan = 1, columnspan = 1, width = 200, height = 100,
+                      background = "white"):
+            """Creates and inserts a canvas at the row and column,
+            and returns the canvas."""
+            if not canvas:
+                canvas = EasyCanvas(master, width = width, height = height,
+                                    background = background)
+            canvas.grid(row = row, column = column,
+                        rowspan = rowspan, columnspan = columnspan,
+                        sticky = W+E+N+S)
+            master.columnconfigure(column, weight = 10)
+            master.rowconfigure(row, weight = 10)
+            return canvas
+
+        def addMenuBar(self, master, row, column, rowspan = 1, columnspan = 1,
+                       orient = "horizontal"):
+            """Creates and inserts a menu bar at the row and column,
+            and returns the menu bar."""
+            if not orient in ("horizontal", "vertical"):
+                raise ValueError("orient must be horizontal or vertical")
+            menuBar = EasyMenuBar(master, orient)
+            menuBar.grid(row = row, column = column,
+                         rowspan = rowspan, columnspan = columnspan,
+                         sticky = N+W)
+            return menuBar
+
+        def messageBox(self, title = "", message = "", width = 25, height = 5):
+            """Creates and pops up a message box, with the given title,
+            message, and width and height in rows and columns of text."""
+            dlg = MessageBox(self, title, message, width, height)
+            return dlg.modified()
+
+            # Added 12-18-2012
+        def addPanel(self, master, row, column,
+                     rowspan = 1, columnspan = 1, background = "white"):
+            """Creates and returns a panel."""
+            return EasyPanel(master, row, column, rowspan, columnspan, background)
 
-    def addScale(self, master, row, column, rowspan = 1, columnspan = 1,
-                 command = lambda value: value, from_ = 0, to = 0,
-                 label = "", length = 100, orient = HORIZONTAL,
-                 resolution = 1, tickinterval = 0):
-        """Creates and inserts a scale at the row and column,
-        and returns the scale."""
-        scale = Tkinter.Scale(master, command = command, from_ = from_, to = to,
-                              label = label, length = length,
-                              orient = orient, resolution = resolution,
-                              tickinterval = tickinterval, relief = "sunken",
-                              borderwidth = 4)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        scale.grid(row = row, column = column, columnspan = columnspan,
-                   rowspan = rowspan, sticky = N+S+E+W)
-        return scale
-
-    def addTextArea(self, master, text, row, column, rowspan = 1, columnspan = 1,
-                    width = 80, height = 5, wrap = NONE):
-        """Creates and inserts a multiline text area at the row and column,
-        and returns the text area.  Vertical and horizontal scrollbars are
-        provided."""
-        frame = Tkinter.Frame(master)
-        frame.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   sticky = N+S+E+W)
-        master.columnconfigure(column, weight = 1)
-        master.rowconfigure(row, weight = 1)
-        xScroll = Tkinter.Scrollbar(frame, orient = HORIZONTAL)
-        xScroll.grid(row = 1, column = 0, sticky = E+W)
-        yScroll = Tkinter.Scrollbar(frame, orient = VERTICAL)
-        yScroll.grid(row = 0, column = 1, sticky = N+S)
-        area = TextArea(frame, text, width, height,
-                        xScroll.set, yScroll.set, wrap)
-        area.grid(row = 0, column = 0,
-                  padx = 5, pady = 5, sticky = N+S+E+W)
-        frame.columnconfigure(0, weight = 1)
-        frame.rowconfigure(0, weight = 1)
-        xScroll["command"] = area.xview
-        yScroll["command"] = area.yview
-        return area
-
-    # Added 08-15-2019
-    def addCombobox(self, text, values, row, column, 
-                    columnspan = 1, rowspan = 1,
-                    sticky = N+E, command = lambda: None):
-        """Creates and inserts a combo box at the row and column,
-        and returns the combo box."""
-        box = EasyCombobox(self, text, values, command)
-        self.rowconfigure(row, weight = 1)
-        self.columnconfigure(column, weight = 1)
-        box.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return box
-
-    def addListbox(self, master, row, column, rowspan = 1, columnspan = 1,
-                   width = 10, height = 5, listItemSelected = lambda index: index):
-        """Creates and inserts a scrolling list box at the row and column, with a
-        width and height in lines and columns of text, and a default item selection
-        method, and returns the list box."""
-        frame = Tkinter.Frame(master)
-        frame.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
-                   sticky = N+S+E+W)
-        master.columnconfigure(column, weight = 1)
-        master.rowconfigure(row, weight = 1)
-        yScroll = Tkinter.Scrollbar(frame, orient = VERTICAL)
-        yScroll.grid(row = 0, column = 1, sticky = N+S)
-        listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected)
-        listBox.grid(row = 0, column = 0, sticky = N+S+E+W)
-        frame.columnconfigure(0, weight = 1)
-        frame.rowconfigure(0, weight = 1)
-        yScroll["command"] = listBox.yview
-        return listBox
-
-    def addCanvas(self, master, canvas = None, row = 0, column = 0,
-                  rowspan = 1, columnspan = 1, width = 200, height = 100,
-                  background = "white"):
-        """Creates and inserts a canvas at the row and column,
-        and returns the canvas."""
-        if not canvas:
-            canvas = EasyCanvas(master, width = width, height = height,
-                                background = background)
-        canvas.grid(row = row, column = column,
-                    rowspan = rowspan, columnspan = columnspan,
-                    sticky = W+E+N+S)
-        master.columnconfigure(column, weight = 10)
-        master.rowconfigure(row, weight = 10)
-        return canvas
-
-    def addMenuBar(self, master, row, column, rowspan = 1, columnspan = 1,
-                   orient = "horizontal"):
-        """Creates and inserts a menu bar at the row and column,
-        and returns the menu bar."""
-        if not orient in ("horizontal", "vertical"):
-            raise ValueError("orient must be horizontal or vertical")
-        menuBar = EasyMenuBar(master, orient)
-        menuBar.grid(row = row, column = column,
-                     rowspan = rowspan, columnspan = columnspan,
-                     sticky = N+W)
-        return menuBar
-
-    def messageBox(self, title = "", message = "", width = 25, height = 5):
-        """Creates and pops up a message box, with the given title,
-        message, and width and height in rows and columns of text."""
-        dlg = MessageBox(self, title, message, width, height)
-        return dlg.modified()
-
-        # Added 12-18-2012
-    def addPanel(self, master, row, column,
-                 rowspan = 1, columnspan = 1, background = "white"):
-        """Creates and returns a panel."""
-        return EasyPanel(master, row, column, rowspan, columnspan, background)
-
-
- 
 # Added 12-18-2012
 class EasyPanel(Tkinter.Frame):
     """Organizes a group of widgets in a panel (nested frame)."""
@@ -1086,10 +1854,13 @@ class EasyPanel(Tkinter.Frame):
         return field
 
     def addTextArea(self, text, row, column, rowspan = 1, columnspan = 1,
-                    width = 80, height = 5, wrap = NONE):
+                    width = 80, height = 5, wrap = NONE,
+                    interval = None, maxLines = None):
         """Creates and inserts a multiline text area at the row and column,
         and returns the text area.  Vertical and horizontal scrollbars are
-        provided."""
+        provided.  If interval is given, appended text is buffered and
+        written every interval milliseconds.  If maxLines is given, only
+        the last maxLines lines are kept."""
         frame = Tkinter.Frame(self)
         frame.grid(row = row, column = column,
                    columnspan = columnspan, rowspan = rowspan,
@@ -1101,7 +1872,8 @@ class EasyPanel(Tkinter.Frame):
         yScroll = Tkinter.Scrollbar(frame, orient = VERTICAL)
         yScroll.grid(row = 0, column = 1, sticky = N+S)
         area = TextArea(frame, text, width, height,
-                        xScroll.set, yScroll.set, wrap)
+                        xScroll.set, yScroll.set, wrap,
+                        interval, maxLines)
         area.grid(row = 0, column = 0,
                   padx = 5, pady = 5, sticky = N+S+E+W)
         frame.columnconfigure(0, weight = 1)
@@ -1116,7 +1888,7 @@ class EasyPanel(Tkinter.Frame):
                     sticky = N+E, command = lambda: None):
         """Creates and inserts a combo box at the row and column,
         and returns the combo box."""
-        box = EasyCombobox(self, text, values, command)
+        box = _lazyGlobal("EasyCombobox")(self, text, values, command)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
         box.grid(row = row, column = column,
@@ -1125,10 +1897,12 @@ class EasyPanel(Tkinter.Frame):
         return box
 
     def addListbox(self, row, column, rowspan = 1, columnspan = 1,
-                   width = 10, height = 5, listItemSelected = lambda index: index):
+                   width = 10, height = 5, listItemSelected = lambda index: index,
+                   indexed = False):
         """Creates and inserts a scrolling list box at the row and column, with a
         width and height in lines and columns of text, and a default item selection
-        method, and returns the list box."""
+        method, and returns the list box.  If indexed is True, the list box keeps
+        a dict of its items for fast getIndex calls."""
         frame = Tkinter.Frame(self)
         frame.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
                    sticky = N+S+E+W)
@@ -1136,13 +1910,27 @@ class EasyPanel(Tkinter.Frame):
         self.rowconfigure(row, weight = 1)
         yScroll = Tkinter.Scrollbar(frame, orient = VERTICAL)
         yScroll.grid(row = 0, column = 1, sticky = N+S)
-        listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected)
+        listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected,
+                              indexed)
         listBox.grid(row = 0, column = 0, sticky = N+S+E+W)
         frame.columnconfigure(0, weight = 1)
         frame.rowconfigure(0, weight = 1)
         yScroll["command"] = listBox.yview
         return listBox
 
+    def addTable(self, headings, row, column, rowspan = 1, columnspan = 1,
+                 width = 12, height = 10, rowSelected = lambda index: index):
+        """Creates and inserts a scrolling table with the column headings at
+        the row and column, with a column width (one number for every column,
+        or one per column) and a starting height in rows, and a default row
+        selection method, and returns the table."""
+        table = EasyTable(self, headings, width, height, rowSelected)
+        table.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
+                   sticky = N+S+E+W)
+        self.columnconfigure(column, weight = 1)
+        self.rowconfigure(row, weight = 1)
+        return table
+
     def addCanvas(self, canvas = None, row = 0, column = 0,
                   rowspan = 1, columnspan = 1, width = 200, height = 100,
                   background = "white"):
@@ -1210,16 +1998,34 @@ class EasyPanel(Tkinter.Frame):
         """Creates and returns a panel."""
         return EasyPanel(self, row, column, rowspan, columnspan, background)
 
-
-
-
-
-    
-
-
-
-
-
-
-    
-        
+# Names defined on first use, and the function that defines each one.
+
+_LAZY_GLOBALS = {"tkSimpleDialog": _defineDialogs,
+                 "MessageBox": _defineDialogs,
+                 "PrompterBox": _defineDialogs,
+                 "EasyDialog": _defineDialogs,
+                 "ttk": _defineCombobox,
+                 "EasyCombobox": _defineCombobox}
+
+def _lazyGlobal(name):
+    """Returns the module global name, defining it first if needed."""
+    if not name in globals():
+        _LAZY_GLOBALS[name]()
+    return globals()[name]
+
+def __getattr__(name):
+    """Lets other modules use the lazily defined names as if they
+    were always there (Python 3.7 and later)."""
+    if name in _LAZY_GLOBALS:
+        return _lazyGlobal(name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+if sys.version_info < (3, 7):
+    # No module __getattr__, so define everything now
+    _defineDialogs()
+    _defineCombobox()
+
+# from breezypythongui import * still brings in every public name,
+# defining the lazy ones
+__all__ = [name for name in globals() if not name.startswith("_")] + \
+          [name for name in _LAZY_GLOBALS if not name in globals()]
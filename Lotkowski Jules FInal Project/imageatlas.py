@@ -0,0 +1,101 @@
+"""
+File: imageatlas.py
+Packs the calculator's images into a single atlas file and reads them back out of memory. Opening one file instead of 25 keeps
+start-up and the first result fast on slow or network-mounted disks. Does not use tkinter; the GUI turns the bytes into
+PhotoImages.
+
+Atlas layout: the 8-byte magic b"ZATLAS1\n", a 4-byte big-endian length, a UTF-8 JSON index of that length mapping each file
+name to [offset, length], then the image files back to back. Offsets count from the first byte after the index.
+
+Build step, run after changing any image: python imageatlas.py
+"""
+import json
+import os
+import struct
+import sys
+
+MAGIC = b"ZATLAS1\n"
+ATLAS_NAME = "images.atlas" # Built next to the images
+IMAGE_EXTENSIONS = (".png", ".gif")
+
+"""Packs image files from a folder into an atlas file. Takes the folder, the file names to pack (every PNG and GIF in the folder
+if not given), and the atlas path (ATLAS_NAME in the folder if not given). Returns the atlas path."""
+
+def buildAtlas(folder, names = None, path = None):
+    if names is None:
+        names = sorted(name for name in os.listdir(folder) if name.lower().endswith(IMAGE_EXTENSIONS))
+    path = path or os.path.join(folder, ATLAS_NAME)
+    index = {}
+    blobs = []
+    offset = 0
+    for name in names:
+        with open(os.path.join(folder, name), "rb") as f:
+            data = f.read()
+        index[name] = [offset, len(data)]
+        blobs.append(data)
+        offset += len(data)
+    indexBytes = json.dumps(index, sort_keys = True).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(MAGIC + struct.pack(">I", len(indexBytes)) + indexBytes)
+        f.writelines(blobs)
+    return path
+
+"""Returns (width, height) from the header of PNG or GIF file bytes, or None for any other format. Does not decode the image."""
+
+def imageSize(data):
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return struct.unpack(">II", data[16:24])
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return struct.unpack("<HH", data[6:10])
+    return None
+
+class ImageAtlas(object):
+    """An atlas file read into memory with one open and one read. Hands out the bytes of each packed image by name."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            contents = f.read()
+        if contents[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not an image atlas: " + path)
+        indexStart = len(MAGIC) + 4
+        indexLength = struct.unpack(">I", contents[len(MAGIC):indexStart])[0]
+        self.index = json.loads(contents[indexStart:indexStart + indexLength].decode("utf-8"))
+        self.contents = memoryview(contents)[indexStart + indexLength:] # Slicing the view does not copy the file
+
+    def __contains__(self, name):
+        return name in self.index
+
+    """Returns the packed file names"""
+
+    def names(self):
+        return list(self.index)
+
+    """Returns the bytes of a packed image file. Raises KeyError if it is not in the atlas."""
+
+    def data(self, name):
+        offset, length = self.index[name]
+        return self.contents[offset:offset + length].tobytes()
+
+    """Returns the (width, height) of a packed image, read from its header, or None if the format is not known"""
+
+    def size(self, name):
+        offset, length = self.index[name]
+        return imageSize(self.contents[offset:offset + min(length, 24)].tobytes())
+
+"""Opens the atlas in a folder, or returns None if there is none or it cannot be read"""
+
+def openAtlas(folder, name = ATLAS_NAME):
+    try:
+        return ImageAtlas(os.path.join(folder, name))
+    except (OSError, ValueError):
+        return None
+
+def main(argv = None):
+    argv = sys.argv[1:] if argv is None else argv
+    folder = argv[0] if argv else os.path.dirname(os.path.abspath(__file__))
+    path = buildAtlas(folder)
+    atlas = ImageAtlas(path)
+    print("Packed %d images into %s (%d bytes)" % (len(atlas.names()), path, os.path.getsize(path)))
+
+if __name__ == "__main__":
+    main()
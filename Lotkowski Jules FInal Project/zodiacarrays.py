@@ -0,0 +1,108 @@
+"""
+File: zodiacarrays.py
+Vectorized batch versions of the zodiac engine functions. Takes whole arrays of months, days, and years and returns arrays of
+sign and animal codes, with no Python-level loop per row. Codes are indexes into zodiacengine.ZODIAC_SIGNS and
+zodiacengine.ANIMALS.
+REQUIRES NUMPY! The rest of the calculator does not need it; only import this module where bulk work is done.
+"""
+import numpy as np
+from zodiacengine import ZODIAC_SIGNS, ANIMALS, CUSP_KEYS
+from zodiacengine import LUNAR_TABLE_FIRST_YEAR, LUNAR_NEW_YEAR_KEYS, LUNAR_NEW_YEAR_ORDINALS
+from zodiacengine import DAYS_IN_MONTH, VALID, BAD_YEAR, BAD_MONTH, BAD_DAY, NOT_LEAP_YEAR
+
+CODE_DTYPE = np.uint8 # Both code sets fit in a byte
+_CUSP_KEY_ARRAY = np.array(CUSP_KEYS, dtype = np.int32) # Cusp table as an array for searchsorted
+_SIGN_NAME_ARRAY = np.array(ZODIAC_SIGNS, dtype = object)
+_ANIMAL_NAME_ARRAY = np.array(ANIMALS, dtype = object)
+_LUNAR_KEY_ARRAY = np.frombuffer(LUNAR_NEW_YEAR_KEYS, dtype = np.uint8).astype(np.int32) # Lunar New Year date key per table year
+_LUNAR_ORDINAL_ARRAY = np.array(LUNAR_NEW_YEAR_ORDINALS, dtype = np.int64) # Lunar New Year day ordinal per table year
+_DAYS_IN_MONTH_ARRAY = np.array(DAYS_IN_MONTH, dtype = np.int64) # Indexed by month number, 0 is unused
+_EPOCH_ORDINAL = 719163 # date(1970, 1, 1).toordinal(), the zero point of numpy datetime64
+
+"""Validates whole arrays of dates without raising. Takes array-likes of months, days, and years. Returns a (valid, codes) pair:
+a boolean mask that is True for real dates, and a uint8 array of zodiacengine error codes (VALID where the mask is True). Uses
+the same checks and the same order as zodiacengine.dateErrorCode."""
+
+def validateDates(months, days, years):
+    months = np.asarray(months, dtype = np.int64)
+    days = np.asarray(days, dtype = np.int64)
+    years = np.asarray(years, dtype = np.int64)
+    badYear = years <= 0
+    badMonth = (months < 1) | (months > 12)
+    monthLengths = _DAYS_IN_MONTH_ARRAY[np.where(badMonth, 0, months)]
+    badDay = (days < 1) | (days > monthLengths)
+    leapYear = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    notLeapYear = (months == 2) & (days == 29) & ~leapYear
+    codes = np.select((badYear, badMonth, badDay, notLeapYear), (BAD_YEAR, BAD_MONTH, BAD_DAY, NOT_LEAP_YEAR), VALID).astype(CODE_DTYPE)
+    return codes == VALID, codes
+
+"""Returns an array of western sign codes. Takes array-likes of months and days. Expects validated dates."""
+
+def westernSignCodes(months, days):
+    keys = (np.asarray(months, dtype = np.int32) << 5) | np.asarray(days, dtype = np.int32) # Same packed keys as zodiacengine.dateKey
+    codes = np.searchsorted(_CUSP_KEY_ARRAY, keys, side = "right") # Number of cusps on or before each date
+    codes %= 12 # Past the last cusp wraps back around to Capricorn
+    return codes.astype(CODE_DTYPE)
+
+"""Returns an array of Chinese zodiac years. Takes array-likes of years, months, and days. Dates before that year's Lunar New Year
+belong to the previous year. Outside the Lunar New Year table the calendar year is used, like zodiacengine.lunarYear."""
+
+def lunarYears(years, months, days):
+    years = np.asarray(years, dtype = np.int64)
+    keys = (np.asarray(months, dtype = np.int32) << 5) | np.asarray(days, dtype = np.int32)
+    index = years - LUNAR_TABLE_FIRST_YEAR
+    inTable = (index >= 0) & (index < len(_LUNAR_KEY_ARRAY))
+    beforeNewYear = inTable & (keys < _LUNAR_KEY_ARRAY[np.clip(index, 0, len(_LUNAR_KEY_ARRAY) - 1)])
+    return years - beforeNewYear
+
+"""Returns an array of Chinese zodiac years for an array of day ordinals (date.toordinal()), using searchsorted over the Lunar
+New Year ordinals. Gives the same answers as zodiacengine.lunarYearFromOrdinal."""
+
+def lunarYearsFromOrdinals(ordinals):
+    ordinals = np.asarray(ordinals, dtype = np.int64)
+    index = np.searchsorted(_LUNAR_ORDINAL_ARRAY, ordinals, side = "right") # Number of Lunar New Years on or before each date
+    result = LUNAR_TABLE_FIRST_YEAR + index - 1
+    outside = (index == 0) | (index == len(_LUNAR_ORDINAL_ARRAY))
+    if outside.any(): # Rare: dates before 1900's or after 2101's Lunar New Year fall back to the calendar
+        result[outside] = lunarYears(*datePartsFromOrdinals(ordinals[outside]))
+    return result
+
+"""Returns an array of Chinese zodiac animal codes. Takes an array-like of years, and optionally months and days. Without months
+and days only the calendar year is used, which is wrong for dates before Lunar New Year."""
+
+def chineseAnimalCodes(years, months = None, days = None):
+    if months is not None:
+        years = lunarYears(years, months, days)
+    return np.mod(np.asarray(years, dtype = np.int64), 12).astype(CODE_DTYPE)
+
+"""Returns a (sign codes, animal codes) pair of arrays. Takes array-likes of months, days, and years of the same length."""
+
+def calculateBatch(months, days, years):
+    return westernSignCodes(months, days), chineseAnimalCodes(years, months, days)
+
+"""Returns (years, months, days) arrays for an array of day ordinals (date.toordinal())"""
+
+def datePartsFromOrdinals(ordinals):
+    days = (np.asarray(ordinals, dtype = np.int64) - _EPOCH_ORDINAL).astype("datetime64[D]")
+    monthStarts = days.astype("datetime64[M]")
+    years = days.astype("datetime64[Y]").astype(np.int64) + 1970
+    months = monthStarts.astype(np.int64) % 12 + 1
+    monthDays = (days - monthStarts).astype(np.int64) + 1
+    return years, months, monthDays
+
+"""Returns a (sign codes, animal codes) pair of arrays for an array of day ordinals (date.toordinal())"""
+
+def calculateFromOrdinals(ordinals):
+    years, months, days = datePartsFromOrdinals(ordinals)
+    animals = np.mod(lunarYearsFromOrdinals(ordinals), 12).astype(CODE_DTYPE)
+    return westernSignCodes(months, days), animals
+
+"""Returns an array of sign names for an array of sign codes"""
+
+def signNames(codes):
+    return _SIGN_NAME_ARRAY[np.asarray(codes, dtype = np.intp)]
+
+"""Returns an array of animal names for an array of animal codes"""
+
+def animalNames(codes):
+    return _ANIMAL_NAME_ARRAY[np.asarray(codes, dtype = np.intp)]
@@ -0,0 +1,280 @@
+"""
+File: zodiacbatch.py
+Command-line batch mode for the zodiac calculator. Reads birth dates from a file or stdin, as CSV or JSONL, and writes each row
+back out to stdout with the western sign, Chinese animal, and their descriptions added. Works as a chain of generators, one
+row at a time, so memory stays flat no matter how big the input is. Does not use tkinter.
+
+CSV input needs month, day, and year columns. By default the first row is a header naming them (in any order, other columns are
+passed through); with --no-header the first three columns are month, day, and year. JSONL input is one object per line with
+"month", "day", and "year" keys. Rows with a bad date are still written, with the reason in the error column.
+
+With --workers, an input file is split into byte-range shards on line boundaries and the shards are run in a pool of processes.
+Output still comes out in input order. The shard size follows the file size, so that even a small file gives every worker
+several shards; it is capped at MAX_SHARD_SIZE so memory stays bounded on large files. Sharding needs one record per line, so
+CSV fields must not contain line breaks. Input from stdin is always processed in a single process.
+
+With --format binary the input is a file of packed day ordinals and the packed codes go to the --output file; see
+zodiacbinary.py for the layout.
+
+Usage: python zodiacbatch.py [input file] [--format csv|jsonl] [--no-header] [--workers N] > output
+       python zodiacbatch.py input file --format binary --output output file
+"""
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from zodiacengine import ZODIAC_SIGNS, ANIMALS, SIGN_DESCRIPTIONS, ANIMAL_DESCRIPTIONS
+from zodiacengine import parseDate, westernSignCode, chineseAnimalCode
+from zodiacmessages import cliMessage
+import zodiacbinary
+
+DATE_FIELDS = ("month", "day", "year") # Input columns/keys holding the birth date
+OUTPUT_FIELDS = ("sign", "animal", "signDescription", "animalDescription", "error") # Columns/keys added to every row
+NOT_JSON = "Line is not a valid JSON object!"
+MAX_SHARD_SIZE = 8 * 1024 * 1024 # Most bytes of input per shard when running with workers
+MIN_SHARD_SIZE = 64 * 1024 # Fewest bytes per shard; smaller shards cost more in process hand-offs than they gain
+SHARDS_PER_WORKER = 4 # Shards each worker gets when the file is small enough, so a slow shard does not leave others idle
+
+# Every possible result, built once. Indexed by sign code then animal code, so a row needs no string building.
+_RESULTS = tuple(tuple((ZODIAC_SIGNS[sign], ANIMALS[animal], SIGN_DESCRIPTIONS[sign], ANIMAL_DESCRIPTIONS[animal], "")
+                       for animal in range(len(ANIMALS))) for sign in range(len(ZODIAC_SIGNS)))
+
+"""Returns the output fields (see OUTPUT_FIELDS) for one date. Month, day, and year may be numbers or strings. Never raises on
+bad data; the reason goes in the error field instead."""
+
+def annotateDate(month, day, year):
+    values, error = parseDate(month, day, year)
+    if error:
+        return ("", "", "", "", cliMessage(error))
+    month, day, year = values
+    return _RESULTS[westernSignCode(day, month)][chineseAnimalCode(year, month, day)]
+
+"""Reads a CSV header row and returns the (month, day, year) column indexes. Raises ValueError if a column is missing."""
+
+def dateColumns(header):
+    names = [name.strip().lower() for name in header]
+    try:
+        return tuple(names.index(field) for field in DATE_FIELDS)
+    except ValueError:
+        raise ValueError("CSV header must have month, day, and year columns")
+
+"""Generator that reads CSV rows from lines of text and yields output rows (lists), header first if there is one."""
+
+def annotateCsv(lines, hasHeader = True):
+    reader = csv.reader(lines)
+    columns = (0, 1, 2)
+    width = len(DATE_FIELDS)
+    if hasHeader:
+        header = next(reader, None)
+        if not header: # Empty input
+            return
+        columns = dateColumns(header)
+        width = len(header)
+        yield header + list(OUTPUT_FIELDS)
+    for row in annotateCsvRows(reader, columns, width):
+        yield row
+
+"""Generator that yields output rows for parsed CSV rows with no header. Takes the (month, day, year) column indexes and the
+row width; short rows are padded to the width so the added columns line up."""
+
+def annotateCsvRows(rows, columns, width):
+    monthIndex, dayIndex, yearIndex = columns
+    for row in rows:
+        if not row: # Skip blank lines
+            continue
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+        row.extend(annotateDate(row[monthIndex], row[dayIndex], row[yearIndex]))
+        yield row
+
+"""Generator that reads JSON objects from lines of text and yields output objects (dicts)."""
+
+def annotateJsonl(lines):
+    for line in lines:
+        if not line.strip(): # Skip blank lines
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            yield dict(zip(OUTPUT_FIELDS, ("", "", "", "", NOT_JSON)))
+            continue
+        record.update(zip(OUTPUT_FIELDS, annotateDate(record.get("month"), record.get("day"), record.get("year"))))
+        yield record
+
+"""Writes output rows from annotateCsv to a text stream"""
+
+def writeCsv(rows, out):
+    csv.writer(out, lineterminator = "\n").writerows(rows)
+
+"""Writes output objects from annotateJsonl to a text stream, one per line"""
+
+def writeJsonl(records, out):
+    out.writelines(json.dumps(record) + "\n" for record in records)
+
+"""Streams lines from a text stream to out in the given format ("csv" or "jsonl")"""
+
+def processStream(lines, out, format = "csv", hasHeader = True):
+    if format == "jsonl":
+        writeJsonl(annotateJsonl(lines), out)
+    else:
+        writeCsv(annotateCsv(lines, hasHeader), out)
+
+"""Splits a file into (start, end) byte ranges of about shardSize bytes. Every range starts at the beginning of a line and ends
+just after a line break (or at the end of the file). The first range starts at offset, so a header line can be left out."""
+
+def shardRanges(path, shardSize = MAX_SHARD_SIZE, offset = 0):
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as f:
+        start = offset
+        while start < size:
+            end = start + shardSize
+            if end >= size:
+                end = size
+            else: # Move the boundary forward to the end of the line it falls in
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+"""Returns the shard size for a file of size bytes run with a number of workers: enough shards for SHARDS_PER_WORKER each,
+within MIN_SHARD_SIZE and MAX_SHARD_SIZE"""
+
+def shardSizeFor(size, workers):
+    return max(MIN_SHARD_SIZE, min(MAX_SHARD_SIZE, size // (workers * SHARDS_PER_WORKER)))
+
+"""Runs one shard in a worker process. Takes a (path, start, end, format, columns, width) tuple and returns the encoded output
+for the lines in that byte range."""
+
+def _processShard(task):
+    path, start, end, format, columns, width = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    lines = io.StringIO(data.decode("utf-8-sig" if start == 0 else "utf-8"), newline = "") # Only the file's start can hold a BOM
+    out = io.StringIO()
+    if format == "jsonl":
+        writeJsonl(annotateJsonl(lines), out)
+    else:
+        writeCsv(annotateCsvRows(csv.reader(lines), columns, width), out)
+    return out.getvalue().encode("utf-8")
+
+"""Processes a file with a pool of worker processes and writes the result to a binary stream, in input order. Only a few shards
+per worker are in flight at once, so memory stays bounded however large the file is. shardSize defaults to shardSizeFor the
+file. If progress is given, it is called with the bytes of input done and the file size after each shard is written; an
+exception it raises stops the run. startMethod picks how worker processes are started ("fork", "spawn", or "forkserver"); the
+default is the platform's. Callers with threads running, such as the GUI, should pass "spawn", since a forked child inherits
+locks other threads may be holding."""
+
+def processFile(path, out, format = "csv", hasHeader = True, workers = None, shardSize = None, progress = None,
+                startMethod = None):
+    workers = workers or os.cpu_count() or 1
+    offset = 0
+    columns = (0, 1, 2)
+    width = len(DATE_FIELDS)
+    if format == "csv" and hasHeader:
+        with open(path, "rb") as f:
+            headerLine = f.readline()
+        header = next(csv.reader([headerLine.decode("utf-8-sig")]), None)
+        if not header: # Empty input
+            return
+        columns = dateColumns(header)
+        width = len(header)
+        offset = len(headerLine)
+        headerOut = io.StringIO()
+        writeCsv([header + list(OUTPUT_FIELDS)], headerOut)
+        out.write(headerOut.getvalue().encode("utf-8"))
+    size = os.path.getsize(path)
+    shardSize = shardSize or shardSizeFor(size - offset, workers)
+
+    def writeOldest():
+        future, end = pending.popleft()
+        out.write(future.result())
+        if progress is not None:
+            progress(end, size)
+
+    context = multiprocessing.get_context(startMethod) if startMethod else None
+    with ProcessPoolExecutor(workers, mp_context = context) as pool:
+        pending = deque() # (future, end) of each shard in input order; the oldest is always written first
+        try:
+            for start, end in shardRanges(path, shardSize, offset):
+                pending.append((pool.submit(_processShard, (path, start, end, format, columns, width)), end))
+                if len(pending) >= 2 * workers:
+                    writeOldest()
+            while pending:
+                writeOldest()
+        except BaseException: # Shards not started yet are dropped rather than run for nothing
+            for future, end in pending:
+                future.cancel()
+            raise
+
+"""Guesses the input format from the file name. Defaults to CSV."""
+
+def guessFormat(path):
+    if path.lower().endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    if path.lower().endswith(".bin"):
+        return "binary"
+    return "csv"
+
+"""Builds the command-line argument parser"""
+
+def buildParser():
+    parser = argparse.ArgumentParser(description = "Adds western and Chinese zodiac signs to a CSV or JSONL file of birth dates.")
+    parser.add_argument("input", nargs = "?", default = "-", help = "input file, or - for stdin (the default)")
+    parser.add_argument("--format", choices = ("csv", "jsonl", "binary"), help = "input and output format (guessed from the file name if not given)")
+    parser.add_argument("--output", help = "output file, required for the binary format")
+    parser.add_argument("--no-header", dest = "hasHeader", action = "store_false", help = "CSV input has no header; columns are month, day, year")
+    parser.add_argument("--workers", type = int, default = 1, help = "worker processes for an input file (0 means one per CPU core, default 1)")
+    return parser
+
+def main(argv = None):
+    args = buildParser().parse_args(argv)
+    format = args.format or guessFormat(args.input)
+    if format == "binary":
+        if args.input == "-" or not args.output:
+            print("Error: the binary format needs an input file and --output", file = sys.stderr)
+            return 1
+        try:
+            zodiacbinary.processBinaryFile(args.input, args.output)
+        except (ValueError, OSError) as e: # OSError: the input cannot be opened or read
+            print("Error: " + str(e), file = sys.stderr)
+            return 1
+        return 0
+    if args.workers != 1 and args.input != "-":
+        try:
+            processFile(args.input, sys.stdout.buffer, format, args.hasHeader, args.workers)
+        except (ValueError, OSError) as e: # OSError: the input cannot be opened or read
+            print("Error: " + str(e), file = sys.stderr)
+            return 1
+        finally:
+            sys.stdout.flush()
+        return 0
+    out = io.TextIOWrapper(sys.stdout.buffer, encoding = "utf-8", newline = "", write_through = False) # Large buffered writes
+    try:
+        if args.input == "-":
+            lines = io.TextIOWrapper(sys.stdin.buffer, encoding = "utf-8-sig", newline = "")
+            processStream(lines, out, format, args.hasHeader)
+        else:
+            with open(args.input, encoding = "utf-8-sig", newline = "") as lines: # Skips the BOM spreadsheet programs write
+                processStream(lines, out, format, args.hasHeader)
+    except (ValueError, OSError) as e: # OSError: the input cannot be opened or read
+        out.flush()
+        print("Error: " + str(e), file = sys.stderr)
+        return 1
+    finally:
+        out.flush()
+        out.detach() # Leave sys.stdout usable
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+File: zodiacbinary.py
+Fixed-width binary format for bulk zodiac runs, where parsing text would cost more than the lookups themselves.
+
+Input file:  one record per birth date, a little-endian uint32 day ordinal (date.toordinal(), so 1 is January 1st of year 1).
+Output file: one record per input record, a uint8 sign code followed by a uint8 animal code. Codes are indexes into
+             zodiacengine.ZODIAC_SIGNS and zodiacengine.ANIMALS. A record whose ordinal is not a real date (0 can be used
+             for missing dates) gets INVALID_CODE for both.
+
+Both files are opened through mmap and read or written through memoryview (or numpy arrays over the same buffer), so records
+are never copied into Python objects. With numpy installed, records are processed in vectorized chunks through zodiacarrays;
+without it a slower per-record loop is used.
+"""
+import mmap
+import os
+import sys
+from array import array
+from datetime import date
+from zodiacengine import westernSignCode, lunarYearFromOrdinal
+
+try:
+    import numpy as np
+    import zodiacarrays # Vectorized path; without numpy the per-record loop is used
+except ImportError:
+    np = None
+    zodiacarrays = None
+
+INPUT_RECORD_SIZE = 4 # uint32 day ordinal
+OUTPUT_RECORD_SIZE = 2 # uint8 sign code, uint8 animal code
+INVALID_CODE = 255 # Written for both codes when the ordinal is not a real date
+MAX_ORDINAL = date.max.toordinal()
+CHUNK_RECORDS = 1 << 20 # Records per vectorized chunk, keeps temporary arrays small
+
+"""Writes an iterable of day ordinals to a new input file"""
+
+def writeOrdinalFile(path, ordinals):
+    records = array("I", ordinals)
+    if sys.byteorder != "little":
+        records.byteswap()
+    with open(path, "wb") as f:
+        records.tofile(f)
+
+"""Returns the number of records in an input file. Raises ValueError if the size is not a whole number of records."""
+
+def recordCount(path):
+    size = os.path.getsize(path)
+    if size % INPUT_RECORD_SIZE:
+        raise ValueError("Binary input size must be a multiple of %d bytes" % INPUT_RECORD_SIZE)
+    return size // INPUT_RECORD_SIZE
+
+"""Fills the output buffer from the input buffer with numpy, one chunk at a time. The views over the buffers are always dropped
+before returning, even on an error, so the caller can close the maps (a traceback would otherwise keep them alive)."""
+
+def _processVectorized(inBuffer, outBuffer, count):
+    ordinals = results = chunk = block = None
+    try:
+        ordinals = np.frombuffer(inBuffer, dtype = "<u4", count = count) # Views over the mapped files, no copies
+        results = np.frombuffer(outBuffer, dtype = np.uint8, count = count * OUTPUT_RECORD_SIZE).reshape(count, OUTPUT_RECORD_SIZE)
+        for start in range(0, count, CHUNK_RECORDS):
+            chunk = ordinals[start:start + CHUNK_RECORDS]
+            valid = (chunk >= 1) & (chunk <= MAX_ORDINAL)
+            safe = np.where(valid, chunk, 1) # Keeps bad ordinals away from the date conversion
+            signs, animals = zodiacarrays.calculateFromOrdinals(safe)
+            block = results[start:start + CHUNK_RECORDS]
+            block[:, 0] = np.where(valid, signs, INVALID_CODE)
+            block[:, 1] = np.where(valid, animals, INVALID_CODE)
+    finally:
+        ordinals = results = chunk = block = None
+
+"""Fills the output buffer from the input buffer one record at a time, for when numpy is not installed. Like _processVectorized,
+releases its views over the buffers even on an error."""
+
+def _processLoop(inBuffer, outBuffer, count):
+    with memoryview(outBuffer) as results, memoryview(inBuffer) as inView:
+        if sys.byteorder == "little":
+            with inView[:count * INPUT_RECORD_SIZE] as records, records.cast("I") as ordinals:
+                _fillResults(ordinals, results)
+        else:
+            swapped = array("I", inView[:count * INPUT_RECORD_SIZE].tobytes())
+            swapped.byteswap()
+            _fillResults(swapped, results)
+
+"""Writes the sign and animal codes for a sequence of ordinals into a results view"""
+
+def _fillResults(ordinals, results):
+    position = 0
+    for ordinal in ordinals:
+        if 1 <= ordinal <= MAX_ORDINAL:
+            birthDate = date.fromordinal(ordinal)
+            results[position] = westernSignCode(birthDate.day, birthDate.month)
+            results[position + 1] = lunarYearFromOrdinal(ordinal) % 12
+        else:
+            results[position] = results[position + 1] = INVALID_CODE
+        position += OUTPUT_RECORD_SIZE
+
+"""Reads an input file and writes the matching output file, both through mmap. Returns the number of records."""
+
+def processBinaryFile(inPath, outPath):
+    count = recordCount(inPath)
+    with open(outPath, "w+b") as outFile:
+        outFile.truncate(count * OUTPUT_RECORD_SIZE)
+        if count == 0: # mmap cannot map an empty file
+            return 0
+        with open(inPath, "rb") as inFile:
+            inMap = mmap.mmap(inFile.fileno(), 0, access = mmap.ACCESS_READ)
+            outMap = mmap.mmap(outFile.fileno(), 0, access = mmap.ACCESS_WRITE)
+            try:
+                if np is not None:
+                    _processVectorized(inMap, outMap, count)
+                else:
+                    _processLoop(inMap, outMap, count)
+                outMap.flush()
+            finally:
+                outMap.close()
+                inMap.close()
+    return count
+
+"""Opens an output file and returns (mmap, memoryview). The view holds the sign code of record i at [2 * i] and the animal code
+at [2 * i + 1]. Release the view before closing the map."""
+
+def mapResults(path):
+    with open(path, "rb") as f:
+        results = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+    return results, memoryview(results)
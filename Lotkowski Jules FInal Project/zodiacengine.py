@@ -0,0 +1,191 @@
+"""
+File: zodiacengine.py
+Headless zodiac engine for the zodiac calculator. Holds the pure functions for finding a western zodiac sign, a Chinese zodiac
+animal, and validating a date of birth. Imports nothing from tkinter or breezypythongui, so it can be used as a library by
+scripts and back-end workers that have no display. The GUI in LotkowskiJulesFinalProject.py is a thin client of this module.
+"""
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import date
+from zodiacregistry import SIGN_RECORDS, ANIMAL_RECORDS
+
+# Names and meanings come from the registry (zodiac.json); a sign or animal's code is its index in these tuples
+ZODIAC_SIGNS = tuple(record.name for record in SIGN_RECORDS) # Holds western zodiac signs
+ANIMALS = tuple(record.name for record in ANIMAL_RECORDS) # Holds Chinese zodiac signs, indexed by year % 12
+SIGN_DESCRIPTIONS = tuple(record.description for record in SIGN_RECORDS) # Short meaning of each sign, same order as ZODIAC_SIGNS
+ANIMAL_DESCRIPTIONS = tuple(record.description for record in ANIMAL_RECORDS) # Short meaning of each animal, same order as ANIMALS
+
+DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31) # Longest each month can be, indexed by month number
+
+# Validation error codes. VALID is 0 so a code can be used as a truth value. When a date has several problems, the first one
+# in this order is reported.
+VALID = 0
+BAD_YEAR = 1 # Year is 0 or negative
+BAD_MONTH = 2 # Month is not between 1 and 12
+BAD_DAY = 3 # Day is less than 1 or past the end of the month
+NOT_LEAP_YEAR = 4 # February 29th in a year that is not a leap year
+NOT_A_NUMBER = 5 # Month, day, or year is missing or not a whole number
+ERROR_NAMES = {BAD_YEAR: "BAD_YEAR", BAD_MONTH: "BAD_MONTH", BAD_DAY: "BAD_DAY", NOT_LEAP_YEAR: "NOT_LEAP_YEAR", NOT_A_NUMBER: "NOT_A_NUMBER"}
+ERROR_FIELDS = {BAD_YEAR: "year", BAD_MONTH: "month", BAD_DAY: "day", NOT_LEAP_YEAR: "day", NOT_A_NUMBER: None} # Input field at fault
+
+# Describes why a date was rejected: the error code, the field at fault (or None), and a plain message. Holds no presentation
+# details; zodiacmessages.py renders it for the GUI, the command line, and the service.
+ValidationError = namedtuple("ValidationError", ("code", "field", "message"))
+
+class InvalidDateException(Exception):
+    # Raised when invalid date is given by user. Holds the ValidationError describing what was wrong with the date.
+    def __init__(self, error):
+        Exception.__init__(self, error.message)
+        self.error = error
+
+"""Returns True if year is a leap year in the Gregorian calendar"""
+
+def isLeapYear(year):
+    return (year % 4 == 0) and ((year % 100 != 0) or (year % 400 == 0))
+
+"""Checks the date without raising. Takes day, month, and year as parameters. Returns VALID or one of the error codes."""
+
+def dateErrorCode(day, month, year):
+    if year <= 0:
+        return BAD_YEAR
+    if (month < 1) or (month > 12):
+        return BAD_MONTH
+    if (day < 1) or (day > DAYS_IN_MONTH[month]):
+        return BAD_DAY
+    if (month == 2) and (day == 29) and not isLeapYear(year):
+        return NOT_LEAP_YEAR
+    return VALID
+
+"""Returns the message describing an error code for the given date"""
+
+def errorMessage(code, day, month, year):
+    if code == BAD_YEAR:
+        return "Year value cannot be negative or 0!"
+    if code == BAD_MONTH:
+        return "Month value must be between 1 and 12!"
+    if (code == BAD_DAY) and (day < 1):
+        return "Day value cannot be less than 1!"
+    if (code == BAD_DAY) or (code == NOT_LEAP_YEAR):
+        lastDay = 28 if (month == 2) and not isLeapYear(year) else DAYS_IN_MONTH[month]
+        return "Day value cannot exceed %d for specified month!" % lastDay
+    if code == NOT_A_NUMBER:
+        return "Month, day, and year must be whole numbers!"
+    return ""
+
+NOT_A_NUMBER_ERROR = ValidationError(NOT_A_NUMBER, None, errorMessage(NOT_A_NUMBER, 0, 0, 0)) # Same for every input, so made once
+
+"""Checks the date without raising. Takes day, month, and year as parameters. Returns None for a real date, otherwise a
+ValidationError."""
+
+def checkDate(day, month, year):
+    code = dateErrorCode(day, month, year)
+    if code:
+        return ValidationError(code, ERROR_FIELDS[code], errorMessage(code, day, month, year))
+    return None
+
+"""Converts one raw date value (a number or a string) to an int. Raises ValueError for booleans and for floats that are not
+whole numbers, which int() would quietly turn into 1, 0, or a truncated value."""
+
+def wholeNumber(value):
+    if isinstance(value, bool):
+        raise ValueError("not a number: %r" % value)
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError("not a whole number: %r" % value)
+    return int(value)
+
+"""Parses and checks raw month, day, and year values (numbers or strings) without raising. Returns a ((month, day, year),
+None) pair for a real date, otherwise a (None, ValidationError) pair."""
+
+def parseDate(month, day, year):
+    try:
+        month = wholeNumber(month)
+        day = wholeNumber(day)
+        year = wholeNumber(year)
+    except (TypeError, ValueError, OverflowError): # OverflowError: an infinite float, such as JSON's 1e999
+        return None, NOT_A_NUMBER_ERROR
+    error = checkDate(day, month, year)
+    if error:
+        return None, error
+    return (month, day, year), None
+
+"""Validates the date. Takes day, month, and year as parameters. Raises InvalidDateException if the date does not exist."""
+
+def validateDate(day, month, year):
+    error = checkDate(day, month, year)
+    if error:
+        raise InvalidDateException(error)
+
+"""Packs a month and day into one small integer key. Keys sort in calendar order, so they can be compared or bisected directly."""
+
+def dateKey(month, day):
+    return (month << 5) | day
+
+SIGN_CUSPS = ((1, 20), (2, 19), (3, 21), (4, 20), (5, 21), (6, 21), (7, 23), (8, 23), (9, 23), (10, 23), (11, 22), (12, 22)) # First day of Aquarius through Capricorn
+CUSP_KEYS = tuple(dateKey(month, day) for month, day in SIGN_CUSPS) # Cusps as sorted date keys
+# Sign code for every date key, built once by bisecting the cusp keys. Dates before the first cusp and after the last one are Capricorn (code 0).
+_SIGN_BY_KEY = bytes(bisect_right(CUSP_KEYS, key) % 12 for key in range(dateKey(13, 0)))
+
+"""Determines the western zodiac sign code (an index into ZODIAC_SIGNS). Takes day and month as parameters. Expects a validated date."""
+
+def westernSignCode(day, month):
+    return _SIGN_BY_KEY[(month << 5) | day]
+
+"""Determines the western zodiac sign. Takes day and month as parameters. Returns the sign. Expects a validated date."""
+
+def calculateWesternZodiac(day, month):
+    return ZODIAC_SIGNS[_SIGN_BY_KEY[(month << 5) | day]]
+
+"""Lunar New Year table. The Chinese zodiac year starts on Lunar New Year, not January 1st, so anyone born in January or early
+February before it belongs to the previous year's animal. Dates were checked against the new moon in China time."""
+
+LUNAR_TABLE_FIRST_YEAR = 1900
+LUNAR_TABLE_LAST_YEAR = 2101
+# Day of the year that Lunar New Year falls on, one byte per year from 1900 to 2101
+_LUNAR_NEW_YEAR_DAYS = bytes.fromhex(
+    "1f32271d2f23192c2116291e31251a2d22172a20" # 1900-1919
+    "33271c2f24182c2117291e30251a2d23182a1f32" # 1920-1939
+    "271b2e24192c2116291d30251b2d22182b1f3127" # 1940-1959
+    "1c2e24192c2115281e30251b2e22172a1f31261c" # 1960-1979
+    "2f24192c2133281d30251b2e2317291f32261c2f" # 1980-1999
+    "24182b2016281d31261a2d2217291f32271c2f24" # 2000-2019
+    "192b2016291d30251a2c22172a1f32271c2e2318" # 2020-2039
+    "2b2016291e30251a2d21172a2032271c2e23182b" # 2040-2059
+    "2115281d30241a2d22172a1f32261b2e24182b21" # 2060-2079
+    "16281d30251a2d2218291e31261b2e24192b2015" # 2080-2099
+    "281d") # 2100-2101
+# Lunar New Year as a date key per year, always in January or February. Used for month and day lookups.
+LUNAR_NEW_YEAR_KEYS = bytes(dateKey(1, dayOfYear) if dayOfYear <= 31 else dateKey(2, dayOfYear - 31) for dayOfYear in _LUNAR_NEW_YEAR_DAYS)
+# Lunar New Year as a proleptic Gregorian day ordinal (date.toordinal()) per year, sorted. Used for bisecting day ordinals.
+LUNAR_NEW_YEAR_ORDINALS = array("l", (date(LUNAR_TABLE_FIRST_YEAR + i, 1, 1).toordinal() + dayOfYear - 1 for i, dayOfYear in enumerate(_LUNAR_NEW_YEAR_DAYS)))
+
+"""Returns the year of the Chinese zodiac that a date falls in. Takes year, month, and day as parameters. Outside the table the
+calendar year is returned unchanged."""
+
+def lunarYear(year, month, day):
+    index = year - LUNAR_TABLE_FIRST_YEAR
+    if (0 <= index < len(LUNAR_NEW_YEAR_KEYS)) and (((month << 5) | day) < LUNAR_NEW_YEAR_KEYS[index]): # Born before Lunar New Year
+        return year - 1
+    return year
+
+"""Returns the year of the Chinese zodiac for a day ordinal (date.toordinal()). Gives the same answer as lunarYear."""
+
+def lunarYearFromOrdinal(ordinal):
+    index = bisect_right(LUNAR_NEW_YEAR_ORDINALS, ordinal) # Number of Lunar New Years on or before the date
+    if 0 < index < len(LUNAR_NEW_YEAR_ORDINALS):
+        return LUNAR_TABLE_FIRST_YEAR + index - 1
+    birthDate = date.fromordinal(ordinal) # Before the first or after the last table entry
+    return lunarYear(birthDate.year, birthDate.month, birthDate.day)
+
+"""Determines the Chinese zodiac animal code (an index into ANIMALS). Takes year, and optionally month and day, as parameters.
+Without month and day only the calendar year is used, which is wrong for dates before Lunar New Year."""
+
+def chineseAnimalCode(year, month = None, day = None):
+    if month is not None:
+        year = lunarYear(year, month, day)
+    return year % 12
+
+"""Determines the Chinese zodiac animal. Takes year, and optionally month and day, as parameters. Returns the animal."""
+
+def calculateChineseZodiac(year, month = None, day = None):
+    return ANIMALS[chineseAnimalCode(year, month, day)]
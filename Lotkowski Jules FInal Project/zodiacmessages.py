@@ -0,0 +1,26 @@
+"""
+File: zodiacmessages.py
+Presentation of validation errors. The engine describes a rejected date with a zodiacengine.ValidationError (code, field, and a
+plain message); the functions here turn one into what each front end shows. Only builds strings and dicts, never widgets, so the
+GUI decides for itself how to display the result.
+"""
+from zodiacengine import ERROR_NAMES, NOT_A_NUMBER
+
+GUI_TITLE = "Error!"
+GUI_NOT_A_NUMBER = "Make sure you have filled out all boxes and entered only numbers."
+
+"""Returns the (title, message) the GUI shows in its error dialog"""
+
+def guiMessage(error):
+    message = GUI_NOT_A_NUMBER if error.code == NOT_A_NUMBER else error.message
+    return GUI_TITLE, message + " Please try again."
+
+"""Returns the text the batch command line writes in a row's error column"""
+
+def cliMessage(error):
+    return error.message
+
+"""Returns a JSON-ready dict describing the error, for the service and other machine readers"""
+
+def errorRecord(error):
+    return {"code": ERROR_NAMES[error.code], "field": error.field, "message": error.message}
@@ -0,0 +1,57 @@
+"""
+File: zodiacregistry.py
+Registry of what the calculator knows about each western sign and Chinese animal: its name, image file, image description (alt
+text), and short meaning. Loaded once, at import, from the zodiac.json resource file next to this module. Each zodiac system
+is a tuple of read-only records indexed by the codes zodiacengine computes, so finding everything about a result is one index
+operation. A new zodiac system, or a translated copy of the file, only needs new data, not new code. Does not use tkinter.
+"""
+import json
+import os
+
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "zodiac.json")
+RECORD_FIELDS = ("code", "name", "image", "altText", "description") # Keys of every record in the resource file
+
+class ZodiacRecord(object):
+    """One sign or animal. Read-only after it is made; uses __slots__ so the records stay small."""
+
+    __slots__ = RECORD_FIELDS
+
+    def __init__(self, code, name, image, altText, description):
+        for field, value in zip(RECORD_FIELDS, (code, name, image, altText, description)):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ZodiacRecord is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("ZodiacRecord is read-only")
+
+    def __reduce__(self): # Lets records be pickled for worker processes, since setattr is blocked
+        return ZodiacRecord, tuple(getattr(self, field) for field in RECORD_FIELDS)
+
+    def __repr__(self):
+        return "ZodiacRecord(%r, %r)" % (self.code, self.name)
+
+"""Reads a resource file. Returns a dict of system name to a tuple of ZodiacRecords, indexed by code. Raises ValueError if a
+system's codes are not 0, 1, 2, ... in order or a record is missing a field."""
+
+def loadRegistry(path = RESOURCE_FILE):
+    with open(path, encoding = "utf-8") as f:
+        systems = json.load(f)
+    registry = {}
+    for system, entries in systems.items():
+        records = []
+        for position, entry in enumerate(entries):
+            try:
+                record = ZodiacRecord(*(entry[field] for field in RECORD_FIELDS))
+            except KeyError as e:
+                raise ValueError("%s record %d is missing %s" % (system, position, e))
+            if record.code != position:
+                raise ValueError("%s record %d has code %r; records must be in code order" % (system, position, record.code))
+            records.append(record)
+        registry[system] = tuple(records)
+    return registry
+
+REGISTRY = loadRegistry()
+SIGN_RECORDS = REGISTRY["western"] # Indexed by western sign code
+ANIMAL_RECORDS = REGISTRY["chinese"] # Indexed by Chinese animal code
@@ -0,0 +1,348 @@
+"""
+File: zodiacservice.py
+Local HTTP JSON service for zodiac lookups, so other apps can use the calculator without the Tk window. Uses only the standard
+library: an asyncio protocol with a small HTTP/1.1 parser that supports keep-alive and pipelined requests.
+
+GET  /sign?month=M&day=D&year=Y   Returns one result object.
+POST /batch                       Takes a JSON array of {"month": M, "day": D, "year": Y} objects and streams back a JSON array
+                                  of result objects in the same order, using chunked transfer encoding. HTTP/1.0 clients,
+                                  which do not understand chunks, get the whole array with a Content-Length instead.
+
+A result object has "sign", "animal", "signDescription", and "animalDescription". A date that fails validation gives
+{"error": {"code", "field", "message"}} instead, with status 400 for /sign.
+
+The sign only depends on the month and day, and the animal on the year's place in the 12-year cycle, so there are only 144
+different results. Their JSON text and complete /sign responses (with ETags) are built once at startup. Answering a request
+takes a key computation and one write. Error responses are cached the same way in a bounded LRU cache. /sign honors
+If-None-Match with 304 Not Modified, comparing entity tags weakly (W/ is ignored) as RFC 9110 requires, including lists of tags
+and "*".
+
+Usage: python zodiacservice.py [--host HOST] [--port PORT]
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+from functools import lru_cache
+from urllib.parse import parse_qs
+from zodiacengine import ZODIAC_SIGNS, ANIMALS, SIGN_DESCRIPTIONS, ANIMAL_DESCRIPTIONS
+from zodiacengine import parseDate, westernSignCode, chineseAnimalCode
+from zodiacmessages import errorRecord
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+MAX_HEADER_SIZE = 16 * 1024 # Bytes allowed before the blank line ending the headers
+MAX_BODY_SIZE = 64 * 1024 * 1024 # Bytes allowed in a /batch request body
+BATCH_CHUNK = 1000 # Results per chunk when streaming a /batch response
+ERROR_CACHE_SIZE = 1024 # Distinct error responses kept; errors only vary by code and month length, so this is never reached
+
+ENTITY_TAG = re.compile(r'(?:W/)?("[^"]*")') # One entity tag; group 1 is the quoted opaque tag without any weak prefix
+
+STATUS_TEXT = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 411: "Length Required",
+               413: "Payload Too Large", 431: "Request Header Fields Too Large", 501: "Not Implemented"}
+
+"""Returns the JSON-ready result for a sign code and animal code"""
+
+def resultRecord(sign, animal):
+    return {"sign": ZODIAC_SIGNS[sign], "animal": ANIMALS[animal],
+            "signDescription": SIGN_DESCRIPTIONS[sign], "animalDescription": ANIMAL_DESCRIPTIONS[animal]}
+
+# JSON text of every result, indexed by sign code * 12 + animal code
+RESULT_TEXTS = tuple(json.dumps(resultRecord(sign, animal)) for sign in range(len(ZODIAC_SIGNS)) for animal in range(len(ANIMALS)))
+
+"""Returns a complete HTTP response with a body, as bytes"""
+
+def buildResponse(status, body, keepAlive, etag = None):
+    head = "HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\nConnection: %s\r\n" % (
+        status, STATUS_TEXT[status], len(body), "keep-alive" if keepAlive else "close")
+    if etag:
+        head += "ETag: %s\r\n" % etag
+    return head.encode("latin-1") + b"\r\n" + body
+
+class CachedResponse(object):
+    """Every ready-to-write form of one response. full and notModified are (close, keep-alive) pairs, so they can be indexed
+    by the keep-alive flag. notModified is None unless the status is 200, since conditional headers only apply to successful
+    responses (RFC 9110 section 13.2.1)."""
+
+    __slots__ = ("status", "etag", "full", "notModified")
+
+    def __init__(self, status, body):
+        self.status = status
+        self.etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+        self.full = (buildResponse(status, body, False, self.etag), buildResponse(status, body, True, self.etag))
+        self.notModified = None
+        if status == 200:
+            self.notModified = (buildResponse(304, b"", False, self.etag), buildResponse(304, b"", True, self.etag))
+
+SIGN_RESPONSES = tuple(CachedResponse(200, text.encode("utf-8")) for text in RESULT_TEXTS) # Same order as RESULT_TEXTS
+
+"""Returns the JSON text for a validation error. ValidationErrors are hashable, so repeats come from the cache."""
+
+@lru_cache(maxsize = ERROR_CACHE_SIZE)
+def errorText(error):
+    return json.dumps({"error": errorRecord(error)})
+
+"""Returns the cached /sign response for a validation error"""
+
+@lru_cache(maxsize = ERROR_CACHE_SIZE)
+def errorResponse(error):
+    return CachedResponse(400, errorText(error).encode("utf-8"))
+
+"""Returns (result index, None) for a real date or (None, ValidationError). Takes raw month, day, and year values. The index
+is a position in RESULT_TEXTS and SIGN_RESPONSES."""
+
+def resultIndex(month, day, year):
+    values, error = parseDate(month, day, year)
+    if error:
+        return None, error
+    month, day, year = values
+    return westernSignCode(day, month) * len(ANIMALS) + chineseAnimalCode(year, month, day), None
+
+"""Returns the month, day, and year values from a query string"""
+
+def queryDate(query):
+    if ("%" in query) or ("+" in query): # Encoded values go through the full parser
+        fields = parse_qs(query)
+        return tuple(fields.get(name, (None,))[0] for name in ("month", "day", "year"))
+    fields = dict(part.partition("=")[::2] for part in query.split("&"))
+    return fields.get("month"), fields.get("day"), fields.get("year")
+
+"""Returns True if an If-None-Match header value matches an entity tag: it is "*", or one of the tags in its list has the same
+opaque tag (the weak comparison)"""
+
+def etagMatches(ifNoneMatch, etag):
+    if ifNoneMatch.strip() == "*":
+        return True
+    return etag in ENTITY_TAG.findall(ifNoneMatch)
+
+"""Returns the cached response to GET /sign for a query string"""
+
+def signResponse(query):
+    index, error = resultIndex(*queryDate(query))
+    if error:
+        return errorResponse(error)
+    return SIGN_RESPONSES[index]
+
+"""Returns the JSON text of one /batch result. Takes one item of the request array."""
+
+def batchResultText(item):
+    if isinstance(item, dict):
+        index, error = resultIndex(item.get("month"), item.get("day"), item.get("year"))
+    else:
+        index, error = resultIndex(None, None, None)
+    if error:
+        return errorText(error)
+    return RESULT_TEXTS[index]
+
+"""Returns the JSON text of an error with only a message"""
+
+def messageText(message):
+    return json.dumps({"error": {"code": None, "field": None, "message": message}})
+
+"""Returns a JSON error body with a message"""
+
+def messageBody(message):
+    return messageText(message).encode("utf-8")
+
+ITEM_FAILED_TEXT = messageText("This item could not be processed.") # /batch result for an item that raised unexpectedly
+
+class ZodiacHttpProtocol(asyncio.Protocol):
+    """Handles one client connection. Requests are answered in the order they arrive; while a /batch response is streaming,
+    later requests wait in the buffer."""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.buffer = bytearray()
+        self.busy = False # True while a /batch response is being streamed
+        self.closing = False
+        self.writable = asyncio.Event() # Cleared while the transport's write buffer is full
+        self.writable.set()
+
+    def connection_lost(self, exc):
+        self.closing = True
+        self.writable.set() # Wakes a streaming batch so it can stop
+
+    def pause_writing(self):
+        self.writable.clear()
+
+    def resume_writing(self):
+        self.writable.set()
+
+    def data_received(self, data):
+        self.buffer += data
+        if not self.busy:
+            self.processBuffer()
+
+    """Answers every complete request in the buffer"""
+
+    def processBuffer(self):
+        while not self.busy and not self.closing:
+            headerEnd = self.buffer.find(b"\r\n\r\n")
+            if headerEnd < 0:
+                if len(self.buffer) > MAX_HEADER_SIZE:
+                    self.respond(431, messageBody("Request headers are too large."), False)
+                return
+            lines = self.buffer[:headerEnd].decode("latin-1").split("\r\n")
+            requestLine = lines[0].split(" ")
+            if len(requestLine) != 3:
+                self.respond(400, messageBody("Malformed request line."), False)
+                return
+            method, target, version = requestLine
+            contentLength = None
+            lengthCount = 0
+            transferEncoding = False
+            connection = set() # Lower-case tokens of every Connection header
+            ifNoneMatch = None
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                name = name.strip().lower()
+                if name == "content-length":
+                    contentLength = value.strip()
+                    lengthCount += 1
+                elif name == "transfer-encoding":
+                    transferEncoding = True
+                elif name == "connection":
+                    connection.update(token.strip() for token in value.lower().split(","))
+                elif name == "if-none-match": # Repeated headers form one list
+                    ifNoneMatch = value.strip() if ifNoneMatch is None else ifNoneMatch + ", " + value.strip()
+            if transferEncoding:
+                # Bodies are only read by Content-Length; reading a chunked body as the next request would desynchronize
+                # the connection
+                self.respond(501, messageBody("Transfer-Encoding is not supported; send a Content-Length."), False)
+                return
+            keepAlive = ("close" not in connection) if version == "HTTP/1.1" else ("keep-alive" in connection)
+            if (lengthCount > 1) or ((contentLength is not None) and not (contentLength.isascii() and contentLength.isdigit())):
+                # Only one plain run of digits; a sign, a second value, or anything else could desynchronize the stream
+                self.respond(400, messageBody("Bad Content-Length."), False)
+                return
+            length = int(contentLength or 0)
+            if length > MAX_BODY_SIZE:
+                self.respond(413, messageBody("Request body is too large."), False)
+                return
+            requestEnd = headerEnd + 4 + length
+            if len(self.buffer) < requestEnd: # Wait for the rest of the body
+                return
+            body = bytes(self.buffer[headerEnd + 4:requestEnd])
+            del self.buffer[:requestEnd]
+            self.handle(method, target, version, contentLength is not None, body, keepAlive, ifNoneMatch)
+
+    """Routes one request"""
+
+    def handle(self, method, target, version, hasLength, body, keepAlive, ifNoneMatch):
+        path, _, query = target.partition("?")
+        if path == "/sign":
+            if method != "GET":
+                self.respond(405, messageBody("Use GET for /sign."), keepAlive)
+                return
+            cached = signResponse(query)
+            if (ifNoneMatch is not None) and (cached.notModified is not None) and etagMatches(ifNoneMatch, cached.etag):
+                self.transport.write(cached.notModified[keepAlive])
+            else:
+                self.transport.write(cached.full[keepAlive])
+            if not keepAlive:
+                self.closing = True
+                self.transport.close()
+        elif path == "/batch":
+            if method != "POST":
+                self.respond(405, messageBody("Use POST for /batch."), keepAlive)
+                return
+            if not hasLength:
+                self.respond(411, messageBody("POST /batch needs a Content-Length."), False)
+                return
+            try:
+                items = json.loads(body)
+            except ValueError:
+                items = None
+            if not isinstance(items, list):
+                self.respond(400, messageBody("Body must be a JSON array of dates."), keepAlive)
+                return
+            self.busy = True
+            asyncio.ensure_future(self.streamBatch(items, keepAlive, version == "HTTP/1.1"))
+        else:
+            self.respond(404, messageBody("Unknown path."), keepAlive)
+
+    """Writes a complete response with a body"""
+
+    def respond(self, status, body, keepAlive):
+        self.transport.write(buildResponse(status, body, keepAlive))
+        if not keepAlive:
+            self.closing = True
+            self.transport.close()
+
+    """Streams the results for a /batch request as a chunked JSON array, waiting whenever the client falls behind. If chunked
+    is False (an HTTP/1.0 client), the array is still built a chunk at a time but sent as one response with a Content-Length.
+    If anything goes wrong past the point where the response has started, the connection is closed so the client sees an
+    incomplete response rather than waiting for one."""
+
+    async def streamBatch(self, items, keepAlive, chunked = True):
+        try:
+            await self.writeBatch(items, keepAlive, chunked)
+        except Exception:
+            self.closing = True
+            self.transport.close()
+            raise
+
+    async def writeBatch(self, items, keepAlive, chunked):
+        write = self.transport.write
+        if chunked:
+            write(("HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nTransfer-Encoding: chunked\r\nConnection: %s\r\n\r\n" % (
+                "keep-alive" if keepAlive else "close")).encode("latin-1"))
+        else:
+            chunks = []
+        separator = "["
+        for start in range(0, len(items), BATCH_CHUNK):
+            parts = []
+            for item in items[start:start + BATCH_CHUNK]:
+                parts.append(separator)
+                try:
+                    parts.append(batchResultText(item))
+                except Exception: # One bad item must not cut off the rest of the response
+                    parts.append(ITEM_FAILED_TEXT)
+                separator = ","
+            chunk = "".join(parts).encode("utf-8")
+            if chunked:
+                write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            else:
+                chunks.append(chunk)
+            await asyncio.sleep(0) # Lets other connections run between chunks
+            await self.writable.wait()
+            if self.closing:
+                return
+        closing = "]" if items else "[]"
+        if chunked:
+            write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(closing), closing.encode("latin-1")))
+        else:
+            chunks.append(closing.encode("latin-1"))
+            write(buildResponse(200, b"".join(chunks), keepAlive))
+        self.busy = False
+        if not keepAlive:
+            self.closing = True
+            self.transport.close()
+        elif self.buffer:
+            self.processBuffer()
+
+"""Starts the service and returns the asyncio server"""
+
+async def startServer(host = DEFAULT_HOST, port = DEFAULT_PORT):
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(ZodiacHttpProtocol, host, port, reuse_address = True)
+
+async def serveForever(host, port):
+    server = await startServer(host, port)
+    async with server:
+        await server.serve_forever()
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Serves zodiac sign lookups over HTTP.")
+    parser.add_argument("--host", default = DEFAULT_HOST, help = "address to listen on (default %s)" % DEFAULT_HOST)
+    parser.add_argument("--port", type = int, default = DEFAULT_PORT, help = "port to listen on (default %d)" % DEFAULT_PORT)
+    args = parser.parse_args(argv)
+    print("Serving zodiac lookups on http://%s:%d" % (args.host, args.port))
+    try:
+        asyncio.run(serveForever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
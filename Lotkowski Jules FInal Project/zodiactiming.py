@@ -0,0 +1,154 @@
+"""
+File: zodiactiming.py
+Optional timing for the stages of a pipeline, such as the GUI's Calculate click (parse, validate, calculate, show results).
+Records the wall time and outcome of every stage, and keeps rolling percentiles over the most recent successful runs so the
+numbers reflect how the app behaves now, not since it started. Failed runs are counted but not timed, since they can include
+time the user spends reading an error dialog. Results can be read at any time through snapshot() or dump(), or
+streamed to a hook as each stage finishes. Does not use tkinter.
+
+Outcomes: "ok" when a stage finishes, "rejected" when it raises one of the exceptions it expects (bad user input), and "error"
+when it raises anything else. Exceptions are always re-raised; the timer only watches.
+"""
+import sys
+import time
+from collections import deque, namedtuple
+
+WINDOW = 1000 # Most recent successful runs of each stage that percentiles are taken over
+PERCENTILES = (50, 90, 99)
+OUTCOMES = ("ok", "rejected", "error")
+
+# One finished stage: its name, wall time in seconds, outcome, and the exception (or None)
+StageRecord = namedtuple("StageRecord", ("stage", "seconds", "outcome", "error"))
+
+"""Returns the pth percentile (nearest rank) of a sorted, non-empty sequence"""
+
+def percentile(ordered, p):
+    rank = max(1, -(-p * len(ordered) // 100)) # Ceiling of p% of the count
+    return ordered[rank - 1]
+
+class StageStats(object):
+    """Running numbers for one stage: outcome counts over its whole life, times of the last WINDOW successful runs, and the
+    last error it raised."""
+
+    def __init__(self, window):
+        self.times = deque(maxlen = window)
+        self.counts = dict.fromkeys(OUTCOMES, 0)
+        self.lastError = None
+
+    def add(self, record):
+        self.counts[record.outcome] += 1
+        if record.outcome == "ok":
+            self.times.append(record.seconds)
+        elif record.outcome == "error":
+            self.lastError = record.error
+
+    """Returns a dict of counts, the percentiles in milliseconds, and the last error as text"""
+
+    def summary(self, percentiles = PERCENTILES):
+        result = dict(self.counts)
+        ordered = sorted(self.times)
+        for p in percentiles:
+            result["p%d_ms" % p] = round(percentile(ordered, p) * 1000, 3) if ordered else None
+        result["lastError"] = repr(self.lastError) if self.lastError is not None else None
+        return result
+
+class _Stage(object):
+    """Context manager that times one run of a stage and reports it to the timer"""
+
+    __slots__ = ("timer", "name", "expected", "start")
+
+    def __init__(self, timer, name, expected):
+        self.timer = timer
+        self.name = name
+        self.expected = expected
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, excType, exc, traceback):
+        seconds = time.perf_counter() - self.start
+        if excType is None:
+            outcome = "ok"
+        elif issubclass(excType, self.expected):
+            outcome = "rejected"
+        else:
+            outcome = "error"
+        self.timer.record(StageRecord(self.name, seconds, outcome, exc))
+        return False # Never swallows the exception
+
+class PipelineTimer(object):
+    """Times named stages. Wrap each stage in "with timer.stage(name, expected):". If hook is given, it is called with a
+    StageRecord after every stage finishes."""
+
+    def __init__(self, hook = None, window = WINDOW):
+        self.hook = hook
+        self.window = window
+        self.stages = {} # Stage name to StageStats, in the order stages first ran
+
+    """Returns a context manager timing one run of a stage. expected is an exception class or tuple of them that count as
+    "rejected" rather than "error"."""
+
+    def stage(self, name, expected = ()):
+        return _Stage(self, name, expected)
+
+    """Adds a finished stage to the stats and passes it to the hook"""
+
+    def record(self, record):
+        stats = self.stages.get(record.stage)
+        if stats is None:
+            stats = self.stages[record.stage] = StageStats(self.window)
+        stats.add(record)
+        if self.hook is not None:
+            self.hook(record)
+
+    """Returns a dict of stage name to its summary (see StageStats.summary), ready for JSON"""
+
+    def snapshot(self):
+        return dict((name, stats.summary()) for name, stats in self.stages.items())
+
+    """Writes a table of every stage's counts and percentiles to a text stream (stderr by default)"""
+
+    def dump(self, out = None):
+        out = out or sys.stderr
+        out.write("%-10s %7s %8s %6s %9s %9s %9s\n" % (("stage",) + OUTCOMES + tuple("p%d ms" % p for p in PERCENTILES)))
+        for name, summary in self.snapshot().items():
+            times = tuple("%9.3f" % summary["p%d_ms" % p] if summary["p%d_ms" % p] is not None else "%9s" % "-"
+                          for p in PERCENTILES)
+            out.write("%-10s %7d %8d %6d %s\n" % ((name,) + tuple(summary[o] for o in OUTCOMES) + (" ".join(times),)))
+            if summary["lastError"]:
+                out.write("           last error: %s\n" % summary["lastError"])
+        out.flush()
+
+    def reset(self):
+        self.stages.clear()
+
+class _NullStage(object):
+    """Context manager that does nothing, for when timing is off"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, traceback):
+        return False
+
+class NullTimer(object):
+    """Stands in for a PipelineTimer when timing is off, so timed code needs no checks and costs next to nothing"""
+
+    _stage = _NullStage()
+
+    def stage(self, name, expected = ()):
+        return self._stage
+
+    def snapshot(self):
+        return {}
+
+    def dump(self, out = None):
+        pass
+
+    def reset(self):
+        pass
+
+NULL_TIMER = NullTimer()